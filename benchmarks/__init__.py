@@ -0,0 +1 @@
+"""Benchmarks of the pyrh hot paths, see `benchmarks.run`."""
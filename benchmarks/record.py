@@ -0,0 +1,71 @@
+"""Record the fixtures of the benchmarks from the mock Robinhood API.
+
+The mock server generates the same instruments and quotes for the same seed, and the
+urls it serves from are rewritten to the real API base so the cassette looks like a
+recording of the real API. Only run this to change the fixtures, the benchmarks
+themselves never use the network.
+
+Usage::
+
+    python -m benchmarks.record
+    python -m benchmarks.record --instruments 2000 --quotes 200
+
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import List, Optional
+
+from pyrh import Robinhood, urls
+from pyrh.cassette import record
+from pyrh.mock_server import MockRobinhoodServer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+"""The directory of the recorded fixtures."""
+
+SESSION = FIXTURES / "session.json.gz"
+"""The cassette replayed by the benchmarks."""
+
+INSTRUMENTS = 1000
+"""The number of instruments listed, in pages of 100."""
+
+QUOTES = 100
+"""The number of symbols quoted in one request."""
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Record the benchmark cassette from the command line.
+
+    Args:
+        argv: The command line arguments, `sys.argv` by default.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instruments", type=int, default=INSTRUMENTS)
+    parser.add_argument("--quotes", type=int, default=QUOTES)
+    parser.add_argument("--output", type=Path, default=SESSION)
+    args = parser.parse_args(argv)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with MockRobinhoodServer(instruments=args.instruments, seed=0) as server:
+        rh = Robinhood(
+            username="user@example.com", password="password", api_base=server.url
+        )
+        with record(rh, args.output) as cassette:
+            rh.login()
+            symbols = [instrument.symbol for instrument in rh.instruments()]
+            rh.quotes(symbols[: args.quotes])
+
+        # point the recorded links at the real api instead of the local server
+        text = json.dumps(cassette.interactions).replace(
+            server.url, f"{urls.API_BASE}/"
+        )
+        cassette.interactions = json.loads(text)
+        cassette.save(args.output)
+
+    print(f"Recorded {len(cassette)} interactions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
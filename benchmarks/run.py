@@ -0,0 +1,265 @@
+"""Time the pyrh hot paths and compare them to a saved baseline.
+
+Every benchmark replays the fixtures recorded by `benchmarks.record`, so the suite
+never uses the network. Each one is timed with `timeit`: the number of calls per
+run is calibrated to take at least 0.2 seconds and the run is repeated. The median
+and best times per call are shown.
+
+Each timed run is paired with a run of a fixed pure Python calibration loop, and
+only the median ratio of the two is saved and compared. A faster, slower or busier
+machine speeds up or slows down the calibration loop as much as the benchmarks, so a
+baseline saved on one machine can be checked on another.
+
+Usage::
+
+    python -m benchmarks.run                 # compare to benchmarks/baseline.json
+    python -m benchmarks.run --save          # replace the baseline
+    python -m benchmarks.run -k instrument   # only the matching benchmarks
+
+The command exits with status 1 when a benchmark is slower than its baseline by
+more than the threshold. A Python upgrade changes the speed of the benchmarks and of
+the calibration loop differently, so save a new baseline before changing the code
+when the Python version differs from the saved one.
+
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from pyrh import Robinhood
+from pyrh.cache import dump_session, load_session
+from pyrh.cassette import Cassette, replay
+from pyrh.models import InstrumentSchema, QuotePaginatorSchema
+from pyrh.models.base import BaseModel
+
+from .record import SESSION
+
+BASELINE = Path(__file__).parent / "baseline.json"
+"""The default baseline file."""
+
+REPEAT = 7
+"""The number of timed runs of each benchmark."""
+
+THRESHOLD = 0.25
+"""The fraction a benchmark can be slower than its baseline before it fails."""
+
+CALIBRATION_ROWS = 1000
+"""The number of rows converted by the calibration loop."""
+
+
+class Result(NamedTuple):
+    """The timing of one benchmark.
+
+    The median and best times are in seconds per call, `relative` is the median ratio
+    of the time to the calibration loop.
+
+    """
+
+    name: str
+    median: float
+    best: float
+    relative: float
+
+
+def _calibration() -> Callable[[], object]:
+    rows = [
+        {"symbol": f"S{i:04d}", "price": f"{i * 1.5:.4f}", "volume": str(i)}
+        for i in range(CALIBRATION_ROWS)
+    ]
+
+    def calibration() -> object:
+        return sorted(
+            ({key: value.lower() for key, value in row.items()} for row in rows),
+            key=lambda row: float(row["price"]) * int(row["volume"]),
+        )
+
+    return calibration
+
+
+def _time(
+    benchmark: Callable[[], object], calibration: Callable[[], object], repeat: int
+) -> Result:
+    gc.collect()
+    timers = [timeit.Timer(benchmark), timeit.Timer(calibration)]
+    numbers = [timer.autorange()[0] for timer in timers]
+    times, ratios = [], []
+    for _ in range(repeat):
+        took, reference = (
+            timer.timeit(number) / number for timer, number in zip(timers, numbers)
+        )
+        times.append(took)
+        ratios.append(took / reference)
+    return Result(
+        benchmark.__name__,
+        statistics.median(times),
+        min(times),
+        statistics.median(ratios),
+    )
+
+
+def _responses(cassette: Cassette, path: str) -> List[Dict]:
+    return [
+        json.loads(interaction["response"])
+        for interaction in cassette.interactions
+        if path in interaction["url"]
+    ]
+
+
+def _benchmarks(cassette: Cassette, tmp: Path) -> Iterator[Callable[[], object]]:
+    instruments = [
+        result
+        for page in _responses(cassette, "/instruments/")
+        for result in page["results"]
+    ]
+    quotes = _responses(cassette, "/quotes/")[0]
+    instrument_schema = InstrumentSchema(many=True)
+    quote_schema = QuotePaginatorSchema()
+
+    def base_model() -> object:
+        return [BaseModel(**instrument) for instrument in instruments]
+
+    def instrument_schema_load() -> object:
+        return instrument_schema.load(instruments)
+
+    def quote_parsing() -> object:
+        return quote_schema.load(quotes)
+
+    rh = Robinhood(username="user@example.com", password="password")
+    with replay(rh, cassette):
+        rh.login()
+
+        def base_paginator() -> object:
+            return list(rh.instruments())
+
+        session = tmp / "session.json"
+
+        def session_round_trip() -> object:
+            dump_session(rh, session)
+            return load_session(session)
+
+        yield from (
+            base_model,
+            instrument_schema_load,
+            base_paginator,
+            quote_parsing,
+            session_round_trip,
+        )
+
+
+def run(pattern: str = "", repeat: int = REPEAT) -> List[Result]:
+    """Run the benchmarks.
+
+    Args:
+        pattern: Only run the benchmarks whose name contains this string.
+        repeat: The number of timed runs of each benchmark.
+
+    Returns:
+        The timing of each benchmark.
+
+    """
+    cassette = Cassette.load(SESSION)
+    calibration = _calibration()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for benchmark in _benchmarks(cassette, Path(tmp)):
+            if pattern in benchmark.__name__:
+                results.append(_time(benchmark, calibration, repeat))
+    return results
+
+
+def _environment() -> Dict[str, str]:
+    return {"python": platform.python_version(), "machine": platform.machine()}
+
+
+def save(results: List[Result], path: Path = BASELINE) -> None:
+    """Save results as the baseline.
+
+    Args:
+        results: The results to save.
+        path: The baseline file.
+
+    """
+    payload = {
+        **_environment(),
+        "results": {result.name: result.relative for result in results},
+    }
+    with open(path, "w") as file:
+        json.dump(payload, file, indent=4)
+        file.write("\n")
+
+
+def compare(
+    results: List[Result], path: Path = BASELINE, threshold: float = THRESHOLD
+) -> List[str]:
+    """Print the results next to their baseline.
+
+    Args:
+        results: The results to compare.
+        path: The baseline file.
+        threshold: The fraction a benchmark can be slower than its baseline,
+            relative to the calibration loop.
+
+    Returns:
+        The names of the benchmarks slower than their baseline by more than the
+        threshold.
+
+    """
+    try:
+        with open(path) as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        baseline = {**_environment(), "results": {}}
+    if baseline.get("python") != _environment()["python"]:
+        print(f"warning: the baseline was saved with another Python version, {path}")
+
+    regressions = []
+    header = ("median", "best", "relative", "baseline", "change")
+    print(f"{'benchmark':<24}" + "".join(f"{column:>12}" for column in header))
+    for result in results:
+        line = f"{result.name:<24}{result.median * 1e3:>10.3f}ms{result.best * 1e3:>10.3f}ms"
+        line += f"{result.relative:>12.2f}"
+        before = baseline["results"].get(result.name)
+        if before:
+            change = result.relative / before - 1
+            line += f"{before:>12.2f}{change:>+12.1%}"
+            if change > threshold:
+                regressions.append(result.name)
+                line += "  slower"
+        print(line)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv: The command line arguments, `sys.argv` by default.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--save", action="store_true", help="replace the baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat)
+    regressions = compare(results, args.baseline, args.threshold)
+    if args.save:
+        save(results, args.baseline)
+        print(f"Saved the baseline to {args.baseline}")
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+Add ``pyrh.cassette`` to record the HTTP traffic of a session to a file with the credentials scrubbed, and to replay it without network access, either as fast as possible or with the recorded timing.
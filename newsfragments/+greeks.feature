@@ -0,0 +1 @@
+Add `pyrh.greeks` to compute the implied volatility and greeks of whole options chains with NumPy, install it with the `greeks` extra.
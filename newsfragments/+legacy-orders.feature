@@ -0,0 +1 @@
+The legacy ``submit_buy_order``, ``submit_sell_order`` and ``place_*_order`` methods no longer require ``instrument_URL``, it is looked up from the symbol and cached for the session. They only fetch a quote when no price is given and no longer fetch the account on every order.
@@ -0,0 +1 @@
+Add ``pyrh.mock_server``, a local stand-in for the Robinhood API that serves generated data with optional latency, errors and rate limiting, for load and latency testing. Run it with ``python -m pyrh.mock_server``.
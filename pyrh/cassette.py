@@ -0,0 +1,347 @@
+"""Record and replay the HTTP traffic of a session.
+
+A cassette is a list of request and response pairs saved as compact JSON, gzipped
+when the file name ends with `.gz`. Recording scrubs credentials so cassettes can be
+shared, and replaying serves the responses without any network access, either as
+fast as possible or with their recorded timing.
+
+Examples:
+    >>> with record(rh, "session.json.gz"):  # xdoctest: +SKIP
+    ...     rh.quotes(["AAPL", "TSLA"])
+    >>> with replay(rh, "session.json.gz"):  # xdoctest: +SKIP
+    ...     rh.quotes(["AAPL", "TSLA"])  # served from the cassette
+
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple, Union, cast
+from urllib.parse import parse_qsl, urlencode
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pyrh.exceptions import UnrecordedRequest
+from pyrh.models.base import JSON
+from pyrh.models.sessionmanager import Cert, Timeout
+
+SCRUBBED = "***"
+"""The value that replaces scrubbed credentials."""
+
+SCRUBBED_FIELDS = frozenset(
+    ("password", "mfa_code", "access_token", "refresh_token", "device_token")
+)
+"""The request and response body fields that are never recorded."""
+
+RESPONSE_HEADERS = ("Content-Type",)
+"""The response headers that are recorded."""
+
+PREFIXES = ("https://", "http://")
+"""The url prefixes the cassette adapters are mounted on."""
+
+Key = Tuple[str, str]
+
+
+def _scrub_body(body: Optional[str]) -> Optional[str]:
+    if not body:
+        return body
+    if body.startswith(("{", "[")):
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return body
+        if isinstance(data, dict):
+            for field in SCRUBBED_FIELDS & data.keys():
+                data[field] = SCRUBBED
+        return json.dumps(data, separators=(",", ":"))
+    pairs = parse_qsl(body, keep_blank_values=True)
+    if not any(name in SCRUBBED_FIELDS for name, _ in pairs):
+        return body
+    return urlencode(
+        [(name, SCRUBBED if name in SCRUBBED_FIELDS else v) for name, v in pairs]
+    )
+
+
+def _text(body: Any) -> Optional[str]:
+    if isinstance(body, bytes):
+        return body.decode()
+    # streamed bodies such as file uploads are not recorded
+    return body if isinstance(body, str) else None
+
+
+def _open(path: Union[Path, str], mode: str) -> IO[str]:
+    if str(path).endswith(".gz"):
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """The recorded interactions of a session.
+
+    Args:
+        interactions: Recorded request and response pairs.
+
+    """
+
+    def __init__(self, interactions: Optional[List[JSON]] = None) -> None:
+        self.interactions: List[JSON] = [] if interactions is None else interactions
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of recorded interactions.
+
+        Returns:
+            The number of interactions.
+
+        """
+        return len(self.interactions)
+
+    def append(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        url: Optional[str] = None,
+    ) -> None:
+        """Record an interaction, without its credentials.
+
+        The `Authorization` header is never recorded since request headers are
+        left out entirely.
+
+        Args:
+            request: The request that was sent.
+            response: The response that was received.
+            url: The url the request was made for, `request.url` by default.
+
+        """
+        interaction = {
+            "method": request.method,
+            "url": request.url if url is None else url,
+            "body": _scrub_body(_text(request.body)),
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in RESPONSE_HEADERS
+                if name in response.headers
+            },
+            "response": _scrub_body(response.text),
+            "elapsed": round(response.elapsed.total_seconds(), 6),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Save the cassette as compact JSON.
+
+        Args:
+            path: The file to save to, gzipped if it ends with `.gz`.
+
+        """
+        with _open(path, "w") as file:
+            json.dump(self.interactions, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> "Cassette":
+        """Load a cassette saved with `save`.
+
+        Args:
+            path: The file to load, gzipped if it ends with `.gz`.
+
+        Returns:
+            The loaded cassette.
+
+        """
+        with _open(path, "r") as file:
+            return cls(json.load(file))
+
+
+class RecordingAdapter(BaseAdapter):
+    """A transport adapter that records the requests sent by another adapter.
+
+    Args:
+        cassette: The cassette to record to.
+        adapter: The adapter that sends the requests, a new `HTTPAdapter` by default.
+
+    """
+
+    def __init__(self, cassette: Cassette, adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = HTTPAdapter() if adapter is None else adapter
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: Union[bool, str] = True,
+        cert: Cert = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Send a request and record it.
+
+        Args:
+            request: The request to send.
+            stream: Whether to stream the response content.
+            timeout: The connect and read timeouts.
+            verify: Whether to verify the TLS certificate, or a CA bundle path.
+            cert: The client certificate.
+            proxies: The proxies of each scheme.
+
+        Returns:
+            The response.
+
+        """
+        # the wrapped adapter may rewrite the url, see `ApiBaseAdapter`
+        url = cast(str, request.url)
+        start = time.monotonic()
+        response = self.adapter.send(request, stream, timeout, verify, cert, proxies)
+        # the session only sets `response.elapsed` after the adapter returns
+        response.elapsed = timedelta(seconds=time.monotonic() - start)
+        self.cassette.append(request, response, url)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """A transport adapter that answers requests from a cassette.
+
+    Requests are matched on their method and url. Repeated requests get the
+    recorded responses in their recorded order, and the last one once they run
+    out.
+
+    Args:
+        cassette: The cassette to replay.
+        realtime: Whether to wait for the recorded duration of each response
+            instead of answering right away.
+
+    """
+
+    def __init__(self, cassette: Cassette, realtime: bool = False) -> None:
+        super().__init__()
+        self.realtime = realtime
+        self._responses: Dict[Key, Deque[JSON]] = defaultdict(deque)
+        for interaction in cassette.interactions:
+            key = (interaction["method"], interaction["url"])
+            self._responses[key].append(interaction)
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: Union[bool, str] = True,
+        cert: Cert = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Answer a request with its recorded response.
+
+        The transport arguments are accepted to match `BaseAdapter.send` but have no
+        effect on a replay.
+
+        Args:
+            request: The request to answer.
+            stream: Not used.
+            timeout: Not used.
+            verify: Not used.
+            cert: Not used.
+            proxies: Not used.
+
+        Returns:
+            The recorded response.
+
+        Raises:
+            UnrecordedRequest: The cassette has no response for the request.
+
+        """
+        key = (cast(str, request.method), cast(str, request.url))
+        with self._lock:
+            recorded = self._responses.get(key)
+            if not recorded:
+                raise UnrecordedRequest(f"No recorded response for {key[0]} {key[1]}")
+            interaction = recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+        if self.realtime:
+            time.sleep(interaction["elapsed"])
+
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response._content = (interaction["response"] or "").encode()
+        response.encoding = "utf-8"
+        response.url = key[1]
+        response.request = request
+        response.elapsed = timedelta(seconds=interaction["elapsed"])
+        return response
+
+    def close(self) -> None:
+        """Release nothing, replaying holds no connections."""
+        pass
+
+
+def _restore(session: requests.Session, adapters: Dict[str, BaseAdapter]) -> None:
+    session.adapters.clear()
+    session.adapters.update(adapters)
+
+
+@contextmanager
+def record(session_manager: Any, path: Union[Path, str]) -> Iterator[Cassette]:
+    """Record the requests of a session and save them when the block exits.
+
+    Args:
+        session_manager: The session to record, such as a `Robinhood` instance.
+        path: The file to save the cassette to.
+
+    Yields:
+        The cassette being recorded.
+
+    """
+    cassette = Cassette()
+    session = session_manager.session
+    previous = dict(session.adapters)
+    for prefix, adapter in previous.items():
+        session.adapters[prefix] = RecordingAdapter(cassette, adapter)
+    try:
+        yield cassette
+    finally:
+        _restore(session, previous)
+        cassette.save(path)
+
+
+@contextmanager
+def replay(
+    session_manager: Any, path: Union[Path, str, Cassette], realtime: bool = False
+) -> Iterator[Cassette]:
+    """Answer the requests of a session from a cassette.
+
+    Args:
+        session_manager: The session to serve, such as a `Robinhood` instance.
+        path: The cassette or the file to load it from.
+        realtime: Whether to reproduce the recorded response times.
+
+    Yields:
+        The cassette being replayed.
+
+    """
+    cassette = path if isinstance(path, Cassette) else Cassette.load(path)
+    session = session_manager.session
+    previous = dict(session.adapters)
+    adapter = ReplayAdapter(cassette, realtime)
+    # drop every adapter, a more specific prefix would otherwise bypass the replay
+    session.adapters.clear()
+    for prefix in PREFIXES:
+        session.mount(prefix, adapter)
+    try:
+        yield cassette
+    finally:
+        _restore(session, previous)
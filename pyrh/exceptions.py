@@ -39,3 +39,9 @@ class InvalidOptionId(PyrhException):
     """When an invalid option id is given/"""
 
     pass
+
+
+class UnrecordedRequest(PyrhException):
+    """When a replayed cassette has no response for a request."""
+
+    pass
@@ -0,0 +1,390 @@
+"""Implied volatility and greeks for whole options chains, vectorized with NumPy.
+
+The functions take and return columns as NumPy arrays, one value per contract, with
+NaN for missing values. Each stage is a handful of array operations over the whole
+chain: the implied volatility solver takes one Newton or bisection step on every
+unsolved contract per round, and the greeks are computed in a single pass.
+
+NumPy is an optional dependency, install it with the `greeks` extra::
+
+    pip install pyrh[greeks]
+
+"""
+
+from datetime import datetime, time
+from math import pi, sqrt
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+import pytz
+
+DAYS_PER_YEAR: float = 365.0
+"""Days per year used to annualize times to expiry and to scale theta."""
+
+RISK_FREE_RATE: float = 0.0
+"""Default continuously compounded risk free rate."""
+
+EXPIRATION_TIME: time = time(16)
+"""Contracts expire at the close of the regular session on their expiration date."""
+
+EXPIRATION_TZ = pytz.timezone("US/Eastern")
+"""The timezone of `EXPIRATION_TIME`."""
+
+IV_TOLERANCE: float = 1e-6
+"""Stop solving for a volatility once it is known to within this absolute amount."""
+
+IV_MAX_ITERATIONS: int = 50
+"""The maximum number of solver steps for the implied volatilities."""
+
+MIN_VOLATILITY: float = 1e-4
+"""The lowest implied volatility the solver searches, lower ones are not solved."""
+
+MAX_VOLATILITY: float = 10.0
+"""The highest implied volatility the solver searches, higher ones are not solved."""
+
+_SQRT_2 = sqrt(2.0)
+_SQRT_2PI = sqrt(2.0 * pi)
+_SQRT_PI = sqrt(pi)
+
+# erfc is summed from the series of erf below _ERFC_SPLIT and from its continued
+# fraction above, both are accurate to about 1e-13 relative to erfc
+_ERFC_SPLIT = 2.0
+_ERFC_SERIES_TERMS = 30
+_ERFC_FRACTION_TERMS = 40
+
+Array = npt.NDArray[np.float64]
+Column = Union[Iterable[Optional[float]], Array]
+
+
+class Greeks(NamedTuple):
+    """The implied volatility and greeks of a single contract.
+
+    Note:
+        Theta is the change in value per calendar day and vega the change in value
+        for a 1% change in volatility, which matches the values robinhood returns.
+
+    """
+
+    implied_volatility: Optional[float]
+    delta: Optional[float]
+    gamma: Optional[float]
+    theta: Optional[float]
+    vega: Optional[float]
+
+
+class ChainGreeks:
+    """Columns of implied volatilities and greeks for a set of contracts.
+
+    Args:
+        ids: The option ids, one per row.
+        columns: A dictionary of the `Greeks` field names to arrays of values, NaN
+            where there is no value.
+
+    """
+
+    def __init__(self, ids: List[str], columns: Dict[str, Array]) -> None:
+        self.ids = ids
+        self.columns = columns
+        self._rows = {option_id: row for row, option_id in enumerate(ids)}
+
+    def __len__(self) -> int:
+        """Return the number of contracts.
+
+        Returns:
+            The number of rows.
+
+        """
+        return len(self.ids)
+
+    def __getitem__(self, option_id: str) -> Greeks:
+        """Get the greeks of a single contract.
+
+        Args:
+            option_id: The id of the contract.
+
+        Returns:
+            The greeks of the contract, None where there is no value.
+
+        """
+        row = self._rows[option_id]
+        values = (float(self.columns[field][row]) for field in Greeks._fields)
+        return Greeks(*(None if np.isnan(value) else value for value in values))
+
+    def __getattr__(self, name: str) -> Array:
+        """Get a whole column such as `delta`.
+
+        Args:
+            name: The name of a `Greeks` field.
+
+        Returns:
+            The array of values, NaN where there is no value.
+
+        Raises:
+            AttributeError: There is no column with that name.
+
+        """
+        if name in Greeks._fields:
+            return self.columns[name]
+        raise AttributeError(name)
+
+
+def _column(values: Column) -> Array:
+    # None becomes NaN
+    return np.array(
+        values if isinstance(values, np.ndarray) else list(values), dtype=np.float64
+    )
+
+
+def _erfc(x: Array) -> Array:
+    z = np.abs(x)
+    # erf(z) = 2 / sqrt(pi) * exp(-z^2) * sum(2^n z^(2n + 1) / (2n + 1)!!)
+    near = np.minimum(z, _ERFC_SPLIT)
+    term = near.copy()
+    total = near.copy()
+    for n in range(1, _ERFC_SERIES_TERMS):
+        term = term * (2.0 * near * near) / (2 * n + 1)
+        total = total + term
+    erfc_near = 1.0 - 2.0 / _SQRT_PI * np.exp(-near * near) * total
+    # erfc(z) = exp(-z^2) / sqrt(pi) / (z + (1/2) / (z + (2/2) / (z + (3/2) / ...)))
+    far = np.maximum(z, _ERFC_SPLIT)
+    fraction = far.copy()
+    for k in range(_ERFC_FRACTION_TERMS, 0, -1):
+        fraction = far + (0.5 * k) / fraction
+    erfc_far = np.exp(-far * far) / (_SQRT_PI * fraction)
+    erfc = np.where(z < _ERFC_SPLIT, erfc_near, erfc_far)
+    reflected: Array = np.where(x < 0, 2.0 - erfc, erfc)
+    return reflected
+
+
+def _norm_cdf(x: Array) -> Array:
+    return 0.5 * _erfc(-x / _SQRT_2)
+
+
+def _norm_pdf(x: Array) -> Array:
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def _d1(spot: Any, strike: Any, t: Any, vol: Any, rate: float) -> Array:
+    d1: Array = (np.log(spot / strike) + (rate + 0.5 * vol * vol) * t) / (
+        vol * np.sqrt(t)
+    )
+    return d1
+
+
+def _price(
+    spot: Any, strike: Any, t: Any, vol: Any, rate: float, is_call: Any
+) -> Array:
+    d1 = _d1(spot, strike, t, vol, rate)
+    d2 = d1 - vol * np.sqrt(t)
+    discount = strike * np.exp(-rate * t)
+    sign = np.where(is_call, 1.0, -1.0)
+    price: Array = sign * (
+        spot * _norm_cdf(sign * d1) - discount * _norm_cdf(sign * d2)
+    )
+    return price
+
+
+def _vega(spot: Any, strike: Any, t: Any, vol: Any, rate: float) -> Array:
+    vega: Array = spot * _norm_pdf(_d1(spot, strike, t, vol, rate)) * np.sqrt(t)
+    return vega
+
+
+def implied_volatilities(
+    prices: Column,
+    spot: float,
+    strikes: Column,
+    times: Column,
+    is_call: Iterable[bool],
+    rate: float = RISK_FREE_RATE,
+) -> Array:
+    """Solve for the Black-Scholes implied volatility of many contracts at once.
+
+    Each round takes a Newton step on the log of the price of every unsolved contract
+    with array operations, which converges quickly on tiny prices too. A step that
+    leaves the bracket known to contain the solution is replaced with a bisection. A volatility is solved once the Newton step or the bracket is smaller
+    than `IV_TOLERANCE`, so contracts with a tiny price or vega are solved to the same
+    accuracy as the others. Contracts that are not solved after `IV_MAX_ITERATIONS`
+    steps have no implied volatility, which happens when it is outside of
+    `MIN_VOLATILITY` and `MAX_VOLATILITY`.
+
+    Args:
+        prices: The option prices.
+        spot: The price of the underlying.
+        strikes: The strike prices.
+        times: The times to expiry in years.
+        is_call: True for calls and False for puts.
+        rate: The continuously compounded risk free rate.
+
+    Returns:
+        The implied volatilities, NaN where the inputs are missing, the price is
+        outside of the no-arbitrage bounds or the solver did not converge.
+
+    """
+    price, strike, t = _column(prices), _column(strikes), _column(times)
+    call = np.array(list(is_call), dtype=bool)
+    vols = np.full(price.shape, np.nan)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        discount = strike * np.exp(-rate * t)
+        lower = np.maximum(np.where(call, spot - discount, discount - spot), 0.0)
+        upper = np.where(call, spot, discount)
+        # comparisons with NaN are False, so missing inputs are never solved
+        valid = (spot > 0) & (strike > 0) & (t > 0) & (lower < price) & (price < upper)
+
+    rows = np.flatnonzero(valid)
+    price, strike, t, call = price[rows], strike[rows], t[rows], call[rows]
+    # Brenner-Subrahmanyam approximation as the starting point
+    vol = np.clip(np.sqrt(2.0 * pi / t) * price / spot, MIN_VOLATILITY, MAX_VOLATILITY)
+    low = np.full(rows.shape, MIN_VOLATILITY)
+    high = np.full(rows.shape, MAX_VOLATILITY)
+    # the solution is only bracketed once the price was seen on both sides of it
+    above = np.zeros(rows.shape, dtype=bool)
+    below = np.zeros(rows.shape, dtype=bool)
+
+    for _ in range(IV_MAX_ITERATIONS):
+        if rows.size == 0:
+            break
+        model = _price(spot, strike, t, vol, rate, call)
+        diff = model - price
+        above, below = above | (diff > 0), below | (diff < 0)
+        high, low = np.where(diff > 0, vol, high), np.where(diff < 0, vol, low)
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            vega = _vega(spot, strike, t, vol, rate)
+            step = (np.log(model) - np.log(price)) * model / vega
+        newton = vol - step
+        converged = np.abs(step) < IV_TOLERANCE
+        solved = (diff == 0) | converged
+        solved |= above & below & (high - low < IV_TOLERANCE)
+        vols[rows[solved]] = np.where(converged, newton, vol)[solved]
+
+        inside = (vega > 0) & (low < newton) & (newton < high)
+        vol = np.where(inside, newton, 0.5 * (low + high))
+        keep = ~solved
+        rows, price, strike, t, call = (
+            rows[keep],
+            price[keep],
+            strike[keep],
+            t[keep],
+            call[keep],
+        )
+        vol, low, high = vol[keep], low[keep], high[keep]
+        above, below = above[keep], below[keep]
+
+    return vols
+
+
+def greeks(
+    spot: float,
+    strikes: Column,
+    times: Column,
+    vols: Column,
+    is_call: Iterable[bool],
+    rate: float = RISK_FREE_RATE,
+) -> Dict[str, Array]:
+    """Compute the Black-Scholes greeks of many contracts at once.
+
+    Args:
+        spot: The price of the underlying.
+        strikes: The strike prices.
+        times: The times to expiry in years.
+        vols: The volatilities, typically from `implied_volatilities`.
+        is_call: True for calls and False for puts.
+        rate: The continuously compounded risk free rate.
+
+    Returns:
+        A dictionary with the `delta`, `gamma`, `theta` and `vega` arrays. Rows
+        without a volatility or time to expiry are NaN.
+
+    """
+    strike, t, vol = _column(strikes), _column(times), _column(vols)
+    call = np.array(list(is_call), dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # NaN propagates to every greek of the rows that cannot be priced
+        t = np.where(t > 0, t, np.nan)
+        sqrt_t = np.sqrt(t)
+        d1 = _d1(spot, strike, t, vol, rate)
+        d2 = d1 - vol * sqrt_t
+        pdf = _norm_pdf(d1)
+        discount = strike * np.exp(-rate * t)
+        decay = -spot * pdf * vol / (2.0 * sqrt_t)
+        cdf_d1 = _norm_cdf(d1)
+        carry = rate * discount * _norm_cdf(np.where(call, d2, -d2))
+        return {
+            "delta": np.where(call, cdf_d1, cdf_d1 - 1.0),
+            "gamma": pdf / (spot * vol * sqrt_t),
+            "theta": np.where(call, decay - carry, decay + carry) / DAYS_PER_YEAR,
+            "vega": spot * pdf * sqrt_t / 100.0,
+        }
+
+
+def _underlying_price(underlying: Any) -> float:
+    if isinstance(underlying, (int, float)):
+        return float(underlying)
+    if isinstance(underlying, Mapping):
+        return float(underlying["last_trade_price"])
+    return float(underlying.last_trade_price)
+
+
+def _option_price(market_data: Any) -> Optional[float]:
+    if market_data is None:
+        return None
+    mark = getattr(market_data, "mark_price", None)
+    if mark:
+        return float(mark)
+    bid = getattr(market_data, "bid_price", None)
+    ask = getattr(market_data, "ask_price", None)
+    if bid is None or ask is None:
+        return None
+    return 0.5 * (float(bid) + float(ask))
+
+
+def _years_to_expiry(expiration_date: Any, now: datetime) -> float:
+    expires_at: datetime = EXPIRATION_TZ.localize(
+        datetime.combine(expiration_date, EXPIRATION_TIME)
+    )
+    return (expires_at - now).total_seconds() / (DAYS_PER_YEAR * 86400.0)
+
+
+def chain_greeks(
+    contracts: Iterable[Any],
+    underlying: Any,
+    rate: float = RISK_FREE_RATE,
+    now: Optional[datetime] = None,
+) -> ChainGreeks:
+    """Compute the implied volatility and greeks of every contract in a chain.
+
+    The option price is the market data `mark_price`, falling back to the middle of
+    the bid and ask.
+
+    Examples:
+        >>> chain = rh.option_chain("TSLA", market_data=True)  # xdoctest: +SKIP
+        >>> table = chain_greeks(chain, rh.get_quote("TSLA"))  # xdoctest: +SKIP
+        >>> table.delta  # xdoctest: +SKIP
+
+    Args:
+        contracts: An `OptionChain` or any iterable of contracts with their
+            `market_data` attribute set.
+        underlying: The underlying price, or its quote as returned by
+            `Robinhood.quote_data`.
+        rate: The continuously compounded risk free rate.
+        now: The valuation time, defaults to the current time.
+
+    Returns:
+        The greeks of every contract keyed by option id.
+
+    """
+    now = datetime.now(tz=pytz.UTC) if now is None else now
+    spot = _underlying_price(underlying)
+    contracts = list(contracts)
+
+    strikes = _column(c.strike_price for c in contracts)
+    is_call = [c.type == "call" for c in contracts]
+    times = _column(_years_to_expiry(c.expiration_date, now) for c in contracts)
+    prices = _column(_option_price(getattr(c, "market_data", None)) for c in contracts)
+
+    vols = implied_volatilities(prices, spot, strikes, times, is_call, rate)
+    columns = greeks(spot, strikes, times, vols, is_call, rate)
+    columns["implied_volatility"] = vols
+
+    return ChainGreeks([str(c.id) for c in contracts], columns)
@@ -0,0 +1,726 @@
+"""A local stand-in for the Robinhood API, for load and latency testing.
+
+The server answers the endpoints pyrh uses with generated, deterministic data:
+oauth, accounts, instruments, splits, quotes, historicals, fundamentals, markets,
+orders, positions and portfolios. It can add latency, fail a fraction of the requests and rate limit
+them.
+
+Examples:
+    >>> with MockRobinhoodServer(latency=0.02) as server:  # xdoctest: +SKIP
+    ...     rh = Robinhood(username="user@example.com", password="password",
+    ...                    api_base=server.url)
+    ...     rh.login()
+    ...     rh.quotes(["AAAA", "AAAB"])
+
+    Or from a shell::
+
+        python -m pyrh.mock_server --port 8000 --latency 0.02 --error-rate 0.01
+
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import pytz
+
+from pyrh.models.base import JSON, RateLimiter
+
+PAGE_SIZE = 100
+"""Number of results in each page of the paginated endpoints."""
+
+OPEN_STATES = ("queued", "unconfirmed", "confirmed", "partially_filled")
+
+Route = Tuple[str, "re.Pattern[str]", Callable[..., Tuple[int, Any]]]
+
+
+def _symbol(index: int) -> str:
+    letters = []
+    for _ in range(4):
+        index, letter = divmod(index, 26)
+        letters.append(chr(ord("A") + letter))
+    return "".join(reversed(letters))
+
+
+def _now() -> datetime:
+    return datetime.now(tz=pytz.UTC)
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class MockRobinhoodServer:
+    """A threaded HTTP server that imitates the Robinhood API.
+
+    Args:
+        host: The interface to listen on.
+        port: The port to listen on, any free port by default.
+        latency: The number of seconds every response is delayed by.
+        error_rate: The fraction of the requests answered with a 500 error.
+        rate_limit: The number of requests per second above which requests are
+            answered with a 429 error, no limit by default.
+        page_size: The number of results in each page.
+        instruments: The number of instruments to generate.
+        positions: The number of positions of the account.
+        fill_after: The number of seconds after which a new order is filled.
+        seed: The seed of the generated data and of the injected errors.
+
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        page_size: int = PAGE_SIZE,
+        instruments: int = 1000,
+        positions: int = 10,
+        fill_after: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limiter = None if rate_limit is None else RateLimiter(rate_limit)
+        self.page_size = page_size
+        self.fill_after = fill_after
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, str] = {}
+
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.mock = self  # type: ignore
+        self._thread: Optional[threading.Thread] = None
+
+        self.instruments = [self._instrument(i) for i in range(instruments)]
+        self.by_symbol = {i["symbol"]: i for i in self.instruments}
+        self.by_id = {i["id"]: i for i in self.instruments}
+        self.prices = {
+            i["symbol"]: round(self._random.uniform(5, 500), 2)
+            for i in self.instruments
+        }
+        self.orders: Dict[str, JSON] = {}
+        self.account = {
+            "url": f"{self.url}accounts/5PY78241/",
+            "account_number": "5PY78241",
+            "buying_power": "100000.0000",
+            "cash": "100000.0000",
+        }
+        self.positions = [
+            self._position(instrument) for instrument in self.instruments[:positions]
+        ]
+
+        self.routes: List[Route] = [
+            ("POST", re.compile(r"oauth2/token/"), self.oauth_token),
+            ("POST", re.compile(r"oauth2/revoke_token/"), self.oauth_revoke),
+            ("GET", re.compile(r"accounts/"), self.accounts),
+            ("GET", re.compile(r"instruments/"), self.list_instruments),
+            ("GET", re.compile(r"instruments/(?P<id_>[\w-]+)/"), self.instrument),
+            ("GET", re.compile(r"instruments/(?P<id_>[\w-]+)/splits/"), self.splits),
+            ("GET", re.compile(r"quotes/"), self.quotes),
+            ("GET", re.compile(r"quotes/historicals/"), self.historicals),
+            ("GET", re.compile(r"quotes/(?P<symbol>\w+)/"), self.quote),
+            ("GET", re.compile(r"fundamentals/"), self.fundamentals),
+            ("GET", re.compile(r"fundamentals/(?P<symbol>\w+)/"), self.fundamental),
+            ("GET", re.compile(r"markets/(?P<mic>\w+)/"), self.market),
+            (
+                "GET",
+                re.compile(r"markets/(?P<mic>\w+)/hours/(?P<day>[\d-]+)/"),
+                self.market_hours,
+            ),
+            ("GET", re.compile(r"orders/"), self.list_orders),
+            ("POST", re.compile(r"orders/"), self.place_order),
+            ("GET", re.compile(r"orders/(?P<id_>[\w-]+)/"), self.order),
+            ("POST", re.compile(r"orders/(?P<id_>[\w-]+)/cancel/"), self.cancel_order),
+            ("GET", re.compile(r"positions/"), self.list_positions),
+            ("GET", re.compile(r"portfolios/"), self.portfolios),
+        ]
+
+    @property
+    def url(self) -> str:
+        """Get the base url of the server, to use as the `api_base` of a session.
+
+        Returns:
+            The url, ending with a slash.
+
+        """
+        host, port = self.httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "MockRobinhoodServer":
+        """Serve requests from a background thread.
+
+        Returns:
+            The server itself.
+
+        """
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockRobinhoodServer":
+        """Start the server.
+
+        Returns:
+            The server itself.
+
+        """
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the server.
+
+        Args:
+            *args: The exception information, not used.
+
+        """
+        self.stop()
+
+    # Data
+
+    def _instrument(self, index: int) -> JSON:
+        id_ = str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+        symbol = _symbol(index)
+        return {
+            "id": id_,
+            "url": f"{self.url}instruments/{id_}/",
+            "quote": f"{self.url}quotes/{symbol}/",
+            "market": f"{self.url}markets/XNAS/",
+            "fundamentals": f"{self.url}fundamentals/{symbol}/",
+            "splits": f"{self.url}instruments/{id_}/splits/",
+            "symbol": symbol,
+            "name": f"{symbol} Incorporated Common Stock",
+            "simple_name": f"{symbol} Inc",
+            "state": "active",
+            "tradeable": True,
+            "tradability": "tradable",
+            "type": "stock",
+            "country": "US",
+            "day_trade_ratio": "0.2500",
+            "maintenance_ratio": "0.2500",
+            "margin_initial_ratio": "0.5000",
+            "min_tick_size": None,
+            "list_date": "2000-01-03",
+            "bloomberg_unique": f"EQ{index:014d}",
+            "tradable_chain_id": None,
+        }
+
+    def _quote(self, symbol: str) -> JSON:
+        instrument = self.by_symbol[symbol]
+        with self._lock:
+            price = self.prices[symbol] = round(
+                max(0.01, self.prices[symbol] * (1 + self._random.gauss(0, 0.001))), 2
+            )
+        return {
+            "symbol": symbol,
+            "instrument": instrument["url"],
+            "ask_price": f"{price + 0.01:.4f}",
+            "ask_size": 100,
+            "bid_price": f"{price - 0.01:.4f}",
+            "bid_size": 100,
+            "last_trade_price": f"{price:.4f}",
+            "last_extended_hours_trade_price": None,
+            "last_trade_price_source": "consolidated",
+            "previous_close": f"{price:.4f}",
+            "adjusted_previous_close": f"{price:.4f}",
+            "previous_close_date": date.today().isoformat(),
+            "has_traded": True,
+            "trading_halted": False,
+            "updated_at": _iso(_now()),
+        }
+
+    def _fundamentals(self, symbol: str) -> JSON:
+        instrument = self.by_symbol[symbol]
+        price, rng = self.prices[symbol], random.Random(symbol)
+        shares = rng.randint(10_000_000, 10_000_000_000)
+        return {
+            "symbol": symbol,
+            "instrument": instrument["url"],
+            "open": f"{price:.4f}",
+            "high": f"{price * 1.01:.4f}",
+            "low": f"{price * 0.99:.4f}",
+            "volume": f"{rng.randint(10_000, 1_000_000):.4f}",
+            "average_volume": f"{rng.randint(10_000, 1_000_000):.4f}",
+            "average_volume_2_weeks": f"{rng.randint(10_000, 1_000_000):.4f}",
+            "high_52_weeks": f"{price * 1.3:.4f}",
+            "low_52_weeks": f"{price * 0.7:.4f}",
+            "dividend_yield": f"{rng.uniform(0, 5):.4f}",
+            "market_cap": f"{price * shares:.4f}",
+            "pe_ratio": f"{rng.uniform(5, 60):.4f}",
+            "pb_ratio": f"{rng.uniform(0.5, 20):.4f}",
+            "shares_outstanding": f"{shares:.4f}",
+            "float": f"{shares * 0.9:.4f}",
+            "num_employees": rng.randint(10, 100_000),
+            "year_founded": rng.randint(1900, 2015),
+            "sector": "Technology Services",
+            "industry": "Packaged Software",
+            "ceo": None,
+            "headquarters_city": "New York",
+            "headquarters_state": "New York",
+            "description": instrument["name"],
+        }
+
+    def _position(self, instrument: JSON) -> JSON:
+        quantity = self._random.randint(1, 100)
+        price = self.prices[instrument["symbol"]]
+        return {
+            "url": f"{self.url}positions/5PY78241/{instrument['id']}/",
+            "account": self.account["url"],
+            "instrument": instrument["url"],
+            "quantity": f"{quantity:.4f}",
+            "average_buy_price": f"{price * self._random.uniform(0.8, 1.2):.4f}",
+            "shares_held_for_sells": "0.0000",
+            "_instrument_id": instrument["id"],
+            "created_at": _iso(_now()),
+            "updated_at": _iso(_now()),
+        }
+
+    def _refresh_order(self, order: JSON) -> JSON:
+        if order["state"] in OPEN_STATES:
+            age = (_now() - order["_created"]).total_seconds()
+            if age >= self.fill_after:
+                order["state"] = "filled"
+                order["cumulative_quantity"] = order["quantity"]
+                order["average_price"] = order["price"]
+                order["cancel"] = None
+                order["updated_at"] = order["last_transaction_at"] = _iso(_now())
+        return {key: value for key, value in order.items() if key[0] != "_"}
+
+    def _page(self, path: str, query: Dict[str, str], results: List[Any]) -> JSON:
+        start = int(query.get("cursor", 0))
+        end = start + self.page_size
+
+        def link(cursor: int) -> str:
+            return f"{self.url}{path}?{urlencode({**query, 'cursor': cursor})}"
+
+        return {
+            "next": link(end) if end < len(results) else None,
+            "previous": link(max(0, start - self.page_size)) if start else None,
+            "results": results[start:end],
+        }
+
+    # Endpoints
+
+    def oauth_token(self, form: Dict[str, str], **_: Any) -> Tuple[int, Any]:
+        """Issue a token for any username and password, or refresh a token."""
+        if form.get("grant_type") == "refresh_token":
+            if form.get("refresh_token") not in self._tokens.values():
+                return 401, {"detail": "Invalid refresh token."}
+        elif not form.get("username") or not form.get("password"):
+            return 400, {"detail": "Unable to log in with provided credentials."}
+        access, refresh = uuid.uuid4().hex, uuid.uuid4().hex
+        with self._lock:
+            self._tokens[access] = refresh
+        return 200, {
+            "access_token": access,
+            "refresh_token": refresh,
+            "expires_in": 86400,
+            "token_type": "Bearer",
+            "scope": "internal",
+        }
+
+    def oauth_revoke(self, form: Dict[str, str], **_: Any) -> Tuple[int, Any]:
+        """Revoke a token."""
+        with self._lock:
+            for access, refresh in list(self._tokens.items()):
+                if form.get("token") in (access, refresh):
+                    del self._tokens[access]
+        return 200, {}
+
+    def accounts(self, **_: Any) -> Tuple[int, Any]:
+        """List the single account."""
+        return 200, {"next": None, "previous": None, "results": [self.account]}
+
+    def list_instruments(
+        self, path: str, query: Dict[str, str], **_: Any
+    ) -> Tuple[int, Any]:
+        """List, search or batch fetch instruments."""
+        if "symbol" in query:
+            found = self.by_symbol.get(query["symbol"].upper())
+            return 200, {"next": None, "results": [found] if found else []}
+        if "ids" in query:
+            ids = query["ids"].split(",")
+            return 200, {"next": None, "results": [self.by_id.get(id_) for id_ in ids]}
+        if "query" in query:
+            word = query["query"].upper()
+            matches = [i for i in self.instruments if word in i["symbol"]]
+            return 200, self._page(path, query, matches)
+        return 200, self._page(path, query, self.instruments)
+
+    def instrument(self, id_: str, **_: Any) -> Tuple[int, Any]:
+        """Get an instrument."""
+        found = self.by_id.get(id_)
+        return (200, found) if found else (404, {"detail": "Not found."})
+
+    def splits(
+        self, path: str, query: Dict[str, str], id_: str, **_: Any
+    ) -> Tuple[int, Any]:
+        """List the splits of an instrument, generated instruments never split."""
+        if id_ not in self.by_id:
+            return 404, {"detail": "Not found."}
+        return 200, self._page(path, query, [])
+
+    def quotes(self, query: Dict[str, str], **_: Any) -> Tuple[int, Any]:
+        """Get the quotes of several symbols."""
+        symbols = query.get("symbols", "").upper().split(",")
+        return 200, {
+            "results": [
+                self._quote(s) if s in self.by_symbol else None for s in symbols
+            ]
+        }
+
+    def quote(self, symbol: str, **_: Any) -> Tuple[int, Any]:
+        """Get the quote of a symbol."""
+        if symbol.upper() not in self.by_symbol:
+            return 404, {"detail": "Not found."}
+        return 200, self._quote(symbol.upper())
+
+    def historicals(self, query: Dict[str, str], **_: Any) -> Tuple[int, Any]:
+        """Get generated daily historicals of several symbols."""
+        points = {"day": 78, "week": 390, "year": 252, "5year": 260}
+        count = points.get(query.get("span", "day"), 78)
+        results = []
+        for symbol in query.get("symbols", "").upper().split(","):
+            if symbol not in self.by_symbol:
+                continue
+            price, start = self.prices[symbol], _now() - timedelta(days=count)
+            rng = random.Random(symbol)
+            historicals = []
+            for i in range(count):
+                open_ = price * (1 + rng.gauss(0, 0.01))
+                close = price * (1 + rng.gauss(0, 0.01))
+                historicals.append(
+                    {
+                        "begins_at": _iso(start + timedelta(days=i)),
+                        "open_price": f"{open_:.4f}",
+                        "close_price": f"{close:.4f}",
+                        "high_price": f"{max(open_, close) * 1.005:.4f}",
+                        "low_price": f"{min(open_, close) * 0.995:.4f}",
+                        "volume": rng.randint(10_000, 1_000_000),
+                        "session": "reg",
+                        "interpolated": False,
+                    }
+                )
+            results.append(
+                {
+                    "symbol": symbol,
+                    "interval": query.get("interval"),
+                    "span": query.get("span"),
+                    "bounds": query.get("bounds"),
+                    "instrument": self.by_symbol[symbol]["url"],
+                    "historicals": historicals,
+                }
+            )
+        return 200, {"results": results}
+
+    def fundamentals(self, query: Dict[str, str], **_: Any) -> Tuple[int, Any]:
+        """Get the fundamentals of several symbols."""
+        symbols = query.get("symbols", "").upper().split(",")
+        return 200, {
+            "next": None,
+            "results": [
+                self._fundamentals(s) if s in self.by_symbol else None for s in symbols
+            ],
+        }
+
+    def fundamental(self, symbol: str, **_: Any) -> Tuple[int, Any]:
+        """Get the fundamentals of a symbol."""
+        if symbol.upper() not in self.by_symbol:
+            return 404, {"detail": "Not found."}
+        return 200, self._fundamentals(symbol.upper())
+
+    def market(self, mic: str, **_: Any) -> Tuple[int, Any]:
+        """Get the market every generated instrument trades on."""
+        if mic != "XNAS":
+            return 404, {"detail": "Not found."}
+        return 200, {
+            "url": f"{self.url}markets/{mic}/",
+            "todays_hours": f"{self.url}markets/{mic}/hours/{date.today()}/",
+            "mic": mic,
+            "operating_mic": mic,
+            "acronym": "NASDAQ",
+            "name": "NASDAQ - All Markets",
+            "city": "New York",
+            "country": "US - United States of America",
+            "timezone": "US/Eastern",
+            "website": "www.nasdaq.com",
+        }
+
+    def market_hours(self, mic: str, day: str, **_: Any) -> Tuple[int, Any]:
+        """Get hours that keep the market open all day, every day."""
+        today = date.fromisoformat(day)
+        opens = datetime.combine(today, datetime.min.time(), tzinfo=pytz.UTC)
+        closes = opens + timedelta(days=1) - timedelta(seconds=1)
+
+        def hours_url(day: date) -> str:
+            return f"{self.url}markets/{mic}/hours/{day.isoformat()}/"
+
+        return 200, {
+            "date": day,
+            "is_open": True,
+            "opens_at": _iso(opens),
+            "closes_at": _iso(closes),
+            "extended_opens_at": _iso(opens),
+            "extended_closes_at": _iso(closes),
+            "next_open_hours": hours_url(today + timedelta(days=1)),
+            "previous_open_hours": hours_url(today - timedelta(days=1)),
+        }
+
+    def list_orders(
+        self, path: str, query: Dict[str, str], **_: Any
+    ) -> Tuple[int, Any]:
+        """List the orders, most recently updated first."""
+        with self._lock:
+            orders = [self._refresh_order(order) for order in self.orders.values()]
+        since = query.get("updated_at[gte]")
+        if since is not None:
+            cutoff = datetime.fromisoformat(since.replace("Z", "+00:00"))
+            orders = [
+                o
+                for o in orders
+                if datetime.fromisoformat(o["updated_at"].replace("Z", "+00:00"))
+                >= cutoff
+            ]
+        orders.sort(key=lambda o: o["updated_at"], reverse=True)
+        return 200, self._page(path, query, orders)
+
+    def place_order(self, form: Dict[str, str], **_: Any) -> Tuple[int, Any]:
+        """Place an order, it is filled after `fill_after` seconds."""
+        missing = [
+            k for k in ("instrument", "side", "quantity", "type") if k not in form
+        ]
+        if missing:
+            return 400, {k: ["This field is required."] for k in missing}
+        id_, now = str(uuid.uuid4()), _now()
+        order: JSON = {
+            "id": id_,
+            "url": f"{self.url}orders/{id_}/",
+            "cancel": f"{self.url}orders/{id_}/cancel/",
+            "account": self.account["url"],
+            "instrument": form["instrument"],
+            "position": f"{self.account['url']}positions/",
+            "ref_id": form.get("ref_id"),
+            "side": form["side"],
+            "type": form["type"],
+            "trigger": form.get("trigger", "immediate"),
+            "time_in_force": form.get("time_in_force", "gfd"),
+            "price": form.get("price"),
+            "stop_price": form.get("stop_price"),
+            "quantity": form["quantity"],
+            "cumulative_quantity": "0.00000",
+            "average_price": None,
+            "fees": "0.00",
+            "state": "confirmed",
+            "executions": [],
+            "extended_hours": False,
+            "reject_reason": None,
+            "created_at": _iso(now),
+            "updated_at": _iso(now),
+            "last_transaction_at": None,
+            "_created": now,
+        }
+        with self._lock:
+            # ref_id makes resubmissions idempotent, like the real endpoint
+            for existing in self.orders.values():
+                if order["ref_id"] and existing["ref_id"] == order["ref_id"]:
+                    return 200, self._refresh_order(existing)
+            self.orders[id_] = order
+            return 201, self._refresh_order(order)
+
+    def order(self, id_: str, **_: Any) -> Tuple[int, Any]:
+        """Get an order."""
+        with self._lock:
+            found = self.orders.get(id_)
+            return (200, self._refresh_order(found)) if found else (404, {})
+
+    def cancel_order(self, id_: str, **_: Any) -> Tuple[int, Any]:
+        """Cancel an open order."""
+        with self._lock:
+            order = self.orders.get(id_)
+            if order is None:
+                return 404, {"detail": "Not found."}
+            self._refresh_order(order)
+            if order["state"] not in OPEN_STATES:
+                return 400, {"detail": "Order has already been filled or cancelled."}
+            order.update(state="cancelled", cancel=None, updated_at=_iso(_now()))
+        return 200, {}
+
+    def list_positions(
+        self, path: str, query: Dict[str, str], **_: Any
+    ) -> Tuple[int, Any]:
+        """List the positions of the account."""
+        positions = self.positions
+        if query.get("nonzero") == "true":
+            positions = [p for p in positions if float(p["quantity"]) > 0]
+        positions = [
+            {key: value for key, value in p.items() if key[0] != "_"} for p in positions
+        ]
+        return 200, self._page(path, query, positions)
+
+    def portfolios(self, **_: Any) -> Tuple[int, Any]:
+        """Get the portfolio of the account."""
+        value = sum(
+            float(p["quantity"])
+            * self.prices[self.by_id[p["_instrument_id"]]["symbol"]]
+            for p in self.positions
+        )
+        cash = float(self.account["cash"])
+        amounts = {
+            "market_value": value,
+            "equity": value + cash,
+            "extended_hours_market_value": value,
+            "extended_hours_equity": value + cash,
+            "last_core_market_value": value,
+            "last_core_equity": value + cash,
+            "equity_previous_close": value + cash,
+            "adjusted_equity_previous_close": value + cash,
+            "withdrawable_amount": cash,
+        }
+        portfolio = {key: f"{amount:.4f}" for key, amount in amounts.items()}
+        portfolio.update(
+            url=f"{self.url}portfolios/5PY78241/",
+            account=self.account["url"],
+            start_date="2020-01-02T00:00:00",
+        )
+        return 200, {"next": None, "previous": None, "results": [portfolio]}
+
+    # Dispatch
+
+    def _authorized(self, headers: Any) -> bool:
+        token = headers.get("Authorization", "")[len("Bearer ") :]
+        with self._lock:
+            return token in self._tokens
+
+    def handle(
+        self, method: str, raw_path: str, headers: Any, body: bytes
+    ) -> Tuple[int, Dict[str, str], Any]:
+        """Answer a request.
+
+        Args:
+            method: The HTTP method.
+            raw_path: The path and query string of the request.
+            headers: The request headers.
+            body: The request body.
+
+        Returns:
+            The status code, extra response headers and JSON body.
+
+        """
+        with self._lock:
+            self.requests += 1
+            fail = self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            return 429, {"Retry-After": "1"}, {"detail": "Request was throttled."}
+        if fail:
+            return 500, {}, {"detail": "Injected error."}
+
+        split = urlsplit(raw_path)
+        path = split.path.lstrip("/")
+        query = {k: v[-1] for k, v in parse_qs(split.query).items()}
+        content = body.decode() if body else ""
+        if content.startswith("{"):
+            form = {k: str(v) for k, v in json.loads(content).items()}
+        else:
+            form = {k: v[-1] for k, v in parse_qs(content).items()}
+
+        for route_method, pattern, endpoint in self.routes:
+            match = pattern.fullmatch(path)
+            if route_method != method or match is None:
+                continue
+            private = not path.startswith(
+                ("oauth2/", "instruments/", "quotes/", "fundamentals/", "markets/")
+            )
+            if private and not self._authorized(headers):
+                return (
+                    401,
+                    {},
+                    {"detail": "Authentication credentials were not provided."},
+                )
+            status, payload = endpoint(
+                path=path, query=query, form=form, **match.groupdict()
+            )
+            return status, {}, payload
+        return 404, {}, {"detail": "Not found."}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = self.server.mock.handle(  # type: ignore
+            self.command, self.path, self.headers, body
+        )
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_DELETE = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the mock server until interrupted.
+
+    Args:
+        argv: The command line arguments, `sys.argv` by default.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--instruments", type=int, default=1000)
+    parser.add_argument("--positions", type=int, default=10)
+    parser.add_argument("--fill-after", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = MockRobinhoodServer(**vars(args))
+    print(f"Serving a mock Robinhood API on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,94 @@
 """pyrh models and schemas."""
 
+from .base import RateLimiter
+from .fundamentals import (
+    Fundamentals,
+    FundamentalsManager,
+    FundamentalsPaginator,
+    FundamentalsPaginatorSchema,
+    FundamentalsSchema,
+    FundamentalsTable,
+)
+from .history import OrderHistoryStore, OrderSyncReport
 from .instrument import (
     Instrument,
     InstrumentManager,
     InstrumentPaginator,
     InstrumentPaginatorSchema,
     InstrumentSchema,
+    Split,
+    SplitPaginator,
+    SplitPaginatorSchema,
+    SplitSchema,
+)
+from .latency import LatencyHistogram, LatencyRecorder, LatencySample, OrderTiming
+from .market import (
+    Market,
+    MarketHours,
+    MarketHoursSchema,
+    MarketManager,
+    MarketPaginator,
+    MarketPaginatorSchema,
+    MarketSchema,
 )
 from .oauth import Challenge, ChallengeSchema, OAuth, OAuthSchema
+from .option import (
+    OptionChain,
+    OptionInstrument,
+    OptionInstrumentPaginator,
+    OptionInstrumentPaginatorSchema,
+    OptionInstrumentSchema,
+    OptionManager,
+    OptionMarketData,
+    OptionMarketDataPaginator,
+    OptionMarketDataPaginatorSchema,
+    OptionMarketDataSchema,
+)
+from .order import (
+    BasketResult,
+    CancelResult,
+    OpenOrderTracker,
+    Order,
+    OrderEvent,
+    OrderManager,
+    OrderPaginator,
+    OrderPaginatorSchema,
+    OrderResult,
+    OrderSchema,
+)
 from .portfolio import Portfolio, PortfolioSchema
+from .position import (
+    Position,
+    PositionManager,
+    PositionPaginator,
+    PositionPaginatorSchema,
+    PositionSchema,
+    PositionsSnapshot,
+    PositionValue,
+)
+from .quote import (
+    Quote,
+    QuoteManager,
+    QuotePaginator,
+    QuotePaginatorSchema,
+    QuoteSchema,
+)
+from .resolver import ResolverManager
+from .search import InstrumentIndex
 from .sessionmanager import SessionManager, SessionManagerSchema
+from .universe import InstrumentStore, SyncProgress, SyncReport
+from .valuation import PortfolioValuation
+from .watchlist import (
+    Watchlist,
+    WatchlistItem,
+    WatchlistItemPaginator,
+    WatchlistItemPaginatorSchema,
+    WatchlistItemSchema,
+    WatchlistManager,
+    WatchlistPaginator,
+    WatchlistPaginatorSchema,
+    WatchlistSchema,
+)
 
 __all__ = [
     "OAuth",
@@ -18,11 +97,82 @@ __all__ = [
     "ChallengeSchema",
     "SessionManager",
     "SessionManagerSchema",
+    "RateLimiter",
     "Portfolio",
     "PortfolioSchema",
+    "Position",
+    "PositionSchema",
+    "PositionManager",
+    "PositionPaginator",
+    "PositionPaginatorSchema",
+    "PositionValue",
+    "PositionsSnapshot",
+    "PortfolioValuation",
     "Instrument",
     "InstrumentSchema",
     "InstrumentManager",
     "InstrumentPaginator",
     "InstrumentPaginatorSchema",
+    "OptionInstrument",
+    "OptionInstrumentSchema",
+    "OptionInstrumentPaginator",
+    "OptionInstrumentPaginatorSchema",
+    "OptionMarketData",
+    "OptionMarketDataSchema",
+    "OptionMarketDataPaginator",
+    "OptionMarketDataPaginatorSchema",
+    "OptionManager",
+    "OptionChain",
+    "Watchlist",
+    "WatchlistSchema",
+    "WatchlistPaginator",
+    "WatchlistPaginatorSchema",
+    "WatchlistItem",
+    "WatchlistItemSchema",
+    "WatchlistItemPaginator",
+    "WatchlistItemPaginatorSchema",
+    "WatchlistManager",
+    "Fundamentals",
+    "FundamentalsSchema",
+    "FundamentalsPaginator",
+    "FundamentalsPaginatorSchema",
+    "FundamentalsTable",
+    "FundamentalsManager",
+    "InstrumentStore",
+    "SyncProgress",
+    "SyncReport",
+    "InstrumentIndex",
+    "Split",
+    "SplitSchema",
+    "SplitPaginator",
+    "SplitPaginatorSchema",
+    "Quote",
+    "QuoteSchema",
+    "QuotePaginator",
+    "QuotePaginatorSchema",
+    "ResolverManager",
+    "QuoteManager",
+    "Market",
+    "MarketSchema",
+    "MarketPaginator",
+    "MarketPaginatorSchema",
+    "MarketHours",
+    "MarketHoursSchema",
+    "MarketManager",
+    "Order",
+    "OrderSchema",
+    "OrderPaginator",
+    "OrderPaginatorSchema",
+    "OrderManager",
+    "OpenOrderTracker",
+    "OrderEvent",
+    "OrderHistoryStore",
+    "OrderSyncReport",
+    "OrderResult",
+    "BasketResult",
+    "CancelResult",
+    "LatencyHistogram",
+    "LatencyRecorder",
+    "LatencySample",
+    "OrderTiming",
 ]
@@ -1,16 +1,54 @@
 """Base Model."""
+import sys
+import threading
+import time
+import weakref
 from collections.abc import MutableSequence
 from types import SimpleNamespace
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional
-
-from marshmallow import INCLUDE, Schema, fields, post_load
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from marshmallow import INCLUDE, Schema, fields, post_load, pre_load
 from yarl import URL
 
-from pyrh.exceptions import InvalidOperation
+from pyrh.exceptions import InvalidOperation, PyrhValueError
 
 JSON = Dict[str, Any]
 MAX_REPR_LEN = 50
 
+INTERN_FIELDS = frozenset(
+    {
+        "account",
+        "chain",
+        "fundamentals",
+        "instrument",
+        "market",
+        "option",
+        "portfolio",
+        "position",
+        "quote",
+        "splits",
+        "user",
+        "watchlist",
+    }
+)
+"""Reference fields whose urls repeat across the results of a response."""
+
+T = TypeVar("T")
+
 
 def _process_dict_values(value: Any) -> Any:
     """Process a returned from a JSON response.
@@ -31,6 +69,36 @@ def _process_dict_values(value: Any) -> Any:
         return value
 
 
+def intern_fields(value: Any, names: Iterable[str] = INTERN_FIELDS) -> Any:
+    """Intern the string values of some fields of a decoded JSON response in place.
+
+    Repeated values such as the account or instrument url of every order then share a
+    single string object instead of one copy each.
+
+    Args:
+        value: A dict, list, or value returned from a JSON response.
+        names: The names of the fields to intern, at any depth.
+
+    Returns:
+        The same value.
+
+    """
+    names = names if isinstance(names, (set, frozenset)) else frozenset(names)
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for key, item in current.items():
+                if isinstance(item, str):
+                    if key in names:
+                        current[key] = sys.intern(item)
+                elif isinstance(item, (dict, list)):
+                    stack.append(item)
+        elif isinstance(current, list):
+            stack.extend(item for item in current if isinstance(item, (dict, list)))
+    return value
+
+
 class BaseModel(SimpleNamespace):
     """BaseModel that all models should inherit from.
 
@@ -78,6 +146,29 @@ class BaseSchema(Schema):
     class Meta:
         unknown = INCLUDE
 
+    @pre_load
+    def first_result(self, data: Any, **kwargs: Any) -> Any:
+        """Select the first element of the `__first__` key before loading the fields.
+
+        Args:
+            data: The JSON diction to load.
+            **kwargs: Unused but required to match signature of `Schema.pre_load`
+
+        Returns:
+            The first element, or the input unchanged.
+
+        """
+        # nested results of a paginator are already the individual objects
+        if (
+            self.__first__ is not None
+            and isinstance(data, Mapping)
+            and self.__first__ in data
+        ):
+            data_list = data[self.__first__]
+            # guard against empty return list of a valid results return
+            return data_list[0] if len(data_list) != 0 else {}
+        return data
+
     @post_load
     def make_object(self, data: JSON, **kwargs: Any) -> "__model__":
         """Build model for the given `__model__` class attribute.
@@ -90,10 +181,6 @@ class BaseSchema(Schema):
             An instance of the `__model__` class.
 
         """
-        if self.__first__ is not None:
-            data_list = data.get("results", [{}])
-            # guard against empty return list of a valid results return
-            data = data_list[0] if len(data_list) != 0 else {}
         return self.__model__(**data)
 
 
@@ -160,26 +247,307 @@ class BasePaginatorSchema(BaseSchema):
 
 
 # TODO: Figure how to resolve the circular import with SessionManager (type ignore)
-def base_paginator(
-    seed_url: "URL", session_manager: Any, schema: Any
-) -> Iterable[Any]:  # type: ignore  # noqa: F821
-    """Create a paginator using the passed parameters.
+def base_pages(seed_url: "URL", session_manager: Any, schema: Any) -> Iterable[Any]:
+    """Iterate over the pages of a paginated endpoint.
 
     Args:
         seed_url: The url to get the first batch of results.
         session_manager: The session manager that will manage the get.
-        schema: The Schema subclass used to build individual instances.
+        schema: The paginator Schema used to build each page.
 
     Yields:
-        Instances of the object passed in the schema field.
+        One paginator per page.
 
     """
     resource_endpoint = seed_url
     while True:
         paginator = session_manager.get(resource_endpoint, schema=schema)
-        for instrument in paginator:
-            yield instrument
+        yield paginator
         if paginator.next is not None:
             resource_endpoint = paginator.next
         else:
             break
+
+
+def base_paginator(seed_url: "URL", session_manager: Any, schema: Any) -> Iterable[Any]:
+    """Create a paginator using the passed parameters.
+
+    Args:
+        seed_url: The url to get the first batch of results.
+        session_manager: The session manager that will manage the get.
+        schema: The Schema subclass used to build individual instances.
+
+    Yields:
+        Instances of the object passed in the schema field.
+
+    """
+    for paginator in base_pages(seed_url, session_manager, schema):
+        yield from paginator
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most `size` elements.
+
+    Args:
+        items: The values to split up.
+        size: The maximum length of each chunk.
+
+    Yields:
+        Consecutive lists of the input values.
+
+    """
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def by_symbol(results: Iterable[Any]) -> Dict[str, Any]:
+    """Key the results of a batch response by their ticker symbol.
+
+    Batch endpoints such as quotes and fundamentals leave out unknown symbols or
+    return None in their place, so their results are matched to the requested
+    symbols by the `symbol` field of each result rather than by position.
+
+    Args:
+        results: The results of one or more batch responses.
+
+    Returns:
+        A dictionary of upper case symbol to result, results without a symbol are \
+            left out.
+
+    """
+    return {
+        str(result.symbol).upper(): result
+        for result in results
+        if getattr(result, "symbol", None) is not None
+    }
+
+
+def id_from_url(url: Union[str, "URL"]) -> str:
+    """Get the trailing id from a robinhood resource url.
+
+    Example:
+        >>> id_from_url("https://api.robinhood.com/instruments/abc-123/")
+        'abc-123'
+
+    Args:
+        url: A resource url such as an instrument or option instrument url.
+
+    Returns:
+        The last path component of the url.
+
+    """
+    return str(url).rstrip("/").rsplit("/", 1)[-1]
+
+
+class TTLCache:
+    """A thread safe in-memory cache whose entries expire after `ttl` seconds.
+
+    Args:
+        ttl: The default number of seconds an entry stays valid.
+
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value if it is cached and has not expired.
+
+        Args:
+            key: The key of the entry.
+            default: The value returned on a miss.
+
+        Returns:
+            The cached value or `default`.
+
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value.
+
+        Args:
+            key: The key of the entry.
+            value: The value to cache.
+            ttl: The number of seconds the entry is valid, defaults to `self.ttl`.
+
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry.
+
+        Args:
+            key: The key of the entry.
+            default: The value returned if there is no entry.
+
+        Returns:
+            The removed value, expired or not, or `default`.
+
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key is cached and has not expired.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            Whether the key is cached.
+
+        """
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __len__(self) -> int:
+        """Return the number of entries that have not expired.
+
+        Returns:
+            The number of valid entries.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for expires_at, _ in self._data.values() if expires_at > now)
+
+
+class IdentityMap:
+    """A thread safe map from keys to the single live model that represents them.
+
+    Models are weakly referenced, so an entry disappears as soon as nothing else uses
+    its model.
+
+    """
+
+    def __init__(self) -> None:
+        self._data: "weakref.WeakValueDictionary[Hashable, Any]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def merge(self, key: Hashable, model: T) -> T:
+        """Get the shared model of a key, updated with the values of `model`.
+
+        Args:
+            key: The identity of the model such as its id.
+            model: A freshly loaded model.
+
+        Returns:
+            The model already mapped to `key` with its attributes replaced by the ones
+            of `model`, or `model` itself if the key is not mapped yet.
+
+        """
+        with self._lock:
+            current = self._data.get(key)
+            if current is None:
+                self._data[key] = model
+                return model
+            if current is not model:
+                current.__dict__.update(vars(model))
+            return cast(T, current)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the shared model of a key.
+
+        Args:
+            key: The identity of the model.
+            default: The value returned if the key is not mapped.
+
+        Returns:
+            The shared model or `default`.
+
+        """
+        with self._lock:
+            return self._data.get(key, default)
+
+    def __len__(self) -> int:
+        """Return the number of live models.
+
+        Returns:
+            The number of mapped keys.
+
+        """
+        with self._lock:
+            return len(self._data)
+
+
+class RateLimiter:
+    """A thread safe token bucket that spaces out requests.
+
+    Every call to `acquire` takes a token. Tokens refill at `rate` per second up to
+    `burst`, and a caller that finds the bucket empty sleeps until its token is due.
+
+    Args:
+        rate: The sustained number of requests per second.
+        burst: The number of requests allowed back to back, defaults to `rate`.
+
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise PyrhValueError("The rate must be positive.")
+        self.rate = rate
+        self.burst = max(1.0, rate if burst is None else burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """Take a token, waiting for one if the bucket is empty.
+
+        Returns:
+            The number of seconds waited.
+
+        """
+        with self._lock:
+            wait = self._take()
+
+        # The token is reserved under the lock so waiting callers queue up fairly.
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right away.
+
+        Returns:
+            Whether a token was taken.
+
+        """
+        with self._lock:
+            if self._take() > 0:
+                self._tokens += 1
+                return False
+            return True
@@ -0,0 +1,292 @@
+"""Stock fundamentals and a local fundamentals screener."""
+
+import operator
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from marshmallow import fields
+
+from pyrh import urls
+from pyrh.exceptions import PyrhValueError
+
+from .base import (
+    BaseModel,
+    BasePaginator,
+    BasePaginatorSchema,
+    BaseSchema,
+    by_symbol,
+    chunked,
+)
+from .sessionmanager import SessionManager
+
+FUNDAMENTALS_TTL: float = 60 * 60
+"""Number of seconds before a row of the fundamentals table is refreshed."""
+
+MAX_FUNDAMENTALS_SYMBOLS: int = 100
+"""The maximum number of symbols sent in a single fundamentals request."""
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+"""The comparison operators supported in screens."""
+
+Condition = Tuple[str, str, Any]
+
+
+class Fundamentals(BaseModel):
+    """The fundamentals of a single stock."""
+
+    pass
+
+
+class FundamentalsSchema(BaseSchema):
+    """The Schema for Fundamentals objects."""
+
+    __model__ = Fundamentals
+
+    symbol = fields.Str()
+    instrument = fields.URL()
+    open = fields.Float(allow_none=True)
+    high = fields.Float(allow_none=True)
+    low = fields.Float(allow_none=True)
+    volume = fields.Float(allow_none=True)
+    average_volume = fields.Float(allow_none=True)
+    average_volume_2_weeks = fields.Float(allow_none=True)
+    high_52_weeks = fields.Float(allow_none=True)
+    low_52_weeks = fields.Float(allow_none=True)
+    dividend_yield = fields.Float(allow_none=True)
+    market_cap = fields.Float(allow_none=True)
+    pe_ratio = fields.Float(allow_none=True)
+    pb_ratio = fields.Float(allow_none=True)
+    shares_outstanding = fields.Float(allow_none=True)
+    float = fields.Float(allow_none=True)
+    num_employees = fields.Int(allow_none=True)
+    year_founded = fields.Int(allow_none=True)
+    sector = fields.Str(allow_none=True)
+    industry = fields.Str(allow_none=True)
+    ceo = fields.Str(allow_none=True)
+    headquarters_city = fields.Str(allow_none=True)
+    headquarters_state = fields.Str(allow_none=True)
+    description = fields.Str(allow_none=True)
+
+
+class FundamentalsPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `Fundamentals`."""
+
+    pass
+
+
+class FundamentalsPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the FundamentalsPaginator.
+
+    The nested results are of types `Fundamentals`, None for unknown symbols.
+
+    """
+
+    __model__ = FundamentalsPaginator
+
+    results = fields.List(fields.Nested(FundamentalsSchema, allow_none=True))
+
+
+class FundamentalsTable:
+    """An in-memory table of fundamentals, one row per symbol.
+
+    Every field is stored as a plain list with one value per row. Screens loop over
+    these lists in memory and never touch the network.
+
+    Examples:
+        >>> table.screen(("market_cap", ">", 1e10), ("pe_ratio", "<", 20))
+        ['AAPL', 'MSFT']
+
+    Args:
+        columns: The names of the columns, defaults to the `FundamentalsSchema`
+            fields.
+
+    """
+
+    def __init__(self, columns: Optional[Iterable[str]] = None) -> None:
+        names = FundamentalsSchema().fields if columns is None else columns
+        self.columns: Dict[str, List[Any]] = {name: [] for name in names}
+        self.columns["symbol"] = []
+        self._rows: Dict[str, int] = {}
+        self._fetched_at: List[float] = []
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        Returns:
+            The number of symbols in the table.
+
+        """
+        return len(self._rows)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Check whether a symbol has a row.
+
+        Args:
+            symbol: A ticker symbol.
+
+        Returns:
+            Whether the symbol is in the table.
+
+        """
+        return symbol in self._rows
+
+    @property
+    def symbols(self) -> List[str]:
+        """Get the symbols of the table in row order.
+
+        Returns:
+            The symbol column.
+
+        """
+        return self.columns["symbol"]
+
+    def upsert(self, symbol: str, fundamentals: Optional[Fundamentals]) -> None:
+        """Insert or replace the row of a symbol.
+
+        Args:
+            symbol: A ticker symbol.
+            fundamentals: The fundamentals of the symbol, None if it is unknown. The
+                row is still recorded so it is not fetched again before it expires.
+
+        """
+        symbol = symbol.upper()
+        row = self._rows.get(symbol)
+        if row is None:
+            row = self._rows[symbol] = len(self._fetched_at)
+            self._fetched_at.append(0.0)
+            for column in self.columns.values():
+                column.append(None)
+
+        self._fetched_at[row] = time.monotonic()
+        for name, column in self.columns.items():
+            column[row] = getattr(fundamentals, name, None)
+        self.columns["symbol"][row] = symbol
+
+    def stale(self, symbols: Iterable[str], ttl: float = FUNDAMENTALS_TTL) -> List[str]:
+        """Find the symbols without a row or with a row older than `ttl` seconds.
+
+        Args:
+            symbols: Ticker symbols.
+            ttl: The maximum age of a row in seconds.
+
+        Returns:
+            The symbols that need to be fetched, without duplicates.
+
+        """
+        cutoff = time.monotonic() - ttl
+        stale = []
+        for symbol in dict.fromkeys(s.upper() for s in symbols):
+            row = self._rows.get(symbol)
+            if row is None or self._fetched_at[row] <= cutoff:
+                stale.append(symbol)
+        return stale
+
+    def row(self, symbol: str) -> Dict[str, Any]:
+        """Get the row of a single symbol.
+
+        Args:
+            symbol: A ticker symbol.
+
+        Returns:
+            A dictionary of column name to value.
+
+        """
+        row = self._rows[symbol.upper()]
+        return {name: column[row] for name, column in self.columns.items()}
+
+    def mask(self, column: str, op: str, value: Any) -> List[bool]:
+        """Compare a whole column to a value.
+
+        Args:
+            column: The name of the column.
+            op: One of the `OPERATORS`.
+            value: The value to compare against.
+
+        Returns:
+            A boolean per row. Missing values never match.
+
+        Raises:
+            PyrhValueError: The column or operator does not exist.
+
+        """
+        if column not in self.columns:
+            raise PyrhValueError(f"Unknown fundamentals column {column}.")
+        if op not in OPERATORS:
+            raise PyrhValueError(f"Unknown operator {op}.")
+        compare = OPERATORS[op]
+        return [v is not None and compare(v, value) for v in self.columns[column]]
+
+    def screen(self, *conditions: Condition) -> List[str]:
+        """Find the symbols that match every condition.
+
+        Args:
+            *conditions: Tuples of (column, operator, value).
+
+        Returns:
+            The matching symbols in row order.
+
+        """
+        selected: Sequence[bool] = [True] * len(self)
+        for condition in conditions:
+            selected = [a and b for a, b in zip(selected, self.mask(*condition))]
+        return [s for s, keep in zip(self.symbols, selected) if keep]
+
+
+class FundamentalsManager(SessionManager):
+    """Group together methods that fetch fundamentals in bulk.
+
+    Examples:
+        >>> fm = FundamentalsManager()
+        >>> table = fm.fundamentals_batch(["AAPL", "MSFT", "TSLA"])
+        >>> table.screen(("market_cap", ">", 1e12))
+
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.fundamentals_table = FundamentalsTable()
+
+    def fundamentals_batch(
+        self,
+        symbols: Iterable[str],
+        ttl: float = FUNDAMENTALS_TTL,
+        max_workers: Optional[int] = None,
+    ) -> FundamentalsTable:
+        """Refresh the fundamentals of many symbols into `fundamentals_table`.
+
+        Only the symbols that are missing from the table, or whose row is older than
+        `ttl` seconds, are fetched. They are sent `MAX_FUNDAMENTALS_SYMBOLS` at a
+        time and the requests for each chunk are run concurrently.
+
+        Args:
+            symbols: Ticker symbols.
+            ttl: The maximum age of a row in seconds.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The session's fundamentals table.
+
+        """
+        chunks = list(
+            chunked(
+                self.fundamentals_table.stale(symbols, ttl), MAX_FUNDAMENTALS_SYMBOLS
+            )
+        )
+        pages = self.get_many(
+            [urls.build_fundamentals_batch(chunk) for chunk in chunks],
+            schema=FundamentalsPaginatorSchema(),
+            max_workers=max_workers,
+        )
+        for chunk, page in zip(chunks, pages):
+            fetched = by_symbol(page)
+            for symbol in chunk:
+                self.fundamentals_table.upsert(symbol, fetched.get(symbol))
+
+        return self.fundamentals_table
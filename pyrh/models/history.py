@@ -0,0 +1,213 @@
+"""A local copy of the order history."""
+
+import json
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+from pyrh import urls
+
+from .base import base_paginator
+from .instrument import InstrumentManager
+from .order import Order, OrderPaginatorSchema, OrderSchema
+
+
+class OrderSyncReport(NamedTuple):
+    """The outcome of an order history sync, as lists of order ids."""
+
+    added: List[str]
+    changed: List[str]
+
+
+class OrderHistoryStore:
+    """A local store of the order history, keyed by order id.
+
+    The first `sync` downloads the whole history, following syncs only fetch the
+    orders updated since the most recent update already stored.
+
+    Examples:
+        >>> store = OrderHistoryStore.load("orders.json")  # xdoctest: +SKIP
+        >>> store.sync(rh)  # xdoctest: +SKIP
+        >>> store.save("orders.json")  # xdoctest: +SKIP
+        >>> store.export(symbol="AAPL", state="filled")  # xdoctest: +SKIP
+
+    """
+
+    def __init__(self) -> None:
+        self.orders: Dict[str, Order] = {}
+        self.symbols: Dict[str, str] = {}
+        self.updated_at: Optional[datetime] = None
+        self._by_date: Optional[List[Order]] = None
+        self._created: List[datetime] = []
+
+    def __len__(self) -> int:
+        """Return the number of orders in the store.
+
+        Returns:
+            The number of orders.
+
+        """
+        return len(self.orders)
+
+    def __iter__(self) -> Iterator[Order]:
+        """Iterate over the orders in the store.
+
+        Returns:
+            An iterator of Orders.
+
+        """
+        return iter(self.orders.values())
+
+    def get(self, id_: str) -> Optional[Order]:
+        """Get an order by id.
+
+        Args:
+            id_: The UUID that represents the order.
+
+        Returns:
+            The order or None if it is not in the store.
+
+        """
+        return self.orders.get(str(id_))
+
+    def symbol(self, order: Order) -> Optional[str]:
+        """Get the ticker symbol an order traded.
+
+        Args:
+            order: An order of the store.
+
+        Returns:
+            The symbol or None if the instrument of the order is unknown.
+
+        """
+        return self.symbols.get(str(order.instrument))
+
+    def sync(
+        self, session_manager: InstrumentManager, max_workers: Optional[int] = None
+    ) -> OrderSyncReport:
+        """Fetch the orders updated since the last sync.
+
+        The symbols of every stored order that has none yet are resolved in the
+        same sync, so a failed lookup is retried by the next sync.
+
+        Args:
+            session_manager: The session used to fetch the orders and instruments.
+            max_workers: The maximum number of instrument requests in flight at once.
+
+        Returns:
+            The added and changed orders.
+
+        """
+        added: List[str] = []
+        changed: List[str] = []
+        for order in base_paginator(
+            urls.build_orders(updated_since=self.updated_at),
+            session_manager,
+            OrderPaginatorSchema(),
+        ):
+            id_ = str(order.id)
+            old = self.orders.get(id_)
+            if old is None:
+                added.append(id_)
+            elif old != order:
+                changed.append(id_)
+            else:
+                continue
+            self.orders[id_] = order
+            if self.updated_at is None or order.updated_at > self.updated_at:
+                self.updated_at = order.updated_at
+
+        unknown = list(
+            dict.fromkeys(
+                str(order.instrument)
+                for order in self.orders.values()
+                if str(order.instrument) not in self.symbols
+            )
+        )
+        instruments = session_manager.instruments_by_url(unknown, max_workers)
+        for url, instrument in zip(unknown, instruments):
+            if instrument is not None:
+                self.symbols[url] = instrument.symbol
+
+        if added or changed:
+            self._by_date = None
+        return OrderSyncReport(added, changed)
+
+    def export(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbol: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> List[Order]:
+        """Select orders without using the network.
+
+        Args:
+            start: Only the orders created at or after this timezone aware time.
+            end: Only the orders created before this timezone aware time.
+            symbol: Only the orders of this ticker symbol.
+            state: Only the orders in this state, such as `filled` or `cancelled`.
+
+        Returns:
+            The matching orders, oldest first.
+
+        """
+        if self._by_date is None:
+            self._by_date = sorted(self.orders.values(), key=lambda o: o.created_at)
+            self._created = [order.created_at for order in self._by_date]
+        orders = self._by_date
+        low = 0 if start is None else bisect_left(self._created, start)
+        high = len(orders) if end is None else bisect_left(self._created, end)
+        selected = orders[low:high]
+
+        if symbol is not None:
+            instrument_urls = {
+                url for url, value in self.symbols.items() if value == symbol.upper()
+            }
+            selected = [o for o in selected if str(o.instrument) in instrument_urls]
+        if state is not None:
+            selected = [o for o in selected if o.state == state]
+        return selected
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Save the store to a json file.
+
+        Args:
+            path: The location to save the file and its name.
+
+        """
+        payload = {
+            "updated_at": None
+            if self.updated_at is None
+            else self.updated_at.isoformat(),
+            "symbols": self.symbols,
+            "results": OrderSchema(many=True).dump(list(self)),
+        }
+        with open(path, "w+") as file:
+            json.dump(payload, file)
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> "OrderHistoryStore":
+        """Load a store saved with `save`.
+
+        Args:
+            path: The location and file name to load from.
+
+        Returns:
+            The loaded store, or an empty store if the file does not exist.
+
+        """
+        store = cls()
+        try:
+            with open(path) as file:
+                payload = json.load(file)
+        except FileNotFoundError:
+            return store
+
+        orders = OrderSchema(many=True).load(payload["results"])
+        store.orders = {str(order.id): order for order in orders}
+        store.symbols = payload.get("symbols", {})
+        if payload.get("updated_at") is not None:
+            store.updated_at = datetime.fromisoformat(payload["updated_at"])
+        return store
@@ -1,8 +1,10 @@
 """Stock Instruments in Robinhood."""
 
-from typing import Iterable, Optional, cast
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from marshmallow import fields
+from yarl import URL
 
 from pyrh import urls
 from pyrh.exceptions import PyrhValueError
@@ -12,31 +14,133 @@ from .base import (
     BasePaginator,
     BasePaginatorSchema,
     BaseSchema,
+    IdentityMap,
+    TTLCache,
     base_paginator,
+    by_symbol,
+    chunked,
+    id_from_url,
 )
-from .sessionmanager import SessionManager
+from .fundamentals import (
+    MAX_FUNDAMENTALS_SYMBOLS,
+    Fundamentals,
+    FundamentalsPaginatorSchema,
+)
+from .market import MarketSchema
+from .quote import QUOTE_TTL, Quote, QuoteManager
+
+INSTRUMENT_TTL: float = 24 * 60 * 60
+"""Number of seconds an instrument stays in the instrument cache."""
+
+TAG_TTL: float = 5 * 60
+"""Number of seconds the instruments of a tag stay cached."""
+
+MAX_INSTRUMENT_IDS: int = 50
+"""The maximum number of instrument ids sent in a single request."""
+
+LINKED_TTLS: Dict[str, float] = {
+    "fundamentals": 60 * 60,
+    "market": 24 * 60 * 60,
+    "quote": QUOTE_TTL,
+    "splits": 24 * 60 * 60,
+}
+"""Number of seconds each linked resource of an instrument stays memoized."""
+
+
+_MISSING = object()
 
 
-# TODO: dream up a good way to not require session to `get_fundamentals` without a
-# Singleton pattern since there could be multiple sessions in the future.
 class Instrument(BaseModel):
-    """A financial instrument."""
+    """A financial instrument.
+
+    Note:
+        Instruments loaded through an `InstrumentManager` are bound to it, so their
+        linked resources are fetched lazily on first access and memoized for their
+        `LINKED_TTLS` seconds. The binding and the memoized values are kept in slots,
+        outside of the repr and of equality checks.
+
+    """
+
+    __slots__ = ("_session", "_linked")
+
+    def bind(self, session_manager: "InstrumentManager") -> "Instrument":
+        """Bind the instrument to a session used to fetch its linked resources.
+
+        Args:
+            session_manager: The session that fetches the linked resources.
+
+        Returns:
+            The instrument itself.
 
-    def get_fundamentals(self):  # type: ignore
-        """TODO."""  # noqa: DAR401
-        raise NotImplementedError()
+        """
+        self._session = session_manager
+        return self
 
-    def get_market(self):  # type: ignore
-        """TODO."""  # noqa: DAR401
-        raise NotImplementedError()
+    def _memoized(self, resource: str) -> Any:
+        linked = getattr(self, "_linked", {})
+        expires_at, value = linked.get(resource, (0.0, _MISSING))
+        return value if expires_at > time.monotonic() else _MISSING
 
-    def get_quote(self):  # type: ignore
-        """TODO."""  # noqa: DAR401
-        raise NotImplementedError()
+    def _memoize(self, resource: str, value: Any, ttl: float) -> None:
+        if getattr(self, "_linked", None) is None:
+            self._linked: Dict[str, Tuple[float, Any]] = {}
+        self._linked[resource] = (time.monotonic() + ttl, value)
 
-    def get_splits(self):  # type: ignore
-        """TODO."""  # noqa: DAR401
-        raise NotImplementedError()
+    def _linked_resource(self, resource: str, refresh: bool) -> Any:
+        session = getattr(self, "_session", None)
+        if session is None:
+            raise PyrhValueError("The instrument is not bound to a session.")
+        return session.hydrate_instruments([self], resource, refresh=refresh)[0]
+
+    def get_fundamentals(self, refresh: bool = False) -> Optional[Fundamentals]:
+        """Get the fundamentals of the instrument.
+
+        Args:
+            refresh: Whether to fetch the fundamentals even if they are memoized.
+
+        Returns:
+            The fundamentals, or None if robinhood has none for the instrument.
+
+        """
+        return cast(
+            Optional[Fundamentals], self._linked_resource("fundamentals", refresh)
+        )
+
+    def get_market(self, refresh: bool = False) -> Any:
+        """Get the market the instrument is listed on.
+
+        Args:
+            refresh: Whether to fetch the market even if it is memoized.
+
+        Returns:
+            The market.
+
+        """
+        return self._linked_resource("market", refresh)
+
+    def get_quote(self, refresh: bool = False) -> Optional[Quote]:
+        """Get the latest quote of the instrument.
+
+        Args:
+            refresh: Whether to fetch the quote even if it is memoized.
+
+        Returns:
+            The quote, or None if robinhood has none for the instrument.
+
+        """
+        return cast(Optional[Quote], self._linked_resource("quote", refresh))
+
+    def get_splits(self, refresh: bool = False) -> List["Split"]:
+        """Get the stock splits of the instrument.
+
+        Args:
+            refresh: Whether to fetch the splits even if they are memoized.
+
+        Returns:
+            The splits across all of their pages.
+
+        """
+        return cast(List[Split], self._linked_resource("splits", refresh))
 
 
 class InstrumentSchema(BaseSchema):
@@ -88,10 +192,46 @@ class InstrumentPaginatorSchema(BasePaginatorSchema):
 
     __model__ = InstrumentPaginator
 
-    results = fields.List(fields.Nested(InstrumentSchema))
+    results = fields.List(fields.Nested(InstrumentSchema, allow_none=True))
+
+
+class Split(BaseModel):
+    """A stock split of an instrument."""
+
+    pass
+
 
+class SplitSchema(BaseSchema):
+    """The Schema for Split objects."""
 
-class InstrumentManager(SessionManager):
+    __model__ = Split
+
+    divisor = fields.Float()
+    execution_date = fields.Date()
+    instrument = fields.URL()
+    multiplier = fields.Float()
+    url = fields.URL()
+
+
+class SplitPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `Split`."""
+
+    pass
+
+
+class SplitPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the SplitPaginator.
+
+    The nested results are of types `Split`.
+
+    """
+
+    __model__ = SplitPaginator
+
+    results = fields.List(fields.Nested(SplitSchema))
+
+
+class InstrumentManager(QuoteManager):
     """Group together methods that manipulate instruments.
 
     Examples:
@@ -99,8 +239,28 @@ class InstrumentManager(SessionManager):
         >>> im.instruments()  # Get all instruments
         >>> im.instrument(symbol="TSLA")  # Get a particular instrument
 
+    Instruments fetched by url are kept in a cache shared by the whole session, see
+    `instruments_by_url`. Every instrument returned is bound to the manager so its
+    linked resources can be fetched lazily, see `hydrate_instruments`.
+
+    Instruments also go through an identity map, so while an instrument is in use
+    anywhere in the session every load of the same id returns that same object,
+    updated in place with the latest values.
+
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._instrument_cache = TTLCache(INSTRUMENT_TTL)
+        self._tag_cache = TTLCache(TAG_TTL)
+        self._instrument_map = IdentityMap()
+
+    def _shared(self, instrument: Instrument) -> Instrument:
+        instrument.bind(self)
+        if getattr(instrument, "id", None) is None:
+            return instrument
+        return self._instrument_map.merge(str(instrument.id), instrument)
+
     def instruments(self, query: Optional[str] = None) -> Iterable[Instrument]:
         """Get a generator of instruments.
 
@@ -109,15 +269,16 @@ class InstrumentManager(SessionManager):
                 restricted to instruments that match the query keyword (single word)
 
         Returns:
-            A generator of Instruments.
+            A generator of Instruments, without the null results robinhood returns
+            for unavailable instruments.
 
         """
-        url = (
-            urls.INSTRUMENTS_BASE
-            if query is not None
-            else urls.instruments(query=query)
+        url = urls.INSTRUMENTS_BASE if query is None else urls.instruments(query=query)
+        return (
+            self._shared(instrument)
+            for instrument in base_paginator(url, self, InstrumentPaginatorSchema())
+            if instrument is not None
         )
-        return base_paginator(url, self, InstrumentPaginatorSchema())
 
     def instrument(
         self, symbol: Optional[str] = None, id_: Optional[str] = None
@@ -141,11 +302,176 @@ class InstrumentManager(SessionManager):
 
         """
         if any(opt is not None for opt in [symbol, id_]):
-            return cast(
-                Instrument,
+            return self._shared(
                 self.get(
-                    urls.instruments(symbol=symbol, id_=id_), schema=InstrumentSchema()
-                ),
+                    urls.instruments(symbol=symbol, id_=id_),
+                    schema=InstrumentSchema(),
+                )
             )
         else:
             raise PyrhValueError("No valid options were provided.")
+
+    def instruments_by_url(
+        self,
+        instrument_urls: Iterable[Union[str, URL]],
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[Instrument]]:
+        """Get many instruments from their urls through the instrument cache.
+
+        Cache misses are fetched `MAX_INSTRUMENT_IDS` at a time from the instruments
+        endpoint and the requests for each chunk are run concurrently.
+
+        Args:
+            instrument_urls: Instrument urls, such as the ones embedded in orders,
+                positions and watchlists.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The instruments in the same order as the urls. Unknown instruments are \
+                None.
+
+        """
+        ids = [id_from_url(url) for url in instrument_urls]
+        missing = list(
+            dict.fromkeys(id_ for id_ in ids if id_ not in self._instrument_cache)
+        )
+
+        pages = self.get_many(
+            [
+                urls.instruments(ids=chunk)
+                for chunk in chunked(missing, MAX_INSTRUMENT_IDS)
+            ],
+            schema=InstrumentPaginatorSchema(),
+            max_workers=max_workers,
+        )
+        fetched = {
+            str(instrument.id): self._shared(instrument)
+            for page in pages
+            for instrument in page
+            if instrument is not None
+        }
+        for id_, instrument in fetched.items():
+            self._instrument_cache.set(id_, instrument)
+
+        return [fetched.get(id_) or self._instrument_cache.get(id_) for id_ in ids]
+
+    def instruments_by_tag(
+        self, tag: str, max_workers: Optional[int] = None
+    ) -> List[Instrument]:
+        """Get the instruments belonging to a tag such as `100-most-popular`.
+
+        Note:
+            The members of a tag are cached for `TAG_TTL` seconds and the instruments
+            themselves go through the instrument cache, so a warm call costs no
+            requests at all.
+
+        Args:
+            tag: The tag to search for.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The instruments of the tag in the order robinhood returns them.
+
+        """
+        instrument_urls = self._tag_cache.get(tag)
+        if instrument_urls is None:
+            instrument_urls = self.get(urls.build_tags(tag))["instruments"]
+            self._tag_cache.set(tag, instrument_urls)
+
+        return [
+            instrument
+            for instrument in self.instruments_by_url(instrument_urls, max_workers)
+            if instrument is not None
+        ]
+
+    def _linked_fundamentals(
+        self, instruments: List[Instrument], max_workers: Optional[int]
+    ) -> List[Any]:
+        chunks = list(
+            chunked(
+                dict.fromkeys(i.symbol for i in instruments), MAX_FUNDAMENTALS_SYMBOLS
+            )
+        )
+        pages = self.get_many(
+            [urls.build_fundamentals_batch(chunk) for chunk in chunks],
+            schema=FundamentalsPaginatorSchema(),
+            max_workers=max_workers,
+        )
+        fetched = by_symbol(result for page in pages for result in page)
+        return [fetched.get(instrument.symbol.upper()) for instrument in instruments]
+
+    def _linked_by_url(
+        self,
+        instruments: List[Instrument],
+        resource: str,
+        max_workers: Optional[int],
+    ) -> List[Any]:
+        schema = SplitPaginatorSchema() if resource == "splits" else MarketSchema()
+        resource_urls = list(
+            dict.fromkeys(str(getattr(i, resource)) for i in instruments)
+        )
+        values = self.get_many(resource_urls, schema=schema, max_workers=max_workers)
+        if resource == "splits":
+            values = [
+                list(page)
+                if page.next is None
+                else list(page) + list(base_paginator(page.next, self, schema))
+                for page in values
+            ]
+        by_url = dict(zip(resource_urls, values))
+        return [by_url[str(getattr(i, resource))] for i in instruments]
+
+    def hydrate_instruments(
+        self,
+        instruments: Iterable[Instrument],
+        resource: str,
+        refresh: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """Fetch a linked resource for many instruments at once.
+
+        Quotes and fundamentals are requested in batches of symbols, markets and
+        splits with one concurrent request per unique url. Values are memoized on each
+        instrument, so only instruments without a fresh value are fetched and a later
+        `Instrument.get_quote` and friends cost no request. Quotes stay memoized until
+        the market opens while it is closed, see `MarketManager.market_ttl`.
+
+        Examples:
+            >>> im.hydrate_instruments(im.instruments_by_tag("etf"), "quote")
+
+        Args:
+            instruments: The instruments to hydrate.
+            resource: One of `fundamentals`, `market`, `quote` or `splits`.
+            refresh: Whether to fetch every value even if it is memoized.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The value of the resource of each instrument, in the same order.
+
+        Raises:
+            PyrhValueError: The resource is not a linked resource of instruments.
+
+        """
+        if resource not in LINKED_TTLS:
+            raise PyrhValueError(f"Unknown linked resource {resource}.")
+
+        instruments = list(instruments)
+        values = [_MISSING if refresh else i._memoized(resource) for i in instruments]
+        stale = [i for i, value in zip(instruments, values) if value is _MISSING]
+        if stale:
+            ttl = LINKED_TTLS[resource]
+            if resource == "quote":
+                ttl = self.market_ttl(ttl)
+                fetched = iter(
+                    self.quotes([i.symbol for i in stale], refresh, max_workers)
+                )
+            elif resource == "fundamentals":
+                fetched = iter(self._linked_fundamentals(stale, max_workers))
+            else:
+                fetched = iter(self._linked_by_url(stale, resource, max_workers))
+            for row, value in enumerate(values):
+                if value is _MISSING:
+                    values[row] = next(fetched)
+                    instruments[row]._memoize(resource, values[row], ttl)
+
+        return values
@@ -0,0 +1,241 @@
+"""Timing of the stages of an order, from its preparation to its fill."""
+
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+ORDER_STAGES = (
+    "started",
+    "account",
+    "instrument",
+    "quote",
+    "submitted",
+    "acknowledged",
+    "confirmed",
+    "filled",
+)
+"""The stages of an order in the order they happen. The `instrument` and `quote`
+lookups are skipped by orders that do not need them."""
+
+TIME_TO_FILL = "time_to_fill"
+"""The histogram of the seconds between the submission and the fill of orders."""
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+"""The upper bounds, in seconds, of the histogram buckets."""
+
+MAX_TIMINGS = 10_000
+"""Number of orders whose timestamps are kept, the oldest are dropped first."""
+
+
+class LatencySample(NamedTuple):
+    """One stage reached by one order.
+
+    Attributes:
+        key: The `ref_id` of the order, or its id when it has no `ref_id`.
+        stage: One of `ORDER_STAGES`.
+        at: The `time.monotonic` timestamp the stage was reached at.
+        duration: The seconds since the previous stage of the order.
+
+    """
+
+    key: str
+    stage: str
+    at: float
+    duration: float
+
+
+LatencyCallback = Callable[[LatencySample], None]
+
+
+class LatencyHistogram:
+    """A fixed bucket histogram of durations.
+
+    Args:
+        buckets: The increasing upper bounds of the buckets, in seconds. Longer
+            durations go to an overflow bucket.
+
+    """
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        """Record a duration.
+
+        Args:
+            duration: A number of seconds.
+
+        """
+        self.counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    @property
+    def mean(self) -> float:
+        """Get the mean duration.
+
+        Returns:
+            The mean in seconds, 0 if nothing was recorded.
+
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile from the buckets.
+
+        Args:
+            percent: The percentile, between 0 and 100.
+
+        Returns:
+            The upper bound of the bucket that holds the percentile, or the largest
+            duration if it is in the overflow bucket.
+
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class OrderTiming:
+    """The timestamps of the stages one order reached.
+
+    Args:
+        key: The `ref_id` of the order.
+
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.stages: Dict[str, float] = {}
+        self.last: Optional[float] = None
+
+    def between(self, start: str, end: str) -> Optional[float]:
+        """Get the number of seconds between two stages.
+
+        Args:
+            start: The earlier stage.
+            end: The later stage.
+
+        Returns:
+            The duration or None if the order did not reach both stages.
+
+        """
+        if start not in self.stages or end not in self.stages:
+            return None
+        return self.stages[end] - self.stages[start]
+
+
+class LatencyRecorder:
+    """Record when orders reach each of the `ORDER_STAGES`.
+
+    Every stage reached adds the time since the previous stage of the order to the
+    histogram of the stage, so `histograms["acknowledged"]` holds the round trip of
+    the order POST. Fills also add the time since submission to `TIME_TO_FILL`.
+
+    Note:
+        `confirmed` and `filled` are recorded when an `OpenOrderTracker` sees the
+        change, so their resolution is the polling interval.
+
+    Examples:
+        >>> recorder = LatencyRecorder(callback=print)
+        >>> rh = Robinhood(latency_recorder=recorder)  # xdoctest: +SKIP
+        >>> rh.order("AAPL", 1, "buy")  # xdoctest: +SKIP
+        >>> recorder.histograms["acknowledged"].percentile(99)  # xdoctest: +SKIP
+
+    Args:
+        callback: Called with a `LatencySample` every time an order reaches a stage.
+        buckets: The bucket bounds of the histograms.
+        max_timings: The number of orders whose timestamps are kept.
+
+    """
+
+    def __init__(
+        self,
+        callback: Optional[LatencyCallback] = None,
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+        max_timings: int = MAX_TIMINGS,
+    ) -> None:
+        self.callback = callback
+        self.buckets = tuple(buckets)
+        self.max_timings = max_timings
+        self.timings: "OrderedDict[str, OrderTiming]" = OrderedDict()
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram(self.buckets)
+        return histogram
+
+    def mark(
+        self, keys: Iterable[str], stage: str, tracked_only: bool = False
+    ) -> List[LatencySample]:
+        """Record that orders reached a stage now.
+
+        A stage that an order already reached is not recorded again.
+
+        Args:
+            keys: The `ref_id` of each order.
+            stage: One of `ORDER_STAGES`.
+            tracked_only: Whether to ignore the orders that have no timing yet, such
+                as orders placed by another client.
+
+        Returns:
+            The recorded samples.
+
+        """
+        now = time.monotonic()
+        samples = []
+        with self._lock:
+            for key in keys:
+                timing = self.timings.get(key)
+                if timing is None and tracked_only:
+                    continue
+                if timing is None:
+                    timing = self.timings[key] = OrderTiming(key)
+                    while len(self.timings) > self.max_timings:
+                        self.timings.popitem(last=False)
+                if stage in timing.stages:
+                    continue
+                duration = 0.0 if timing.last is None else now - timing.last
+                timing.stages[stage] = timing.last = now
+                self._histogram(stage).add(duration)
+                if stage == "filled" and "submitted" in timing.stages:
+                    self._histogram(TIME_TO_FILL).add(now - timing.stages["submitted"])
+                samples.append(LatencySample(key, stage, now, duration))
+
+        if self.callback is not None:
+            for sample in samples:
+                self.callback(sample)
+        return samples
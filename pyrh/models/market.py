@@ -0,0 +1,286 @@
+"""Markets and their trading hours."""
+
+from datetime import date as date_
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple, Union, cast
+
+import pytz
+import requests
+from marshmallow import fields
+from yarl import URL
+
+from pyrh import urls
+from pyrh.exceptions import PyrhValueError
+
+from .base import (
+    BaseModel,
+    BasePaginator,
+    BasePaginatorSchema,
+    BaseSchema,
+    TTLCache,
+    base_paginator,
+)
+from .sessionmanager import SessionManager
+
+DEFAULT_MARKET: str = "XNAS"
+"""The market identifier code used when none is given, NASDAQ."""
+
+MARKET_TZ = pytz.timezone("US/Eastern")
+"""The timezone that the trading days of robinhood's markets are counted in."""
+
+HOURS_TTL: float = 24 * 60 * 60
+"""Number of seconds the hours of a trading day stay cached."""
+
+MAX_CLOSED_DAYS: int = 14
+"""The maximum number of consecutive closed days searched for the next open."""
+
+
+def _now() -> datetime:
+    return datetime.now(tz=pytz.UTC)
+
+
+class Market(BaseModel):
+    """An exchange that instruments are listed on."""
+
+    pass
+
+
+class MarketSchema(BaseSchema):
+    """The Schema for Market objects."""
+
+    __model__ = Market
+
+    acronym = fields.Str()
+    city = fields.Str()
+    country = fields.Str()
+    mic = fields.Str()
+    name = fields.Str()
+    operating_mic = fields.Str()
+    timezone = fields.Str()
+    todays_hours = fields.URL()
+    url = fields.URL()
+    website = fields.Str(allow_none=True)
+
+
+class MarketPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `Market`."""
+
+    pass
+
+
+class MarketPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the MarketPaginator.
+
+    The nested results are of types `Market`.
+
+    """
+
+    __model__ = MarketPaginator
+
+    results = fields.List(fields.Nested(MarketSchema))
+
+
+class MarketHours(BaseModel):
+    """The trading hours of a market on a single day."""
+
+    def session_bounds(
+        self, extended: bool = False
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """Get the start and end of the trading session.
+
+        Args:
+            extended: Whether to include the extended hours.
+
+        Returns:
+            The opening and closing times, or None if the market is closed all day.
+
+        """
+        if not self.is_open:
+            return None
+        if extended:
+            return (
+                getattr(self, "extended_opens_at", None) or self.opens_at,
+                getattr(self, "extended_closes_at", None) or self.closes_at,
+            )
+        return self.opens_at, self.closes_at
+
+
+class MarketHoursSchema(BaseSchema):
+    """The Schema for MarketHours objects."""
+
+    __model__ = MarketHours
+
+    closes_at = fields.AwareDateTime(allow_none=True)
+    date = fields.Date()
+    extended_closes_at = fields.AwareDateTime(allow_none=True)
+    extended_opens_at = fields.AwareDateTime(allow_none=True)
+    is_open = fields.Boolean()
+    next_open_hours = fields.URL()
+    opens_at = fields.AwareDateTime(allow_none=True)
+    previous_open_hours = fields.URL()
+
+
+class MarketManager(SessionManager):
+    """Group together methods that read markets and their trading hours.
+
+    The hours of a trading day are cached for `HOURS_TTL` seconds, so checking
+    whether a market is open usually costs no request.
+
+    Examples:
+        >>> mm = MarketManager()
+        >>> mm.is_market_open()  # Whether NASDAQ is open right now
+        >>> mm.next_open("XNYS", extended=True)  # When NYSE opens next
+        >>> mm.market_ttl(15)  # 15 seconds while open, until the next open otherwise
+
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._hours_cache = TTLCache(HOURS_TTL)
+        self._sessions: Dict[Tuple[str, bool], Tuple[datetime, datetime, datetime]] = {}
+
+    def markets(self) -> Iterable[Market]:
+        """Get a generator of the markets.
+
+        Returns:
+            A generator of Markets.
+
+        """
+        return base_paginator(urls.MARKETS, self, MarketPaginatorSchema())
+
+    def _hours(self, url: Union[str, URL]) -> MarketHours:
+        hours = self._hours_cache.get(str(url))
+        if hours is None:
+            hours = self.get(url, schema=MarketHoursSchema())
+            self._hours_cache.set(str(url), hours)
+        return cast(MarketHours, hours)
+
+    def market_hours(
+        self, mic: str = DEFAULT_MARKET, date: Optional[date_] = None
+    ) -> MarketHours:
+        """Get the trading hours of a market on a single day.
+
+        Args:
+            mic: The market identifier code of the market.
+            date: The trading day, defaults to today in `MARKET_TZ`.
+
+        Returns:
+            The hours of the market on that day.
+
+        """
+        date = _now().astimezone(MARKET_TZ).date() if date is None else date
+        return self._hours(urls.build_market_hours(mic, date.isoformat()))
+
+    def next_open(
+        self,
+        mic: str = DEFAULT_MARKET,
+        extended: bool = False,
+        now: Optional[datetime] = None,
+    ) -> datetime:
+        """Get the time the market is next open.
+
+        Args:
+            mic: The market identifier code of the market.
+            extended: Whether the extended hours count as open.
+            now: The time to search from, defaults to the current time.
+
+        Returns:
+            `now` if the market is open, otherwise the time it next opens.
+
+        Raises:
+            PyrhValueError: The market is closed for more than `MAX_CLOSED_DAYS` days.
+
+        """
+        now = _now() if now is None else now
+        return max(now, self._next_session(mic, extended, now)[0])
+
+    def _cached_session(
+        self, mic: str, extended: bool, now: datetime
+    ) -> Optional[Tuple[datetime, datetime]]:
+        cached = self._sessions.get((mic, extended))
+        # cached as (checked_at, opens_at, closes_at), the session that follows
+        # `checked_at` is also the next one at any later time until it closes
+        if cached is not None and cached[0] <= now < cached[2]:
+            return cached[1], cached[2]
+        return None
+
+    def _next_session(
+        self, mic: str, extended: bool, now: datetime
+    ) -> Tuple[datetime, datetime]:
+        key = (mic, extended)
+        cached = self._cached_session(mic, extended, now)
+        if cached is not None:
+            return cached
+
+        hours = self.market_hours(mic, now.astimezone(MARKET_TZ).date())
+        for _ in range(MAX_CLOSED_DAYS):
+            bounds = hours.session_bounds(extended)
+            if bounds is not None and now < bounds[1]:
+                self._sessions[key] = (now, *bounds)
+                return bounds
+            hours = self._hours(hours.next_open_hours)
+        raise PyrhValueError(f"{mic} is not open in the next {MAX_CLOSED_DAYS} days.")
+
+    def is_market_open(
+        self,
+        mic: str = DEFAULT_MARKET,
+        extended: bool = False,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """Check whether a market is open.
+
+        Args:
+            mic: The market identifier code of the market.
+            extended: Whether the extended hours count as open.
+            now: The time to check, defaults to the current time.
+
+        Returns:
+            Whether the market is open.
+
+        """
+        now = _now() if now is None else now
+        bounds = self.market_hours(
+            mic, now.astimezone(MARKET_TZ).date()
+        ).session_bounds(extended)
+        return bounds is not None and bounds[0] <= now < bounds[1]
+
+    def market_ttl(
+        self,
+        ttl: float,
+        mic: str = DEFAULT_MARKET,
+        extended: bool = True,
+        now: Optional[datetime] = None,
+        cached: bool = False,
+    ) -> float:
+        """Stretch the time to live of market data while the market is closed.
+
+        Note:
+            The next session is computed once and reused until it closes, and `ttl`
+            is returned as is when the market hours cannot be fetched.
+
+        Args:
+            ttl: The number of seconds market data stays valid while the market is
+                open.
+            mic: The market identifier code of the market.
+            extended: Whether the extended hours count as open.
+            now: The time to compute the ttl at, defaults to the current time.
+            cached: Whether to only use the next session if it is already cached,
+                so that no market hours are fetched. `ttl` is returned otherwise.
+
+        Returns:
+            `ttl` while the market is open, otherwise the number of seconds until the
+            market opens if that is longer.
+
+        """
+        now = _now() if now is None else now
+        try:
+            session = (
+                self._cached_session(mic, extended, now)
+                if cached
+                else self._next_session(mic, extended, now)
+            )
+        except (requests.RequestException, PyrhValueError):
+            return ttl
+        if session is None:
+            return ttl
+        return max(ttl, (session[0] - now).total_seconds())
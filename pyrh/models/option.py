@@ -0,0 +1,487 @@
+"""Options contracts and their market data."""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from marshmallow import fields, validate
+
+from pyrh import urls
+from pyrh.exceptions import PyrhValueError
+
+from .base import (
+    BaseModel,
+    BasePaginator,
+    BasePaginatorSchema,
+    BaseSchema,
+    base_paginator,
+    chunked,
+    id_from_url,
+)
+from .instrument import InstrumentManager
+
+MAX_OPTION_IDS: int = 50
+"""The maximum number of option ids sent in a single market data request."""
+
+STRIKE_TOLERANCE: float = 1e-6
+"""The tolerance used when matching an exact strike price."""
+
+OPTION_TYPE_VAL = validate.OneOf(["call", "put"])
+
+DateLike = Union[date, str]
+
+
+def _as_date(value: DateLike) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+class OptionInstrument(BaseModel):
+    """An options contract.
+
+    Note:
+        Contracts loaded through an `OptionChain` also have a `market_data`
+        attribute which is either an `OptionMarketData` or None.
+
+    """
+
+    pass
+
+
+class OptionInstrumentSchema(BaseSchema):
+    """The Schema for OptionInstrument objects."""
+
+    __model__ = OptionInstrument
+
+    chain_id = fields.Str()
+    chain_symbol = fields.Str()
+    created_at = fields.AwareDateTime()
+    expiration_date = fields.Date()
+    id = fields.UUID()
+    issue_date = fields.Date()
+    rhs_tradability = fields.Str()
+    state = fields.Str()
+    strike_price = fields.Float()
+    tradability = fields.Str()
+    type = fields.Str(validate=OPTION_TYPE_VAL)
+    updated_at = fields.AwareDateTime()
+    url = fields.URL()
+
+
+class OptionInstrumentPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `OptionInstrument`."""
+
+    pass
+
+
+class OptionInstrumentPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the OptionInstrumentPaginator.
+
+    The nested results are of types `OptionInstrument`.
+
+    """
+
+    __model__ = OptionInstrumentPaginator
+
+    results = fields.List(fields.Nested(OptionInstrumentSchema))
+
+
+class OptionMarketData(BaseModel):
+    """Market data for a single options contract."""
+
+    pass
+
+
+class OptionMarketDataSchema(BaseSchema):
+    """The Schema for OptionMarketData objects."""
+
+    __model__ = OptionMarketData
+
+    adjusted_mark_price = fields.Float(allow_none=True)
+    ask_price = fields.Float(allow_none=True)
+    ask_size = fields.Int(allow_none=True)
+    bid_price = fields.Float(allow_none=True)
+    bid_size = fields.Int(allow_none=True)
+    break_even_price = fields.Float(allow_none=True)
+    high_price = fields.Float(allow_none=True)
+    instrument = fields.URL()
+    last_trade_price = fields.Float(allow_none=True)
+    last_trade_size = fields.Int(allow_none=True)
+    low_price = fields.Float(allow_none=True)
+    mark_price = fields.Float(allow_none=True)
+    open_interest = fields.Int(allow_none=True)
+    previous_close_price = fields.Float(allow_none=True)
+    volume = fields.Int(allow_none=True)
+    chance_of_profit_long = fields.Float(allow_none=True)
+    chance_of_profit_short = fields.Float(allow_none=True)
+    delta = fields.Float(allow_none=True)
+    gamma = fields.Float(allow_none=True)
+    implied_volatility = fields.Float(allow_none=True)
+    rho = fields.Float(allow_none=True)
+    theta = fields.Float(allow_none=True)
+    vega = fields.Float(allow_none=True)
+
+
+class OptionMarketDataPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `OptionMarketData`."""
+
+    pass
+
+
+class OptionMarketDataPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the OptionMarketDataPaginator.
+
+    The nested results are of types `OptionMarketData`. Ids that are unknown to
+    robinhood come back as None.
+
+    """
+
+    __model__ = OptionMarketDataPaginator
+
+    results = fields.List(fields.Nested(OptionMarketDataSchema, allow_none=True))
+
+
+class OptionChain:
+    """An options chain loaded once and indexed by (expiry, type, strike).
+
+    Lookups never go back to the API. Market data is only fetched through
+    `refresh`, and only for the contracts that are asked about.
+
+    Examples:
+        >>> chain = om.option_chain("TSLA")  # xdoctest: +SKIP
+        >>> chain.nearest("2020-06-19", "call", 752.5)  # xdoctest: +SKIP
+        >>> calls = chain.strike_range("2020-06-19", "call", 700, 800)  # xdoctest: +SKIP
+        >>> chain.refresh(calls)  # xdoctest: +SKIP
+
+    Args:
+        symbol: The ticker symbol of the underlying equity.
+        chain_id: The id of the options chain.
+        contracts: The contracts in the chain.
+        session_manager: The manager used to fetch market data on `refresh`.
+
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        chain_id: str,
+        contracts: Iterable[OptionInstrument],
+        session_manager: Optional["OptionManager"] = None,
+    ) -> None:
+        self.symbol = symbol
+        self.chain_id = chain_id
+        self.session_manager = session_manager
+        # (expiry, type) -> (sorted strikes, contracts in the same order)
+        self._index: Dict[
+            Tuple[date, str], Tuple[List[float], List[OptionInstrument]]
+        ] = {}
+
+        for contract in sorted(
+            contracts, key=lambda c: (c.expiration_date, c.type, c.strike_price)
+        ):
+            if not hasattr(contract, "market_data"):
+                contract.market_data = None
+            strikes, by_strike = self._index.setdefault(
+                (contract.expiration_date, contract.type), ([], [])
+            )
+            strikes.append(contract.strike_price)
+            by_strike.append(contract)
+
+    def __len__(self) -> int:
+        """Return the number of contracts in the chain.
+
+        Returns:
+            The number of contracts.
+
+        """
+        return sum(len(strikes) for strikes, _ in self._index.values())
+
+    def __iter__(self) -> Iterator[OptionInstrument]:
+        """Iterate over the contracts sorted by expiry, type and strike.
+
+        Yields:
+            Every contract in the chain.
+
+        """
+        for key in sorted(self._index):
+            yield from self._index[key][1]
+
+    @property
+    def expirations(self) -> List[date]:
+        """Get the expiration dates in the chain.
+
+        Returns:
+            The sorted expiration dates.
+
+        """
+        return sorted({expiry for expiry, _ in self._index})
+
+    def _strikes(
+        self, expiry: DateLike, option_type: str
+    ) -> Tuple[List[float], List[OptionInstrument]]:
+        return self._index.get((_as_date(expiry), option_type), ([], []))
+
+    def get(
+        self, expiry: DateLike, option_type: str, strike: float
+    ) -> Optional[OptionInstrument]:
+        """Get the contract with an exact strike price.
+
+        Args:
+            expiry: The expiration date as a date or YYYY-MM-DD string.
+            option_type: Either 'call' or 'put'.
+            strike: The strike price.
+
+        Returns:
+            The contract or None if there is no contract at that strike.
+
+        """
+        contract = self.nearest(expiry, option_type, strike)
+        if contract is None or abs(contract.strike_price - strike) > STRIKE_TOLERANCE:
+            return None
+        return contract
+
+    def nearest(
+        self, expiry: DateLike, option_type: str, strike: float
+    ) -> Optional[OptionInstrument]:
+        """Get the contract with the strike price closest to `strike`.
+
+        Note:
+            Ties are resolved in favor of the lower strike.
+
+        Args:
+            expiry: The expiration date as a date or YYYY-MM-DD string.
+            option_type: Either 'call' or 'put'.
+            strike: The target strike price.
+
+        Returns:
+            The closest contract or None if nothing trades at that expiry.
+
+        """
+        strikes, contracts = self._strikes(expiry, option_type)
+        if not strikes:
+            return None
+        pos = bisect_left(strikes, strike)
+        if pos == len(strikes):
+            return contracts[-1]
+        if pos > 0 and strike - strikes[pos - 1] <= strikes[pos] - strike:
+            return contracts[pos - 1]
+        return contracts[pos]
+
+    def strike_range(
+        self, expiry: DateLike, option_type: str, low: float, high: float
+    ) -> List[OptionInstrument]:
+        """Get the contracts with a strike price between `low` and `high` inclusive.
+
+        Args:
+            expiry: The expiration date as a date or YYYY-MM-DD string.
+            option_type: Either 'call' or 'put'.
+            low: The lowest strike price.
+            high: The highest strike price.
+
+        Returns:
+            The matching contracts sorted by strike price.
+
+        """
+        strikes, contracts = self._strikes(expiry, option_type)
+        return contracts[bisect_left(strikes, low) : bisect_right(strikes, high)]
+
+    def by_expiry(self) -> Dict[date, List[OptionInstrument]]:
+        """Group the contracts by expiration date.
+
+        Returns:
+            A dictionary of expiration date to contracts sorted by type and strike.
+
+        """
+        chain: Dict[date, List[OptionInstrument]] = {}
+        for contract in self:
+            chain.setdefault(contract.expiration_date, []).append(contract)
+        return chain
+
+    def refresh(
+        self,
+        contracts: Optional[Iterable[OptionInstrument]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, OptionMarketData]:
+        """Fetch the market data of some of the contracts in the chain.
+
+        Args:
+            contracts: The contracts to update, every contract in the chain if
+                omitted.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            A dictionary of option id to its fresh market data.
+
+        Raises:
+            PyrhValueError: The chain is not bound to a session manager.
+
+        """
+        if self.session_manager is None:
+            raise PyrhValueError("The chain needs a session manager to refresh.")
+        contracts = list(self if contracts is None else contracts)
+        market_data = self.session_manager.option_market_data(
+            contracts, max_workers=max_workers
+        )
+        for contract in contracts:
+            contract.market_data = market_data.get(str(contract.id))
+        return market_data
+
+    def __repr__(self) -> str:
+        """Return the object as a string.
+
+        Returns:
+            The string representation of the object.
+
+        """
+        return f"OptionChain<{self.symbol}: {len(self)} contracts>"
+
+
+class OptionManager(InstrumentManager):
+    """Group together methods that load options chains.
+
+    Examples:
+        >>> om = OptionManager()
+        >>> om.load_option_chain("TSLA", ["2020-06-19"])  # Contracts by expiry
+
+    """
+
+    def option_chain_id(self, symbol: str) -> str:
+        """Get the id of the tradable options chain of an equity.
+
+        Args:
+            symbol: A ticker symbol
+
+        Returns:
+            The id of the options chain.
+
+        Raises:
+            PyrhValueError: The symbol does not have a tradable options chain.
+
+        """
+        chain_id = getattr(self.instrument(symbol=symbol), "tradable_chain_id", None)
+        if chain_id is None:
+            raise PyrhValueError(f"{symbol} does not have a tradable options chain.")
+        return str(chain_id)
+
+    def option_contracts(
+        self,
+        chain_id: str,
+        expiration_dates: Optional[Iterable[str]] = None,
+        option_type: Optional[str] = None,
+    ) -> Iterable[OptionInstrument]:
+        """Get a generator of the tradable contracts in an options chain.
+
+        Args:
+            chain_id: The id for a particular options chain.
+            expiration_dates: The expiration dates (YYYY-MM-DD) to restrict to.
+            option_type: Either 'call' or 'put', both are returned if omitted.
+
+        Returns:
+            A generator of OptionInstruments.
+
+        """
+        url = urls.build_option_instruments(chain_id, expiration_dates, option_type)
+        return base_paginator(url, self, OptionInstrumentPaginatorSchema())
+
+    def option_market_data(
+        self,
+        contracts: Iterable[Union[OptionInstrument, str]],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, OptionMarketData]:
+        """Get the market data of many option contracts.
+
+        The ids are sent `MAX_OPTION_IDS` at a time and the requests for each chunk
+        are run concurrently.
+
+        Args:
+            contracts: OptionInstruments or option ids.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            A dictionary of option id to its market data. Ids without market data are
+            omitted.
+
+        """
+        option_ids = list(
+            dict.fromkeys(
+                c if isinstance(c, str) else str(c.id) for c in contracts
+            )  # dedupe but keep the ordering
+        )
+        pages = self.get_many(
+            [
+                urls.build_option_market_data(chunk)
+                for chunk in chunked(option_ids, MAX_OPTION_IDS)
+            ],
+            schema=OptionMarketDataPaginatorSchema(),
+            max_workers=max_workers,
+        )
+        return {
+            id_from_url(data.instrument): data
+            for page in pages
+            for data in page
+            if data is not None
+        }
+
+    def option_chain(
+        self,
+        symbol: str,
+        expiration_dates: Optional[Iterable[str]] = None,
+        option_type: Optional[str] = None,
+        market_data: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> OptionChain:
+        """Load an indexed options chain.
+
+        Args:
+            symbol: A ticker symbol
+            expiration_dates: The expiration dates (YYYY-MM-DD) to restrict to.
+            option_type: Either 'call' or 'put', both are returned if omitted.
+            market_data: Whether to also fetch the market data of every contract.
+            max_workers: The maximum number of market data requests in flight at once.
+
+        Returns:
+            An `OptionChain` bound to this manager.
+
+        """
+        chain_id = self.option_chain_id(symbol)
+        chain = OptionChain(
+            symbol,
+            chain_id,
+            self.option_contracts(chain_id, expiration_dates, option_type),
+            session_manager=self,
+        )
+        if market_data:
+            chain.refresh(max_workers=max_workers)
+        return chain
+
+    def load_option_chain(
+        self,
+        symbol: str,
+        expiration_dates: Optional[Iterable[str]] = None,
+        option_type: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[date, List[OptionInstrument]]:
+        """Load the contracts of an options chain joined with their market data.
+
+        Note:
+            This costs a single instrument lookup, one request per page of contracts
+            and one request per `MAX_OPTION_IDS` contracts of market data instead of
+            a request for every contract.
+
+        Args:
+            symbol: A ticker symbol
+            expiration_dates: The expiration dates (YYYY-MM-DD) to restrict to.
+            option_type: Either 'call' or 'put', both are returned if omitted.
+            max_workers: The maximum number of market data requests in flight at once.
+
+        Returns:
+            A dictionary of expiration date to the contracts of that expiry sorted by
+            type and strike price. Each contract has its `market_data` attribute set.
+
+        """
+        return self.option_chain(
+            symbol,
+            expiration_dates,
+            option_type,
+            market_data=True,
+            max_workers=max_workers,
+        ).by_expiry()
@@ -0,0 +1,818 @@
+"""Stock orders."""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import pytz
+import requests
+from marshmallow import fields, validate
+from yarl import URL
+
+from pyrh import urls
+from pyrh.exceptions import PyrhValueError
+
+from .base import (
+    JSON,
+    BaseModel,
+    BasePaginator,
+    BasePaginatorSchema,
+    BaseSchema,
+    TTLCache,
+    base_paginator,
+)
+from .instrument import INSTRUMENT_TTL, Instrument, InstrumentManager, InstrumentSchema
+from .latency import LatencyRecorder
+from .quote import Quote
+from .sessionmanager import MAX_WORKERS
+
+ORDER_SIDES = ("buy", "sell")
+ORDER_TYPES = ("market", "limit")
+ORDER_TRIGGERS = ("immediate", "stop")
+ORDER_TIME_IN_FORCE = ("gfd", "gtc", "ioc", "opg")
+
+ORDER_SIDE_VAL = validate.OneOf(ORDER_SIDES)
+ORDER_TYPE_VAL = validate.OneOf(ORDER_TYPES)
+ORDER_TRIGGER_VAL = validate.OneOf(ORDER_TRIGGERS)
+
+OPEN_ORDER_STATES = frozenset(
+    ("queued", "unconfirmed", "confirmed", "partially_filled")
+)
+"""The states of an order that can still fill or be cancelled."""
+
+ORDER_EVENTS = ("new", "fill", "state")
+"""The kinds of `OrderEvent`."""
+
+LATENCY_STATES = ("confirmed", "filled")
+"""The order states recorded by the `latency_recorder` of a session."""
+
+CANCEL_OUTCOMES = ("cancelled", "not_cancellable", "failed")
+"""The outcomes of `CancelResult`."""
+
+ORDER_RETRIES = 2
+"""Number of times an order is resubmitted after an ambiguous failure."""
+
+ORDER_RETRY_DELAY: float = 0.5
+"""Number of seconds before the first retry, doubled on every retry."""
+
+REF_ID_WINDOW = timedelta(minutes=5)
+"""How far back, to allow for clock skew, orders are searched for a `ref_id`."""
+
+
+class Order(BaseModel):
+    """A stock order."""
+
+    pass
+
+
+class OrderSchema(BaseSchema):
+    """The Schema for Order objects."""
+
+    __model__ = Order
+
+    account = fields.URL()
+    average_price = fields.Float(allow_none=True)
+    cancel = fields.URL(allow_none=True)
+    created_at = fields.AwareDateTime()
+    cumulative_quantity = fields.Float()
+    executions = fields.List(fields.Dict())
+    extended_hours = fields.Boolean()
+    fees = fields.Float()
+    id = fields.UUID()
+    instrument = fields.URL()
+    last_transaction_at = fields.AwareDateTime(allow_none=True)
+    position = fields.URL()
+    price = fields.Float(allow_none=True)
+    quantity = fields.Float()
+    ref_id = fields.Str(allow_none=True)
+    reject_reason = fields.Str(allow_none=True)
+    side = fields.Str(validate=ORDER_SIDE_VAL)
+    state = fields.Str()
+    stop_price = fields.Float(allow_none=True)
+    time_in_force = fields.Str()
+    trigger = fields.Str(validate=ORDER_TRIGGER_VAL)
+    type = fields.Str(validate=ORDER_TYPE_VAL)
+    updated_at = fields.AwareDateTime()
+    url = fields.URL()
+
+
+class OrderPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `Order`."""
+
+    pass
+
+
+class OrderPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the OrderPaginator.
+
+    The nested results are of types `Order`.
+
+    """
+
+    __model__ = OrderPaginator
+
+    results = fields.List(fields.Nested(OrderSchema))
+
+
+def _check(condition: bool, message: str) -> None:
+    if not condition:
+        raise PyrhValueError(message)
+
+
+def _quote_price(quote: Optional[Quote], symbol: str, side: str) -> float:
+    if quote is None:
+        raise PyrhValueError(f"No quote for {symbol} to price the order.")
+    price = quote.ask_price if side == "buy" else quote.bid_price
+    return cast(float, price or quote.last_trade_price)
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _map_concurrently(
+    func: Callable[[T], R], items: List[T], max_workers: Optional[int]
+) -> List[R]:
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    workers = min(MAX_WORKERS if max_workers is None else max_workers, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _is_ambiguous(error: Exception) -> bool:
+    """Check whether a failed POST may still have reached robinhood."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def validate_order(
+    symbol: str,
+    quantity: float,
+    side: str,
+    order_type: str = "market",
+    trigger: str = "immediate",
+    time_in_force: str = "gfd",
+    price: Optional[float] = None,
+    stop_price: Optional[float] = None,
+    instrument_url: Optional[Union[str, URL]] = None,
+    ref_id: Optional[str] = None,
+) -> JSON:
+    """Validate an order without using the network.
+
+    Args:
+        symbol: The ticker symbol to trade.
+        quantity: The number of shares.
+        side: Either `buy` or `sell`.
+        order_type: Either `market` or `limit`.
+        trigger: Either `immediate` or `stop`.
+        time_in_force: One of `gfd`, `gtc`, `ioc` or `opg`.
+        price: The limit price, required for limit orders.
+        stop_price: The stop price, required for stop orders.
+        instrument_url: The url of the instrument.
+        ref_id: The client reference id robinhood uses to tell resubmissions of an
+            order apart from new orders, a random UUID by default.
+
+    Returns:
+        The normalized order payload. The `account`, and the `instrument` and \
+            `price` when they were not given, are None until the order is prepared.
+
+    Raises:
+        PyrhValueError: The order is invalid.
+
+    """
+    symbol, side = symbol.upper(), side.lower()
+    order_type, trigger = order_type.lower(), trigger.lower()
+    time_in_force = time_in_force.lower()
+
+    _check(side in ORDER_SIDES, f"Invalid side {side}.")
+    _check(order_type in ORDER_TYPES, f"Invalid order type {order_type}.")
+    _check(trigger in ORDER_TRIGGERS, f"Invalid trigger {trigger}.")
+    _check(
+        time_in_force in ORDER_TIME_IN_FORCE,
+        f"Invalid time in force {time_in_force}.",
+    )
+    _check(quantity is not None and quantity > 0, "Quantity must be positive.")
+    if order_type == "limit":
+        _check(price is not None, "Limit orders require a price.")
+    if price is not None:
+        _check(price > 0, "Price must be positive.")
+    if trigger == "stop":
+        _check(stop_price is not None, "Stop orders require a stop price.")
+    if stop_price is not None:
+        _check(trigger == "stop", "Only stop orders take a stop price.")
+        _check(stop_price > 0, "Stop price must be positive.")
+
+    payload = {
+        "account": None,
+        "instrument": None if instrument_url is None else str(instrument_url),
+        "symbol": symbol,
+        "type": order_type,
+        "time_in_force": time_in_force,
+        "trigger": trigger,
+        "price": price,
+        "quantity": quantity,
+        "side": side,
+        "ref_id": str(uuid.uuid4()) if ref_id is None else ref_id,
+    }
+    if stop_price is not None:
+        payload["stop_price"] = stop_price
+    return payload
+
+
+class OrderResult(NamedTuple):
+    """The outcome of one order of a basket.
+
+    Attributes:
+        position: The position of the order in the basket.
+        payload: The submitted payload.
+        order: The order as accepted by robinhood, None if it failed.
+        error: The exception raised while submitting, None if it succeeded.
+
+    """
+
+    position: int
+    payload: JSON
+    order: Optional[Order] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the order was accepted."""
+        return self.error is None
+
+
+class CancelResult(NamedTuple):
+    """The outcome of cancelling one order.
+
+    Attributes:
+        order_id: The id of the order.
+        outcome: `cancelled`, `not_cancellable` when the order has no cancel link
+            because it is no longer open, or `failed`.
+        response: The JSON response of the cancel request.
+        error: The exception raised while cancelling, None unless it failed.
+
+    """
+
+    order_id: Optional[str]
+    outcome: str
+    response: Optional[JSON] = None
+    error: Optional[Exception] = None
+
+
+class BasketResult(NamedTuple):
+    """The outcomes of a basket of orders, split by success.
+
+    Attributes:
+        succeeded: The accepted orders, in basket order.
+        failed: The orders that could not be submitted, in basket order.
+
+    """
+
+    succeeded: List[OrderResult]
+    failed: List[OrderResult]
+
+    @property
+    def results(self) -> List[OrderResult]:
+        """Every outcome in basket order."""
+        return sorted(self.succeeded + self.failed, key=lambda result: result.position)
+
+
+class OrderEvent(NamedTuple):
+    """A change to an order seen by an `OpenOrderTracker`.
+
+    Attributes:
+        kind: `new` for an order seen for the first time, `fill` when more shares
+            were filled and `state` when the state changed.
+        order: The order after the change.
+        previous: The order as it was before the change, None for new orders.
+
+    """
+
+    kind: str
+    order: Order
+    previous: Optional[Order] = None
+
+    @property
+    def filled(self) -> float:
+        """Get the number of shares filled since the previous version of the order.
+
+        Returns:
+            The newly filled quantity.
+
+        """
+        before = 0.0 if self.previous is None else _filled(self.previous)
+        return _filled(self.order) - before
+
+
+def _filled(order: Order) -> float:
+    return getattr(order, "cumulative_quantity", None) or 0.0
+
+
+class OpenOrderTracker:
+    """Keep a table of the open orders up to date from the changes of each poll.
+
+    The first poll pages through the order history once. Every later poll only
+    fetches the orders updated since the most recent update already seen, so an
+    idle account costs a single small page per poll.
+
+    Examples:
+        >>> tracker = OpenOrderTracker(rh)  # xdoctest: +SKIP
+        >>> for event in tracker.watch(interval=2):  # xdoctest: +SKIP
+        ...     print(event.kind, event.order.id, event.order.state)
+
+    Args:
+        session_manager: The session used to fetch orders.
+        since: Only look at the orders updated at or after this time. This bounds
+            the first poll when older orders are known to be closed.
+
+    """
+
+    def __init__(self, session_manager: Any, since: Optional[datetime] = None) -> None:
+        self.session_manager = session_manager
+        self.orders: Dict[str, Order] = {}
+        self.updated_at = since
+        # the orders updated at `updated_at` are fetched again by the next poll
+        self._at_updated_at: Set[str] = set()
+        self._seeded = False
+        self._lock = threading.Lock()
+
+    def _is_history(self, order: Order, seeding: bool) -> bool:
+        # closed orders from before tracking started, or already seen by the
+        # previous poll, are history, not changes
+        created_at: Optional[datetime] = getattr(order, "created_at", None)
+        if seeding or created_at is None or str(order.id) in self._at_updated_at:
+            return True
+        return self.updated_at is not None and created_at < self.updated_at
+
+    def _apply(self, order: Order, seeding: bool) -> List[OrderEvent]:
+        key = str(order.id)
+        previous = self.orders.get(key)
+        is_open = order.state in OPEN_ORDER_STATES
+
+        events: List[OrderEvent] = []
+        if previous is None:
+            if not is_open and self._is_history(order, seeding):
+                return events
+            events.append(OrderEvent("new", order))
+            if _filled(order) > 0:
+                events.append(OrderEvent("fill", order))
+        else:
+            if _filled(order) > _filled(previous):
+                events.append(OrderEvent("fill", order, previous))
+            if order.state != previous.state:
+                events.append(OrderEvent("state", order, previous))
+
+        if is_open:
+            self.orders[key] = order
+        else:
+            self.orders.pop(key, None)
+        return events
+
+    def _record_latency(self, events: List[OrderEvent]) -> None:
+        recorder = getattr(self.session_manager, "latency_recorder", None)
+        if recorder is None:
+            return
+        for event in events:
+            order = event.order
+            if order.state in LATENCY_STATES:
+                key = getattr(order, "ref_id", None) or str(order.id)
+                recorder.mark([key], order.state, tracked_only=True)
+
+    def poll(self) -> List[OrderEvent]:
+        """Fetch the orders that changed since the last poll and apply them.
+
+        Returns:
+            The changes, oldest update first.
+
+        """
+        with self._lock:
+            seeding = not self._seeded
+            changed = sorted(
+                base_paginator(
+                    urls.build_orders(updated_since=self.updated_at),
+                    self.session_manager,
+                    OrderPaginatorSchema(),
+                ),
+                key=lambda order: order.updated_at,
+            )
+            events = []
+            for order in changed:
+                events.extend(self._apply(order, seeding))
+            self._record_latency(events)
+            if changed:
+                self.updated_at = changed[-1].updated_at
+                self._at_updated_at = {
+                    str(order.id)
+                    for order in changed
+                    if order.updated_at == self.updated_at
+                }
+            self._seeded = True
+            return events
+
+    def watch(self, interval: float = 5.0) -> Iterator[OrderEvent]:
+        """Poll forever and yield every change.
+
+        Args:
+            interval: The number of seconds between polls.
+
+        Yields:
+            The changes of each poll.
+
+        """
+        while True:
+            yield from self.poll()
+            time.sleep(interval)
+
+
+class OrderManager(InstrumentManager):
+    """Group together methods that place stock orders.
+
+    The account url and the instrument of every symbol are resolved once per session
+    and a quote is only fetched when an order has no price, so once warmed up an
+    order costs a single POST.
+
+    Examples:
+        >>> om = OrderManager()
+        >>> om.prewarm_orders(["AAPL", "TSLA"])  # Resolve everything up front
+        >>> om.order("AAPL", 1, "buy", order_type="limit", price=100.0)
+
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.latency_recorder: Optional[LatencyRecorder] = kwargs.pop(
+            "latency_recorder", None
+        )
+        super().__init__(*args, **kwargs)
+        self._account_url: Optional[str] = None
+        self._symbol_cache = TTLCache(INSTRUMENT_TTL)
+        self.order_tracker = OpenOrderTracker(self)
+
+    def account_url(self, refresh: bool = False) -> str:
+        """Get the url of the account orders are placed on.
+
+        Args:
+            refresh: Whether to fetch the account even if its url is cached.
+
+        Returns:
+            The account url.
+
+        """
+        if self._account_url is None or refresh:
+            self._account_url = self.get(urls.ACCOUNTS)["results"][0]["url"]
+        return cast(str, self._account_url)
+
+    def instruments_by_symbol(
+        self, symbols: Iterable[str], max_workers: Optional[int] = None
+    ) -> List[Instrument]:
+        """Get the instruments of many symbols through a symbol cache.
+
+        Args:
+            symbols: Ticker symbols.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The instruments in the same order as the symbols.
+
+        Raises:
+            PyrhValueError: A symbol is unknown.
+
+        """
+        symbols = [symbol.upper() for symbol in symbols]
+        resolved = {s: self._symbol_cache.get(s) for s in dict.fromkeys(symbols)}
+        missing = [symbol for symbol, value in resolved.items() if value is None]
+        fetched: List[Optional[Instrument]] = self.get_many(
+            [urls.instruments(symbol=symbol) for symbol in missing],
+            schema=InstrumentSchema(),
+            max_workers=max_workers,
+        )
+        for symbol, instrument in zip(missing, fetched):
+            if instrument is None or getattr(instrument, "url", None) is None:
+                raise PyrhValueError(f"Unknown symbol {symbol}.")
+            instrument = self._shared(instrument)
+            self._symbol_cache.set(symbol, instrument)
+            self._instrument_cache.set(str(instrument.id), instrument)
+            resolved[symbol] = instrument
+
+        return [resolved[symbol] for symbol in symbols]
+
+    def open_orders(self, refresh: bool = True) -> List[Order]:
+        """Get every open order through the `order_tracker` of the session.
+
+        Args:
+            refresh: Whether to poll for the orders that changed since the last call.
+
+        Returns:
+            The orders that can still fill or be cancelled.
+
+        """
+        if refresh:
+            self.order_tracker.poll()
+        return list(self.order_tracker.orders.values())
+
+    def prewarm_orders(
+        self, symbols: Iterable[str], max_workers: Optional[int] = None
+    ) -> None:
+        """Resolve the account and the instruments of symbols ahead of ordering.
+
+        Args:
+            symbols: The ticker symbols that are about to be traded.
+            max_workers: The maximum number of requests in flight at once.
+
+        """
+        self.account_url()
+        self.instruments_by_symbol(symbols, max_workers)
+
+    def _mark_latency(self, payloads: Iterable[JSON], stage: str) -> None:
+        if self.latency_recorder is not None:
+            keys = [p["ref_id"] for p in payloads if p.get("ref_id") is not None]
+            self.latency_recorder.mark(keys, stage)
+
+    def _complete_orders(
+        self, payloads: List[JSON], max_workers: Optional[int] = None
+    ) -> List[JSON]:
+        """Fill in the account, instrument and price of validated orders.
+
+        Every lookup is shared between the orders: the account is fetched once, the
+        missing instruments in one batch and the missing prices in one quote batch.
+
+        """
+        self._mark_latency(payloads, "started")
+        account = self.account_url()
+        self._mark_latency(payloads, "account")
+
+        unresolved = list(
+            dict.fromkeys(p["symbol"] for p in payloads if p["instrument"] is None)
+        )
+        instruments = dict(
+            zip(unresolved, self.instruments_by_symbol(unresolved, max_workers))
+        )
+        if unresolved:
+            self._mark_latency(
+                [p for p in payloads if p["instrument"] is None], "instrument"
+            )
+
+        unpriced = list(
+            dict.fromkeys(p["symbol"] for p in payloads if p["price"] is None)
+        )
+        quotes = {}
+        if unpriced:
+            quotes = dict(zip(unpriced, self.quotes(unpriced, True, max_workers)))
+            self._mark_latency([p for p in payloads if p["price"] is None], "quote")
+
+        for payload in payloads:
+            symbol = payload["symbol"]
+            payload["account"] = account
+            if payload["instrument"] is None:
+                payload["instrument"] = str(instruments[symbol].url)
+            if payload["price"] is None:
+                payload["price"] = _quote_price(quotes[symbol], symbol, payload["side"])
+        return payloads
+
+    def prepare_order(
+        self, symbol: str, quantity: float, side: str, **kwargs: Any
+    ) -> JSON:
+        """Validate an order and build the payload to submit it.
+
+        Note:
+            Robinhood requires a price on every order. When none is given it is the
+            current ask price for buys and bid price for sells, falling back to the
+            last trade price. This is the only case where a quote is fetched.
+
+        Args:
+            symbol: The ticker symbol to trade.
+            quantity: The number of shares.
+            side: Either `buy` or `sell`.
+            **kwargs: The other arguments of `validate_order`. The instrument is
+                looked up from the symbol if `instrument_url` is omitted.
+
+        Returns:
+            The payload for the orders endpoint.
+
+        Raises:
+            PyrhValueError: The order is invalid.
+
+        """
+        payload = validate_order(symbol, quantity, side, **kwargs)
+        return self._complete_orders([payload])[0]
+
+    def _market_price(self, symbol: str, side: str) -> float:
+        """Get the price an order would default to from a fresh quote."""
+        return _quote_price(self.quotes([symbol], True)[0], symbol, side.lower())
+
+    def _order_by_ref_id(self, ref_id: str, since: datetime) -> Optional[JSON]:
+        url: Optional[Union[str, URL]] = urls.build_orders(updated_since=since)
+        while url is not None:
+            page = self.get(url)
+            for order in page["results"]:
+                if order.get("ref_id") == ref_id:
+                    return cast(JSON, order)
+            url = page.get("next")
+        return None
+
+    def order_by_ref_id(
+        self, ref_id: str, since: Optional[datetime] = None
+    ) -> Optional[Order]:
+        """Find an order by the client reference id it was submitted with.
+
+        Args:
+            ref_id: The `ref_id` of the order payload.
+            since: Only search the orders updated at or after this time, defaults to
+                `REF_ID_WINDOW` ago.
+
+        Returns:
+            The order or None if robinhood has no order with this reference.
+
+        """
+        since = datetime.now(tz=pytz.UTC) - REF_ID_WINDOW if since is None else since
+        order = self._order_by_ref_id(ref_id, since)
+        return None if order is None else cast(Order, OrderSchema().load(order))
+
+    def post_order(self, payload: JSON, retries: int = ORDER_RETRIES) -> JSON:
+        """Post an order payload, retrying safely after ambiguous failures.
+
+        A timeout, a connection error or a server error leaves it unknown whether
+        the order was placed. In those cases the orders are searched for the
+        `ref_id` of the payload and the order is only posted again if it is not
+        found. Any other error is raised right away.
+
+        When the session has a `latency_recorder`, the order is marked `submitted`
+        and `acknowledged` around the POST and its retries.
+
+        Args:
+            payload: The order payload, with a `ref_id`.
+            retries: The maximum number of times the order is posted again.
+
+        Returns:
+            The JSON of the order as accepted by robinhood.
+
+        """
+        self._mark_latency([payload], "submitted")
+        order = self._post_order(payload, retries)
+        self._mark_latency([payload], "acknowledged")
+        return order
+
+    def _post_order(self, payload: JSON, retries: int) -> JSON:
+        since = datetime.now(tz=pytz.UTC) - REF_ID_WINDOW
+        delay, attempt = ORDER_RETRY_DELAY, 0
+        while True:
+            try:
+                return cast(JSON, self.post(urls.ORDERS_BASE, data=payload))
+            except requests.RequestException as e:
+                ref_id = payload.get("ref_id")
+                # without a reference a placed order can't be told apart from a lost one
+                if attempt >= retries or ref_id is None or not _is_ambiguous(e):
+                    raise
+                order = self._order_by_ref_id(ref_id, since)
+                if order is not None:
+                    return order
+            time.sleep(delay)
+            delay, attempt = delay * 2, attempt + 1
+
+    def submit_order(self, payload: JSON, retries: int = ORDER_RETRIES) -> Order:
+        """Submit an order payload built by `prepare_order`.
+
+        Args:
+            payload: The order payload.
+            retries: The maximum number of retries, see `post_order`.
+
+        Returns:
+            The order as accepted by robinhood.
+
+        """
+        return cast(Order, OrderSchema().load(self.post_order(payload, retries)))
+
+    def order(self, symbol: str, quantity: float, side: str, **kwargs: Any) -> Order:
+        """Validate, prepare and submit an order.
+
+        Args:
+            symbol: The ticker symbol to trade.
+            quantity: The number of shares.
+            side: Either `buy` or `sell`.
+            **kwargs: The other arguments of `prepare_order`.
+
+        Returns:
+            The order as accepted by robinhood.
+
+        """
+        return self.submit_order(self.prepare_order(symbol, quantity, side, **kwargs))
+
+    def _submit_result(self, indexed: Tuple[int, JSON]) -> OrderResult:
+        position, payload = indexed
+        try:
+            return OrderResult(position, payload, order=self.submit_order(payload))
+        except Exception as e:
+            return OrderResult(position, payload, error=e)
+
+    def submit_orders(
+        self, specs: Iterable[Mapping[str, Any]], max_workers: Optional[int] = None
+    ) -> BasketResult:
+        """Validate, prepare and submit a basket of orders.
+
+        Every order is validated before anything is sent, so an invalid order stops
+        the whole basket. The account, instruments and prices are then resolved once
+        for the basket and the orders are submitted concurrently, within the
+        `rate_limiter` of the session if it has one. A failed submission does not
+        stop the others.
+
+        Examples:
+            >>> om.submit_orders(  # xdoctest: +SKIP
+            ...     [
+            ...         {"symbol": "AAPL", "quantity": 1, "side": "buy"},
+            ...         {"symbol": "TSLA", "quantity": 2, "side": "sell", "price": 900.0},
+            ...     ]
+            ... )
+
+        Args:
+            specs: The keyword arguments of `validate_order` for each order.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The accepted and the failed orders.
+
+        Raises:
+            PyrhValueError: An order is invalid, the error names its position in the
+                basket. Nothing was submitted.
+
+        """
+        payloads = []
+        for index, spec in enumerate(specs):
+            try:
+                payloads.append(validate_order(**spec))
+            except (PyrhValueError, TypeError) as e:
+                raise PyrhValueError(f"Order {index} is invalid: {e}") from e
+        self._complete_orders(payloads, max_workers)
+
+        results = _map_concurrently(
+            self._submit_result, list(enumerate(payloads)), max_workers
+        )
+        return BasketResult(
+            succeeded=[result for result in results if result.ok],
+            failed=[result for result in results if not result.ok],
+        )
+
+    def _cancel_link(self, order: Any) -> Tuple[str, Optional[str]]:
+        if isinstance(order, str):
+            order = self.get(urls.build_orders(order))
+        if isinstance(order, Mapping):
+            order_id, known = order.get("id"), "cancel" in order
+            cancel = order.get("cancel")
+        elif isinstance(order, BaseModel):
+            order_id, known = getattr(order, "id", None), hasattr(order, "cancel")
+            cancel = getattr(order, "cancel", None)
+        else:
+            raise PyrhValueError(f"Can't cancel {order!r}, expected an order or id.")
+
+        _check(order_id is not None, "The order has no id.")
+        if not known:
+            return self._cancel_link(str(order_id))
+        return str(order_id), None if cancel is None else str(cancel)
+
+    def _cancel(self, order: Any) -> CancelResult:
+        order_id = order if isinstance(order, str) else None
+        try:
+            order_id, cancel = self._cancel_link(order)
+            if cancel is None:
+                return CancelResult(order_id, "not_cancellable")
+            return CancelResult(order_id, "cancelled", response=self.post(cancel))
+        except Exception as e:
+            return CancelResult(order_id, "failed", error=e)
+
+    def cancel_orders(
+        self, orders: Iterable[Any], max_workers: Optional[int] = None
+    ) -> List[CancelResult]:
+        """Cancel many orders concurrently.
+
+        The cancel link of an `Order` or order dictionary is used as is, only bare
+        order ids and orders without a `cancel` field are fetched first. The
+        requests go through the `rate_limiter` of the session if it has one.
+
+        Args:
+            orders: Order ids, orders or order dictionaries, such as the output of
+                `open_orders`.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The outcome of every order, in the same order as the input.
+
+        """
+        return _map_concurrently(self._cancel, list(orders), max_workers)
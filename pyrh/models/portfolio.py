@@ -22,9 +22,9 @@ class PortfolioSchema(BaseSchema):
     start_date = fields.NaiveDateTime()
     market_value = fields.Float()
     equity = fields.Float()
-    extended_hours_market_value = fields.Float()
-    extended_hours_equity = fields.Float()
-    extended_hours_portfolio_equity = fields.Float()
+    extended_hours_market_value = fields.Float(allow_none=True)
+    extended_hours_equity = fields.Float(allow_none=True)
+    extended_hours_portfolio_equity = fields.Float(allow_none=True)
     last_core_market_value = fields.Float()
     last_core_equity = fields.Float()
     last_core_portfolio_equity = fields.Float()
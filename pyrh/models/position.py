@@ -0,0 +1,250 @@
+"""Stock positions and their value."""
+
+from typing import Iterable, List, NamedTuple, Optional
+
+from marshmallow import fields
+
+from pyrh import urls
+
+from .base import (
+    BaseModel,
+    BasePaginator,
+    BasePaginatorSchema,
+    BaseSchema,
+    base_paginator,
+)
+from .instrument import Instrument, InstrumentManager
+from .quote import Quote
+
+
+class Position(BaseModel):
+    """The shares of a single stock held by the account.
+
+    Note:
+        Hydrated positions also have an `instrument_data` attribute which is the
+        `Instrument` behind the `instrument` url, or None if it is unknown.
+
+    """
+
+    pass
+
+
+class PositionSchema(BaseSchema):
+    """The Schema for Position objects."""
+
+    __model__ = Position
+
+    account = fields.URL()
+    average_buy_price = fields.Float()
+    created_at = fields.AwareDateTime()
+    instrument = fields.URL()
+    intraday_average_buy_price = fields.Float()
+    intraday_quantity = fields.Float()
+    quantity = fields.Float()
+    shares_held_for_buys = fields.Float()
+    shares_held_for_sells = fields.Float()
+    updated_at = fields.AwareDateTime()
+    url = fields.URL()
+
+
+class PositionPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `Position`."""
+
+    pass
+
+
+class PositionPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the PositionPaginator.
+
+    The nested results are of types `Position`.
+
+    """
+
+    __model__ = PositionPaginator
+
+    results = fields.List(fields.Nested(PositionSchema))
+
+
+class PositionValue(NamedTuple):
+    """The value of one position at its latest quote.
+
+    `price`, `market_value` and `unrealized_pl` are None when the position has no
+    quote or the quote has no trade price.
+
+    """
+
+    position: Position
+    instrument: Optional[Instrument]
+    quote: Optional[Quote]
+    price: Optional[float]
+    market_value: Optional[float]
+    cost_basis: float
+    unrealized_pl: Optional[float]
+
+    @property
+    def symbol(self) -> Optional[str]:
+        """Get the ticker symbol of the position.
+
+        Returns:
+            The symbol or None if the instrument is unknown.
+
+        """
+        return None if self.instrument is None else self.instrument.symbol
+
+
+class PositionsSnapshot(NamedTuple):
+    """The value of every position and their totals.
+
+    The totals only include the positions that have a price.
+
+    """
+
+    positions: List[PositionValue]
+    market_value: float
+    cost_basis: float
+    unrealized_pl: float
+
+    @classmethod
+    def from_values(cls, values: Iterable[PositionValue]) -> "PositionsSnapshot":
+        """Total the value of positions.
+
+        Args:
+            values: The values of the positions.
+
+        Returns:
+            The positions and their totals.
+
+        """
+        values = list(values)
+        market_value = cost_basis = unrealized_pl = 0.0
+        for value in values:
+            if value.market_value is not None and value.unrealized_pl is not None:
+                market_value += value.market_value
+                cost_basis += value.cost_basis
+                unrealized_pl += value.unrealized_pl
+        return cls(values, market_value, cost_basis, unrealized_pl)
+
+    @property
+    def unrealized_pl_percent(self) -> float:
+        """Get the unrealized profit or loss relative to the cost of the positions.
+
+        Returns:
+            The percentage, 0 when nothing was paid for the positions.
+
+        """
+        return 100 * self.unrealized_pl / self.cost_basis if self.cost_basis else 0.0
+
+
+def _price(quote: Optional[Quote]) -> Optional[float]:
+    if quote is None:
+        return None
+    price = getattr(quote, "last_extended_hours_trade_price", None)
+    return price if price is not None else getattr(quote, "last_trade_price", None)
+
+
+def value_position(
+    position: Position, instrument: Optional[Instrument], quote: Optional[Quote]
+) -> PositionValue:
+    """Value a position at a quote.
+
+    The latest extended hours trade price is used when there is one, like the
+    Robinhood app does outside of the regular hours.
+
+    Args:
+        position: The position to value.
+        instrument: The instrument of the position.
+        quote: The latest quote of the instrument.
+
+    Returns:
+        The value of the position.
+
+    """
+    price = _price(quote)
+    cost_basis = position.quantity * position.average_buy_price
+    market_value = None if price is None else position.quantity * price
+    return PositionValue(
+        position,
+        instrument,
+        quote,
+        price,
+        market_value,
+        cost_basis,
+        None if market_value is None else market_value - cost_basis,
+    )
+
+
+class PositionManager(InstrumentManager):
+    """Group together methods that read stock positions.
+
+    Examples:
+        >>> pm = PositionManager()
+        >>> pm.stock_positions()  # Get the positions that hold shares
+        >>> pm.position_values().unrealized_pl  # Get the total unrealized P&L
+
+    """
+
+    def stock_positions(
+        self,
+        nonzero: bool = True,
+        hydrate: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[Position]:
+        """Get the stock positions of the account across all of their pages.
+
+        Args:
+            nonzero: Whether to leave out the positions that no longer hold shares.
+            hydrate: Whether to attach the instrument of each position as
+                `instrument_data`.
+            max_workers: The maximum number of instrument requests in flight at once.
+
+        Returns:
+            The positions.
+
+        """
+        positions = list(
+            base_paginator(
+                urls.build_positions(nonzero), self, PositionPaginatorSchema()
+            )
+        )
+        if hydrate:
+            instruments = self.instruments_by_url(
+                [position.instrument for position in positions], max_workers
+            )
+            for position, instrument in zip(positions, instruments):
+                position.instrument_data = instrument
+        return positions
+
+    def position_values(
+        self, refresh: bool = True, max_workers: Optional[int] = None
+    ) -> PositionsSnapshot:
+        """Value every position that holds shares at its latest quote.
+
+        Note:
+            Instruments go through the instrument cache and quotes are requested
+            `MAX_QUOTE_SYMBOLS` at a time, so a refresh costs one request per page of
+            positions, one per chunk of new instruments and one per chunk of quotes
+            however many positions the account holds.
+
+        Args:
+            refresh: Whether to fetch fresh quotes instead of using the quote cache.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The value of each position and their totals.
+
+        """
+        positions = self.stock_positions(max_workers=max_workers)
+        symbols = [
+            position.instrument_data.symbol
+            for position in positions
+            if position.instrument_data is not None
+        ]
+        quotes = iter(self.quotes(symbols, refresh, max_workers))
+        return PositionsSnapshot.from_values(
+            value_position(
+                position,
+                position.instrument_data,
+                None if position.instrument_data is None else next(quotes),
+            )
+            for position in positions
+        )
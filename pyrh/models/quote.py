@@ -0,0 +1,170 @@
+"""Stock quotes."""
+
+import time
+from typing import Any, Iterable, Iterator, List, Optional
+
+from marshmallow import fields
+
+from pyrh import urls
+
+from .base import (
+    BaseModel,
+    BasePaginator,
+    BasePaginatorSchema,
+    BaseSchema,
+    TTLCache,
+    by_symbol,
+    chunked,
+)
+from .market import DEFAULT_MARKET, MarketManager, _now
+
+MAX_QUOTE_SYMBOLS: int = 100
+"""The maximum number of symbols sent in a single quotes request."""
+
+QUOTE_TTL: float = 15
+"""Number of seconds a quote stays cached while its market is open."""
+
+
+class Quote(BaseModel):
+    """The latest quote of a single stock."""
+
+    pass
+
+
+class QuoteSchema(BaseSchema):
+    """The Schema for Quote objects."""
+
+    __model__ = Quote
+
+    adjusted_previous_close = fields.Float(allow_none=True)
+    ask_price = fields.Float(allow_none=True)
+    ask_size = fields.Int(allow_none=True)
+    bid_price = fields.Float(allow_none=True)
+    bid_size = fields.Int(allow_none=True)
+    has_traded = fields.Boolean()
+    instrument = fields.URL()
+    last_extended_hours_trade_price = fields.Float(allow_none=True)
+    last_trade_price = fields.Float(allow_none=True)
+    last_trade_price_source = fields.Str(allow_none=True)
+    previous_close = fields.Float(allow_none=True)
+    previous_close_date = fields.Date(allow_none=True)
+    symbol = fields.Str()
+    trading_halted = fields.Boolean()
+    updated_at = fields.AwareDateTime(allow_none=True)
+
+
+class QuotePaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `Quote`."""
+
+    pass
+
+
+class QuotePaginatorSchema(BasePaginatorSchema):
+    """Schema class for the QuotePaginator.
+
+    The nested results are of types `Quote`, None for unknown symbols.
+
+    """
+
+    __model__ = QuotePaginator
+
+    results = fields.List(fields.Nested(QuoteSchema, allow_none=True))
+
+
+class QuoteManager(MarketManager):
+    """Group together methods that fetch quotes.
+
+    Quotes are cached for `QUOTE_TTL` seconds while the market is open and until the
+    market opens again while it is closed, see `MarketManager.market_ttl`. Only
+    market hours that are already cached are used, so `quotes` never fetches them,
+    and unknown symbols are cached for `QUOTE_TTL` seconds at most.
+
+    Examples:
+        >>> qm = QuoteManager()
+        >>> qm.quotes(["AAPL", "TSLA"])
+        >>> for quotes in qm.poll_quotes(["AAPL", "TSLA"], interval=5):
+        ...     print(quotes)
+
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._quote_cache = TTLCache(QUOTE_TTL)
+
+    def quotes(
+        self,
+        symbols: Iterable[str],
+        refresh: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[Quote]]:
+        """Get the quotes of many symbols through the quote cache.
+
+        Cache misses are fetched `MAX_QUOTE_SYMBOLS` at a time and the requests for
+        each chunk are run concurrently.
+
+        Args:
+            symbols: Ticker symbols.
+            refresh: Whether to fetch every quote even if it is cached.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The quotes in the same order as the symbols. Unknown symbols are None.
+
+        """
+        symbols = [symbol.upper() for symbol in symbols]
+        missing = [
+            symbol
+            for symbol in dict.fromkeys(symbols)
+            if refresh or symbol not in self._quote_cache
+        ]
+        chunks = list(chunked(missing, MAX_QUOTE_SYMBOLS))
+        pages = self.get_many(
+            [urls.build_quotes(chunk) for chunk in chunks],
+            schema=QuotePaginatorSchema(),
+            max_workers=max_workers,
+        )
+        results = by_symbol(quote for page in pages for quote in page)
+        fetched = {symbol: results.get(symbol) for symbol in missing}
+        if fetched:
+            ttl = self.market_ttl(QUOTE_TTL, cached=True)
+            for symbol, quote in fetched.items():
+                self._quote_cache.set(
+                    symbol, quote, QUOTE_TTL if quote is None else ttl
+                )
+
+        return [
+            fetched[symbol] if symbol in fetched else self._quote_cache.get(symbol)
+            for symbol in symbols
+        ]
+
+    def poll_quotes(
+        self,
+        symbols: Iterable[str],
+        interval: float = QUOTE_TTL,
+        mic: str = DEFAULT_MARKET,
+        extended: bool = True,
+    ) -> Iterator[List[Optional[Quote]]]:
+        """Poll the quotes of many symbols while their market is open.
+
+        While the market is closed the generator sleeps until it opens instead of
+        polling.
+
+        Args:
+            symbols: Ticker symbols.
+            interval: The number of seconds between polls.
+            mic: The market identifier code of the market the symbols trade on.
+            extended: Whether to also poll during the extended hours.
+
+        Yields:
+            The fresh quotes of the symbols in the same order.
+
+        """
+        symbols = list(symbols)
+        while True:
+            now = _now()
+            opens_at = self.next_open(mic, extended, now)
+            if opens_at > now:
+                time.sleep((opens_at - now).total_seconds())
+                continue
+            yield self.quotes(symbols, refresh=True)
+            time.sleep(interval)
@@ -0,0 +1,108 @@
+"""Resolve the urls that models embed to reference other resources."""
+
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
+
+from marshmallow import Schema
+
+from .base import BaseSchema, TTLCache
+from .instrument import InstrumentManager
+from .option import OptionInstrumentSchema
+
+REFERENCE_FIELDS = ("instrument", "account", "option", "position", "portfolio")
+"""The fields that `resolve_references` looks at by default."""
+
+REFERENCE_TTL: float = 5 * 60
+"""Number of seconds a resolved reference, other than an instrument, stays cached."""
+
+REFERENCE_SCHEMAS: Dict[str, Schema] = {"option": OptionInstrumentSchema()}
+"""The schemas used to build referenced resources, `BaseSchema` by default."""
+
+
+def _get_field(item: Any, field: str) -> Any:
+    if isinstance(item, Mapping):
+        return item.get(field)
+    return getattr(item, field, None)
+
+
+def _set_field(item: Any, field: str, value: Any) -> None:
+    if isinstance(item, MutableMapping):
+        item[field] = value
+    else:
+        setattr(item, field, value)
+
+
+class ResolverManager(InstrumentManager):
+    """Resolve the references of many models at once.
+
+    Examples:
+        >>> rm = ResolverManager()
+        >>> orders = rm.get(urls.ORDERS_BASE)["results"]  # xdoctest: +SKIP
+        >>> rm.resolve_references(orders, fields=["instrument"])  # xdoctest: +SKIP
+        >>> orders[0]["instrument_data"].symbol  # xdoctest: +SKIP
+
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._reference_cache = TTLCache(REFERENCE_TTL)
+
+    def _resolve_urls(
+        self, field: str, resource_urls: List[str], max_workers: Optional[int]
+    ) -> Dict[str, Any]:
+        if field == "instrument":
+            return dict(
+                zip(resource_urls, self.instruments_by_url(resource_urls, max_workers))
+            )
+
+        resolved = {url: self._reference_cache.get(url) for url in resource_urls}
+        missing = [url for url, value in resolved.items() if value is None]
+        fetched = self.get_many(
+            missing,
+            schema=REFERENCE_SCHEMAS.get(field, BaseSchema()),
+            max_workers=max_workers,
+        )
+        for url, value in zip(missing, fetched):
+            self._reference_cache.set(url, value)
+            resolved[url] = value
+        return resolved
+
+    def resolve_references(
+        self,
+        items: Iterable[Any],
+        fields: Iterable[str] = REFERENCE_FIELDS,
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """Fetch the resources referenced by many models and attach them in place.
+
+        Every unique url is fetched once, concurrently. Instruments go through the
+        instrument cache, see `InstrumentManager.instruments_by_url`, and the other
+        resources are cached for `REFERENCE_TTL` seconds.
+
+        Args:
+            items: Models or JSON dictionaries such as orders, positions, dividends or
+                watchlist items.
+            fields: The names of the fields that hold urls. The resolved value of a
+                field is stored as `<field>_data`, a key for dictionaries and an
+                attribute for models.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The items, with their references attached.
+
+        """
+        items = list(items)
+        for field in fields:
+            references = {
+                index: str(url)
+                for index, url in enumerate(_get_field(item, field) for item in items)
+                if url
+            }
+            if not references:
+                continue
+            resolved = self._resolve_urls(
+                field, list(dict.fromkeys(references.values())), max_workers
+            )
+            for index, url in references.items():
+                _set_field(items[index], f"{field}_data", resolved[url])
+
+        return items
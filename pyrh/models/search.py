@@ -0,0 +1,155 @@
+"""An offline search index over instruments."""
+
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set
+
+from .instrument import Instrument
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(text: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _prefixed(sorted_keys: List[str], prefix: str) -> Iterable[str]:
+    for i in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+        if not sorted_keys[i].startswith(prefix):
+            break
+        yield sorted_keys[i]
+
+
+class InstrumentIndex:
+    """An in-memory search index over a set of instruments.
+
+    Symbol lookups are a single dictionary access, symbol prefixes are found with a
+    binary search over the sorted symbols and names are searched through an
+    inverted index of their words. None of the lookups use the network.
+
+    Examples:
+        >>> store = InstrumentStore.load("instruments.json")  # xdoctest: +SKIP
+        >>> index = InstrumentIndex(store)  # xdoctest: +SKIP
+        >>> index.symbol("AAPL")  # xdoctest: +SKIP
+        >>> index.prefix("AA")  # xdoctest: +SKIP
+        >>> index.search("apple")  # xdoctest: +SKIP
+
+    Args:
+        instruments: The instruments to index, such as an `InstrumentStore` or the
+            output of `InstrumentManager.instruments`.
+
+    """
+
+    def __init__(self, instruments: Iterable[Instrument]) -> None:
+        self._by_symbol: Dict[str, Instrument] = {}
+        for instrument in instruments:
+            symbol = getattr(instrument, "symbol", None)
+            if symbol:
+                self._by_symbol[symbol.upper()] = instrument
+        self._symbols = sorted(self._by_symbol)
+
+        self._by_token: Dict[str, Set[str]] = {}
+        for symbol, instrument in self._by_symbol.items():
+            words = _tokens(getattr(instrument, "name", None))
+            words += _tokens(getattr(instrument, "simple_name", None))
+            for word in words:
+                self._by_token.setdefault(word, set()).add(symbol)
+        self._words = sorted(self._by_token)
+
+    def __len__(self) -> int:
+        """Return the number of indexed instruments.
+
+        Returns:
+            The number of instruments.
+
+        """
+        return len(self._symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Check whether a symbol is indexed.
+
+        Args:
+            symbol: A ticker symbol.
+
+        Returns:
+            Whether the symbol is in the index.
+
+        """
+        return isinstance(symbol, str) and symbol.upper() in self._by_symbol
+
+    def symbol(self, symbol: str) -> Optional[Instrument]:
+        """Get the instrument of a symbol.
+
+        Args:
+            symbol: A ticker symbol, in any case.
+
+        Returns:
+            The instrument or None if the symbol is unknown.
+
+        """
+        return self._by_symbol.get(symbol.upper())
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[Instrument]:
+        """Find the instruments whose symbol starts with a prefix.
+
+        Args:
+            prefix: The start of a ticker symbol, in any case.
+            limit: The maximum number of instruments to return.
+
+        Returns:
+            The matching instruments in symbol order.
+
+        """
+        matches: List[Instrument] = []
+        for symbol in _prefixed(self._symbols, prefix.upper()):
+            if limit is not None and len(matches) >= limit:
+                break
+            matches.append(self._by_symbol[symbol])
+        return matches
+
+    def name(self, query: str, limit: Optional[int] = None) -> List[Instrument]:
+        """Find the instruments whose name contains every word of a query.
+
+        The last word of the query only needs to be the start of a word so the
+        search can run on every keystroke.
+
+        Args:
+            query: Words of the name or simple name, in any case.
+            limit: The maximum number of instruments to return.
+
+        Returns:
+            The matching instruments in symbol order.
+
+        """
+        words = _tokens(query)
+        if not words:
+            return []
+
+        last: Set[str] = set()
+        for word in _prefixed(self._words, words[-1]):
+            last |= self._by_token[word]
+        symbols = [last] + [self._by_token.get(word, set()) for word in words[:-1]]
+        return [self._by_symbol[s] for s in sorted(set.intersection(*symbols))][:limit]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Instrument]:
+        """Search symbols and names at once.
+
+        Args:
+            query: A symbol, the start of a symbol or words of a name.
+            limit: The maximum number of instruments to return.
+
+        Returns:
+            The exact symbol match first, then symbol prefix matches and then name
+            matches, without duplicates.
+
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        found: Dict[str, Instrument] = {}
+        candidates = self.prefix(query) if " " not in query else []
+        candidates += self.name(query)
+        for instrument in candidates:
+            found.setdefault(instrument.symbol.upper(), instrument)
+        return list(found.values())[:limit]
@@ -1,8 +1,19 @@
 """Manage Robinhood Sessions."""
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from urllib.request import getproxies
 
 import certifi
@@ -10,6 +21,7 @@ import pyotp as pyotp
 import pytz
 import requests
 from marshmallow import Schema, fields, post_load
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from requests.structures import CaseInsensitiveDict
 from yarl import URL
@@ -17,7 +29,7 @@ from yarl import URL
 from pyrh import urls
 from pyrh.exceptions import AuthenticationError, PyrhValueError
 
-from .base import JSON, BaseModel, BaseSchema
+from .base import JSON, BaseModel, BaseSchema, RateLimiter, intern_fields
 from .oauth import CHALLENGE_TYPE_VAL, OAuth, OAuthSchema
 
 # TODO: merge get and post duplicated code into a single function.
@@ -53,6 +65,54 @@ EXPIRATION_TIME: int = 734000
 TIMEOUT: int = 3
 """Default timeout in seconds"""
 
+MAX_WORKERS: int = 8
+"""Default number of threads used to run concurrent requests."""
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+Cert = Union[None, str, Tuple[str, str]]
+
+
+class ApiBaseAdapter(HTTPAdapter):
+    """A transport adapter that sends the requests for `urls.API_BASE` elsewhere.
+
+    Args:
+        api_base: The url to send the requests to instead.
+        **kwargs: Passed to `requests.adapters.HTTPAdapter`.
+
+    """
+
+    def __init__(self, api_base: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.api_base = api_base.rstrip("/") + "/"
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: Union[bool, str] = True,
+        cert: Cert = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Rewrite the url of a request and send it.
+
+        Args:
+            request: The request to send.
+            stream: Whether to stream the response content.
+            timeout: The connect and read timeouts.
+            verify: Whether to verify the TLS certificate, or a CA bundle path.
+            cert: The client certificate.
+            proxies: The proxies of each scheme.
+
+        Returns:
+            The response of the other server.
+
+        """
+        prefix = f"{urls.API_BASE}/"
+        if request.url is not None and request.url.startswith(prefix):
+            request.url = self.api_base + request.url[len(prefix) :]
+        return super().send(request, stream, timeout, verify, cert, proxies)
+
 
 class SessionManager(BaseModel):
     """Manage connectivity with Robinhood API.
@@ -78,7 +138,12 @@ class SessionManager(BaseModel):
         challenge_type: Either sms or email (only if not using mfa)
         headers: Any optional header dict modifications for the session
         proxies: Any optional proxy dict modification for the session
-        **kwargs: Any other passed parameters as converted to instance attributes
+        **kwargs: Any other passed parameters as converted to instance attributes.
+            Pass `intern_strings=True` to intern the reference urls of every GET
+            response, see `pyrh.models.base.intern_fields`, and
+            `rate_limiter=RateLimiter(rate)` to cap the requests per second. Pass
+            `api_base` to send the requests for `urls.API_BASE` to another server,
+            such as `pyrh.mock_server`.
 
     Attributes:
         session: A requests session instance
@@ -87,6 +152,9 @@ class SessionManager(BaseModel):
         device_token: A random guid representing the current device
         access_token: An oauth2 token to connect to the Robinhood API
         refresh_token: An oauth2 refresh token to refresh the access_token when required
+        intern_strings: Whether reference urls of GET responses are interned
+        rate_limiter: A `RateLimiter` that every GET and POST request waits on
+        api_base: The url that replaces `urls.API_BASE` in requests, if any
 
     """
 
@@ -102,7 +170,7 @@ class SessionManager(BaseModel):
     ) -> None:
         self.mfa = mfa
         self.session: requests.Session = requests.session()
-        self.session.headers = HEADERS if headers is None else headers
+        self.session.headers = HEADERS.copy() if headers is None else headers
         self.session.proxies = getproxies() if proxies is None else proxies
         self.session.verify = certifi.where()
         self.expires_at = datetime.strptime("1970", "%Y").replace(
@@ -117,6 +185,11 @@ class SessionManager(BaseModel):
 
         self.device_token: str = kwargs.pop("device_token", str(uuid.uuid4()))
         self.oauth: OAuth = kwargs.pop("oauth", OAuth())
+        self.intern_strings: bool = kwargs.pop("intern_strings", False)
+        self.rate_limiter: Optional[RateLimiter] = kwargs.pop("rate_limiter", None)
+        self.api_base: Optional[str] = kwargs.pop("api_base", None)
+        if self.api_base is not None:
+            self.session.mount(f"{urls.API_BASE}/", ApiBaseAdapter(self.api_base))
 
         super().__init__(**kwargs)
 
@@ -206,6 +279,8 @@ class SessionManager(BaseModel):
         if isinstance(schema, type):
             raise PyrhValueError("Passed Schema should be an instance not a class.")
         params = {} if params is None else params
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         res = self.session.get(
             str(url),
             params=params,
@@ -223,10 +298,45 @@ class SessionManager(BaseModel):
         if raise_errors:
             res.raise_for_status()
 
-        data = res.json() if schema is None else schema.load(res.json(), many=many)
+        data = res.json()
+        if self.intern_strings:
+            intern_fields(data)
+        if schema is not None:
+            data = schema.load(data, many=many)
 
         return (data, res) if return_response else data
 
+    def get_many(
+        self,
+        urls_: Iterable[Union[str, URL]],
+        schema: Optional[Schema] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """Run several wrapped GET requests concurrently.
+
+        Note:
+            The requests share the underlying `requests.Session` so they reuse its
+            connection pool and authentication headers.
+
+        Args:
+            urls_: The urls to get from.
+            schema: An instance of a `marshmallow.Schema` used to build each response.
+            max_workers: The maximum number of requests in flight at once, defaults
+                to `MAX_WORKERS`.
+
+        Returns:
+            The JSON dictionaries or constructed objects, in the same order as the \
+                input urls.
+
+        """
+        urls_ = list(urls_)
+        if len(urls_) <= 1:
+            return [self.get(url, schema=schema) for url in urls_]
+
+        workers = min(MAX_WORKERS if max_workers is None else max_workers, len(urls_))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda url: self.get(url, schema=schema), urls_))
+
     def post(
         self,
         url: Union[str, URL],
@@ -270,6 +380,8 @@ class SessionManager(BaseModel):
         if isinstance(schema, type):
             raise PyrhValueError("Passed Schema should be an instance not a class.")
 
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         res = self.session.post(
             str(url),
             data=data,
@@ -520,6 +632,8 @@ class SessionManagerSchema(BaseSchema):
     oauth = fields.Nested(OAuthSchema)
     expires_at = fields.AwareDateTime()
     device_token = fields.Str()
+    intern_strings = fields.Boolean()
+    api_base = fields.Str(allow_none=True)
     headers = fields.Dict()
     proxies = fields.Dict()
 
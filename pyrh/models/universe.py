@@ -0,0 +1,215 @@
+"""A local copy of the whole instrument universe."""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+
+import pytz
+
+from pyrh import urls
+
+from .base import base_pages
+from .instrument import Instrument, InstrumentPaginatorSchema, InstrumentSchema
+from .sessionmanager import SessionManager
+
+ACTIVE_STATE: str = "active"
+"""The `state` of an instrument that is listed."""
+
+
+class SyncProgress(NamedTuple):
+    """Progress of a running universe sync."""
+
+    pages: int
+    instruments: int
+    elapsed: float
+
+    @property
+    def per_second(self) -> float:
+        """Get the throughput so far.
+
+        Returns:
+            The number of instruments processed per second.
+
+        """
+        return self.instruments / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class SyncReport(NamedTuple):
+    """The outcome of a universe sync.
+
+    Note:
+        `added`, `delisted` and `changed` hold instrument ids. An instrument is
+        delisted when it disappears from the instruments endpoint or when its
+        `state` stops being active.
+
+    """
+
+    added: List[str]
+    delisted: List[str]
+    changed: List[str]
+    progress: SyncProgress
+
+    @property
+    def per_second(self) -> float:
+        """Get the throughput of the sync.
+
+        Returns:
+            The number of instruments processed per second.
+
+        """
+        return self.progress.per_second
+
+
+ProgressCallback = Callable[[SyncProgress], None]
+
+
+class InstrumentStore:
+    """A local store of every instrument, keyed by instrument id.
+
+    The first `sync` takes a full snapshot of the universe, following syncs only
+    apply and report the differences.
+
+    Examples:
+        >>> store = InstrumentStore.load("instruments.json")  # xdoctest: +SKIP
+        >>> report = store.sync(rh, progress=print)  # xdoctest: +SKIP
+        >>> store.save("instruments.json")  # xdoctest: +SKIP
+
+    """
+
+    def __init__(self) -> None:
+        self.instruments: Dict[str, Instrument] = {}
+        self.synced_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        """Return the number of instruments in the store.
+
+        Returns:
+            The number of instruments.
+
+        """
+        return len(self.instruments)
+
+    def __iter__(self) -> Iterator[Instrument]:
+        """Iterate over the instruments in the store.
+
+        Returns:
+            An iterator of Instruments.
+
+        """
+        return iter(self.instruments.values())
+
+    def get(self, id_: str) -> Optional[Instrument]:
+        """Get an instrument by id.
+
+        Args:
+            id_: The UUID that represents the instrument.
+
+        Returns:
+            The instrument or None if it is not in the store.
+
+        """
+        return self.instruments.get(str(id_))
+
+    def sync(
+        self,
+        session_manager: SessionManager,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SyncReport:
+        """Sync the store with the instruments endpoint.
+
+        Note:
+            The instruments endpoint cannot be filtered by modification time, so every
+            sync pages through the whole universe. Only the differences are applied
+            to the store.
+
+        Args:
+            session_manager: The session used to fetch the instruments.
+            progress: Called with a `SyncProgress` after every page.
+
+        Returns:
+            The added, delisted and changed instruments and the sync throughput.
+
+        """
+        added: List[str] = []
+        delisted: List[str] = []
+        changed: List[str] = []
+        seen = set()
+        pages = count = 0
+        start = time.monotonic()
+
+        for page in base_pages(
+            urls.INSTRUMENTS_BASE, session_manager, InstrumentPaginatorSchema()
+        ):
+            pages += 1
+            for instrument in page:
+                if instrument is None:
+                    continue
+                count += 1
+                id_ = str(instrument.id)
+                seen.add(id_)
+                old = self.instruments.get(id_)
+                if old is None:
+                    added.append(id_)
+                elif old != instrument:
+                    was_active = getattr(old, "state", None) == ACTIVE_STATE
+                    is_active = getattr(instrument, "state", None) == ACTIVE_STATE
+                    (delisted if was_active and not is_active else changed).append(id_)
+                else:
+                    continue
+                self.instruments[id_] = instrument
+            if progress is not None:
+                progress(SyncProgress(pages, count, time.monotonic() - start))
+
+        for id_ in set(self.instruments) - seen:
+            del self.instruments[id_]
+            delisted.append(id_)
+
+        self.synced_at = datetime.now(tz=pytz.UTC)
+        return SyncReport(
+            added,
+            delisted,
+            changed,
+            SyncProgress(pages, count, time.monotonic() - start),
+        )
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Save the store to a json file.
+
+        Args:
+            path: The location to save the file and its name.
+
+        """
+        payload = {
+            "synced_at": None if self.synced_at is None else self.synced_at.isoformat(),
+            "results": InstrumentSchema(many=True).dump(list(self)),
+        }
+        with open(path, "w+") as file:
+            json.dump(payload, file)
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> "InstrumentStore":
+        """Load a store saved with `save`.
+
+        Args:
+            path: The location and file name to load from.
+
+        Returns:
+            The loaded store, or an empty store if the file does not exist.
+
+        """
+        store = cls()
+        try:
+            with open(path) as file:
+                payload = json.load(file)
+        except FileNotFoundError:
+            return store
+
+        page = InstrumentPaginatorSchema().load(
+            {"next": None, "previous": None, "results": payload["results"]}
+        )
+        store.instruments = {str(instrument.id): instrument for instrument in page}
+        if payload.get("synced_at") is not None:
+            store.synced_at = datetime.fromisoformat(payload["synced_at"])
+        return store
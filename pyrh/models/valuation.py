@@ -0,0 +1,142 @@
+"""A live estimate of the portfolio value between portfolio requests."""
+
+from typing import Dict, Iterable, List, Optional
+
+from pyrh import urls
+
+from .portfolio import Portfolio, PortfolioSchema
+from .position import PositionManager, PositionsSnapshot, PositionValue, value_position
+from .quote import Quote
+
+
+class PortfolioValuation:
+    """Value the portfolio incrementally as quotes change.
+
+    The valuation starts from the equity reported by the `portfolios` endpoint and
+    the value of every position at its latest quote. Applying new quotes only
+    revalues the positions whose price changed and moves the running totals by the
+    difference, so the cost of an update is proportional to the number of changed
+    quotes, not to the number of positions.
+
+    Examples:
+        >>> valuation = PortfolioValuation.seed(rh)  # xdoctest: +SKIP
+        >>> for quotes in rh.poll_quotes(valuation.symbols):  # xdoctest: +SKIP
+        ...     valuation.apply_quotes(quotes)
+        ...     print(valuation.equity)
+
+    Args:
+        portfolio: The portfolio the estimate starts from.
+        positions: The value of the positions when the portfolio was fetched.
+
+    """
+
+    def __init__(self, portfolio: Portfolio, positions: PositionsSnapshot) -> None:
+        self._values: Dict[str, PositionValue] = {}
+        self._keys: Dict[str, str] = {}
+        for index, value in enumerate(positions.positions):
+            key = str(getattr(value.position, "url", index))
+            self._values[key] = value
+            if value.symbol is not None:
+                self._keys[value.symbol] = key
+        self.market_value = positions.market_value
+        self.cost_basis = positions.cost_basis
+        self.unrealized_pl = positions.unrealized_pl
+        self.set_portfolio(portfolio)
+
+    @classmethod
+    def seed(
+        cls, session_manager: PositionManager, max_workers: Optional[int] = None
+    ) -> "PortfolioValuation":
+        """Fetch the portfolio and the value of every position.
+
+        Args:
+            session_manager: The session used to fetch the portfolio and positions.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            The valuation.
+
+        """
+        portfolio = session_manager.get(urls.PORTFOLIOS, schema=PortfolioSchema())
+        return cls(portfolio, session_manager.position_values(max_workers=max_workers))
+
+    @property
+    def symbols(self) -> List[str]:
+        """Get the ticker symbols whose quotes move the valuation.
+
+        Returns:
+            The symbols of the positions.
+
+        """
+        return list(self._keys)
+
+    @property
+    def equity(self) -> float:
+        """Estimate the current equity of the portfolio.
+
+        Returns:
+            The equity of the last portfolio moved by the change in market value of
+            the positions since then.
+
+        """
+        return self._equity + self.market_value - self._market_value
+
+    def set_portfolio(self, portfolio: Portfolio) -> None:
+        """Start the estimate over from a freshly fetched portfolio.
+
+        Args:
+            portfolio: The latest portfolio, its extended hours equity is used when
+                it has one.
+
+        """
+        equity = getattr(portfolio, "extended_hours_equity", None)
+        self.portfolio = portfolio
+        self._equity = float(portfolio.equity if equity is None else equity)
+        self._market_value = self.market_value
+
+    def apply_quotes(self, quotes: Iterable[Optional[Quote]]) -> List[PositionValue]:
+        """Revalue the positions whose quote changed.
+
+        Args:
+            quotes: New quotes, the ones of symbols without a position and None are
+                ignored.
+
+        Returns:
+            The new value of each position whose price changed.
+
+        """
+        changed = []
+        for quote in quotes:
+            key = None if quote is None else self._keys.get(quote.symbol)
+            if key is None:
+                continue
+            old = self._values[key]
+            new = value_position(old.position, old.instrument, quote)
+            if new.price == old.price:
+                continue
+            self._values[key] = new
+            self._add(old, -1)
+            self._add(new, 1)
+            changed.append(new)
+        return changed
+
+    def _add(self, value: PositionValue, sign: int) -> None:
+        if value.market_value is None or value.unrealized_pl is None:
+            return
+        self.market_value += sign * value.market_value
+        self.cost_basis += sign * value.cost_basis
+        self.unrealized_pl += sign * value.unrealized_pl
+
+    def snapshot(self) -> PositionsSnapshot:
+        """Get the current value of every position.
+
+        Returns:
+            The positions and their running totals.
+
+        """
+        return PositionsSnapshot(
+            list(self._values.values()),
+            self.market_value,
+            self.cost_basis,
+            self.unrealized_pl,
+        )
@@ -0,0 +1,189 @@
+"""Watchlists and their items."""
+
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from marshmallow import fields
+
+from pyrh import urls
+
+from .base import (
+    BaseModel,
+    BasePaginator,
+    BasePaginatorSchema,
+    BaseSchema,
+    base_paginator,
+)
+from .instrument import InstrumentManager
+
+
+class Watchlist(BaseModel):
+    """A named watchlist."""
+
+    pass
+
+
+class WatchlistSchema(BaseSchema):
+    """The Schema for Watchlist objects."""
+
+    __model__ = Watchlist
+
+    name = fields.Str()
+    url = fields.URL()
+    user = fields.URL()
+
+
+class WatchlistPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `Watchlist`."""
+
+    pass
+
+
+class WatchlistPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the WatchlistPaginator.
+
+    The nested results are of types `Watchlist`.
+
+    """
+
+    __model__ = WatchlistPaginator
+
+    results = fields.List(fields.Nested(WatchlistSchema))
+
+
+class WatchlistItem(BaseModel):
+    """An instrument on a watchlist.
+
+    Note:
+        Hydrated items also have an `instrument_data` attribute which is the
+        `Instrument` behind the `instrument` url, or None if it is unknown.
+
+    """
+
+    pass
+
+
+class WatchlistItemSchema(BaseSchema):
+    """The Schema for WatchlistItem objects."""
+
+    __model__ = WatchlistItem
+
+    created_at = fields.AwareDateTime()
+    instrument = fields.URL()
+    url = fields.URL()
+    watchlist = fields.URL()
+
+
+class WatchlistItemPaginator(BasePaginator):
+    """Thin wrapper around `self.results`, a list of `WatchlistItem`."""
+
+    pass
+
+
+class WatchlistItemPaginatorSchema(BasePaginatorSchema):
+    """Schema class for the WatchlistItemPaginator.
+
+    The nested results are of types `WatchlistItem`.
+
+    """
+
+    __model__ = WatchlistItemPaginator
+
+    results = fields.List(fields.Nested(WatchlistItemSchema))
+
+
+class WatchlistManager(InstrumentManager):
+    """Group together methods that read watchlists.
+
+    Examples:
+        >>> wm = WatchlistManager()
+        >>> wm.watchlists()  # Get all watchlists
+        >>> wm.watchlist_items("Default")  # Get the hydrated items of a watchlist
+        >>> wm.all_watchlist_items()  # Get the hydrated items of every watchlist
+
+    """
+
+    def watchlists(self) -> Iterable[Watchlist]:
+        """Get a generator of the user's watchlists.
+
+        Returns:
+            A generator of Watchlists.
+
+        """
+        return base_paginator(urls.WATCHLISTS, self, WatchlistPaginatorSchema())
+
+    def _remaining_items(self, page: Any) -> List[WatchlistItem]:
+        items = list(page)
+        if page.next is not None:
+            items.extend(
+                base_paginator(page.next, self, WatchlistItemPaginatorSchema())
+            )
+        return items
+
+    def _hydrate(
+        self, items: List[WatchlistItem], max_workers: Optional[int] = None
+    ) -> None:
+        instruments = self.instruments_by_url(
+            [item.instrument for item in items], max_workers=max_workers
+        )
+        for item, instrument in zip(items, instruments):
+            item.instrument_data = instrument
+
+    def watchlist_items(
+        self,
+        watchlist: Union[Watchlist, str],
+        hydrate: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[WatchlistItem]:
+        """Get every item of a single watchlist.
+
+        Args:
+            watchlist: A Watchlist or the name of a watchlist.
+            hydrate: Whether to attach the instrument of each item as `instrument_data`.
+            max_workers: The maximum number of instrument requests in flight at once.
+
+        Returns:
+            The items of the watchlist across all of its pages.
+
+        """
+        url = (
+            urls.build_watchlist(watchlist)
+            if isinstance(watchlist, str)
+            else watchlist.url
+        )
+        items = list(base_paginator(url, self, WatchlistItemPaginatorSchema()))
+        if hydrate:
+            self._hydrate(items, max_workers)
+        return items
+
+    def all_watchlist_items(
+        self, hydrate: bool = True, max_workers: Optional[int] = None
+    ) -> Dict[str, List[WatchlistItem]]:
+        """Get the items of every watchlist.
+
+        Note:
+            The first page of every watchlist is fetched concurrently and the
+            instruments of all of the watchlists are hydrated together through the
+            instrument cache, so this usually costs the watchlist request, one wave
+            of item requests and one wave of instrument requests.
+
+        Args:
+            hydrate: Whether to attach the instrument of each item as `instrument_data`.
+            max_workers: The maximum number of requests in flight at once.
+
+        Returns:
+            A dictionary of watchlist name to its items.
+
+        """
+        watchlists = list(self.watchlists())
+        pages = self.get_many(
+            [watchlist.url for watchlist in watchlists],
+            schema=WatchlistItemPaginatorSchema(),
+            max_workers=max_workers,
+        )
+        items = {
+            watchlist.name: self._remaining_items(page)
+            for watchlist, page in zip(watchlists, pages)
+        }
+        if hydrate:
+            self._hydrate([i for group in items.values() for i in group], max_workers)
+        return items
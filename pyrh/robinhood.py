@@ -10,10 +10,17 @@ from yarl import URL
 from pyrh import urls
 from pyrh.exceptions import InvalidTickerSymbol
 from pyrh.models import (
+    FundamentalsManager,
     InstrumentManager,
+    OptionManager,
+    OrderManager,
+    OrderSchema,
     PortfolioSchema,
+    PositionManager,
+    ResolverManager,
     SessionManager,
     SessionManagerSchema,
+    WatchlistManager,
 )
 
 # TODO: re-enable InvalidOptionId when broken endpoint function below is fixed
@@ -33,7 +40,16 @@ class Transaction(Enum):
     SELL = "sell"
 
 
-class Robinhood(InstrumentManager, SessionManager):
+class Robinhood(
+    WatchlistManager,
+    OptionManager,
+    ResolverManager,
+    PositionManager,
+    OrderManager,
+    InstrumentManager,
+    FundamentalsManager,
+    SessionManager,
+):
     """Wrapper class for fetching/parsing Robinhood endpoints.
 
     Please see :py:class:`pyrh.models.sessionmanager.SessionManager` for login functionality.
@@ -41,6 +57,14 @@ class Robinhood(InstrumentManager, SessionManager):
     Provides a global convenience wrapper for the following manager objects:
 
         * InstrumentManager
+        * OptionManager
+        * WatchlistManager
+        * FundamentalsManager
+        * ResolverManager
+        * OrderManager
+        * PositionManager
+        * QuoteManager
+        * MarketManager
         * TODO: Add to this list
 
     """
@@ -213,6 +237,10 @@ class Robinhood(InstrumentManager, SessionManager):
         """Fetch watchlists endpoint and queries for
         each instrumented result aka stock details returned from the watchlist
 
+        Note:
+            Only the first page of the first watchlist is returned, use
+            `all_watchlist_items` to read every watchlist.
+
         Returns:
             (:obj:`dict`): values returned from `watchlists` and `instrument` endpoints
         """
@@ -221,8 +249,7 @@ class Robinhood(InstrumentManager, SessionManager):
         watchlist = self.get(urls.WATCHLISTS)
         if watchlist and "results" in watchlist:
             data = self.get(watchlist["results"][0]["url"])
-            for rec in data["results"]:
-                res.append(self.get(rec["instrument"]))
+            res = self.get_many([rec["instrument"] for rec in data["results"]])
 
         return res
 
@@ -488,8 +515,7 @@ class Robinhood(InstrumentManager, SessionManager):
             (List): a list of Ticker strings
 
         """
-        instrument_list = self.get_url(urls.build_tags(tag))["instruments"]
-        return [self.get_url(instrument)["symbol"] for instrument in instrument_list]
+        return [instrument.symbol for instrument in self.instruments_by_tag(tag)]
 
     ###########################################################################
     #                           GET OPTIONS INFO                              #
@@ -651,6 +677,9 @@ class Robinhood(InstrumentManager, SessionManager):
     def positions(self):
         """Returns the user's positions data
 
+        See `stock_positions` for every page of positions as models and
+        `position_values` for their market value and unrealized P&L.
+
         Returns:
             (:object: `dict`): JSON dict from getting positions
 
@@ -666,7 +695,7 @@ class Robinhood(InstrumentManager, SessionManager):
 
         """
 
-        return self.get(str(urls.POSITIONS) + "?nonzero=true")
+        return self.get(urls.build_positions(nonzero=True))
 
     ###########################################################################
     #                               PLACE ORDER
@@ -952,8 +981,7 @@ class Robinhood(InstrumentManager, SessionManager):
             quantity=quantity,
         )
 
-    # TODO: fix the function complexity
-    def submit_sell_order(  # noqa: C901
+    def submit_sell_order(
         self,
         instrument_URL=None,
         symbol=None,
@@ -998,135 +1026,20 @@ class Robinhood(InstrumentManager, SessionManager):
 
         """
 
-        # Used for default price input
-        # Price is required, so we use the current bid price if it is not specified
-        current_quote = self.get_quote(symbol)
-        if (current_quote["bid_price"] == 0) or (current_quote["bid_price"] is None):
-            current_bid_price = current_quote["last_trade_price"]
-        else:
-            current_bid_price = current_quote["bid_price"]
-
-        # Start with some parameter checks. I'm paranoid about $.
-        if instrument_URL is None:
-            if symbol is None:
-                raise (
-                    ValueError(
-                        "Neither instrument_URL nor symbol were passed to "
-                        "submit_sell_order"
-                    )
-                )
-            raise (ValueError("Instrument_URL not passed to submit_sell_order"))
-
-        if symbol is None:
-            raise (ValueError("Symbol not passed to submit_sell_order"))
-
-        if side is None:
-            raise (
-                ValueError("Order is neither buy nor sell in call to submit_sell_order")
-            )
-
-        if order_type is None:
-            if price is None:
-                if stop_price is None:
-                    order_type = "market"
-                else:
-                    order_type = "limit"
-
-        symbol = str(symbol).upper()
-        order_type = str(order_type).lower()
-        time_in_force = str(time_in_force).lower()
-        trigger = str(trigger).lower()
-        side = str(side).lower()
-
-        if (order_type != "market") and (order_type != "limit"):
-            raise (ValueError("Invalid order_type in call to submit_sell_order"))
-
-        if order_type == "limit":
-            if price is None:
-                raise (
-                    ValueError("Limit order has no price in call to submit_sell_order")
-                )
-            if price <= 0:
-                raise (
-                    ValueError(
-                        "Price must be positive number in call to submit_sell_order"
-                    )
-                )
-
-        if trigger == "stop":
-            if stop_price is None:
-                raise (
-                    ValueError(
-                        "Stop order has no stop_price in call to submit_sell_order"
-                    )
-                )
-            if price <= 0:
-                raise (
-                    ValueError(
-                        "Stop_price must be positive number in call to "
-                        "submit_sell_order"
-                    )
-                )
-
-        if stop_price is not None:
-            if trigger != "stop":
-                raise (
-                    ValueError(
-                        "Stop price set for non-stop order in call to submit_sell_order"
-                    )
-                )
-
-        if price is None:
-            if order_type == "limit":
-                raise (
-                    ValueError("Limit order has no price in call to submit_sell_order")
-                )
-
-        if price is not None:
-            if order_type.lower() == "market":
-                raise (
-                    ValueError(
-                        "Market order has price limit in call to submit_sell_order"
-                    )
-                )
-            price = float(price)
-        else:
-            price = current_bid_price  # default to current bid price
-
-        if quantity is None:
-            raise (ValueError("No quantity specified in call to submit_sell_order"))
-
-        quantity = int(quantity)
-
-        if quantity <= 0:
-            raise (
-                ValueError(
-                    "Quantity must be positive number in call to submit_sell_order"
-                )
-            )
-
-        payload = {}
-
-        for field, value in [
-            ("account", self.get_account()["url"]),
-            ("instrument", instrument_URL),
-            ("symbol", symbol),
-            ("type", order_type),
-            ("time_in_force", time_in_force),
-            ("trigger", trigger),
-            ("price", price),
-            ("stop_price", stop_price),
-            ("quantity", quantity),
-            ("side", side),
-        ]:
-            if value is not None:
-                payload[field] = value
-
-        res = self.post(urls.build_orders(), data=payload)
-        return res
+        return self._submit_legacy_order(
+            "submit_sell_order",
+            instrument_URL=instrument_URL,
+            symbol=symbol,
+            order_type=order_type,
+            time_in_force=time_in_force,
+            trigger=trigger,
+            price=price,
+            stop_price=stop_price,
+            quantity=quantity,
+            side=side,
+        )
 
-    # TODO: Fix function complexity
-    def submit_buy_order(  # noqa: C901
+    def submit_buy_order(
         self,
         instrument_URL=None,
         symbol=None,
@@ -1171,131 +1084,76 @@ class Robinhood(InstrumentManager, SessionManager):
 
         """
 
-        # Used for default price input
-        # Price is required, so we use the current ask price if it is not specified
-        current_quote = self.get_quote(symbol)
-        if (current_quote["ask_price"] == 0) or (current_quote["ask_price"] is None):
-            current_ask_price = current_quote["last_trade_price"]
-        else:
-            current_ask_price = current_quote["ask_price"]
-
-        # Start with some parameter checks. I'm paranoid about $.
-        if instrument_URL is None:
-            if symbol is None:
-                raise (
-                    ValueError(
-                        "Neither instrument_URL nor symbol were passed to "
-                        "submit_buy_order"
-                    )
-                )
-            raise (ValueError("Instrument_URL not passed to submit_buy_order"))
+        return self._submit_legacy_order(
+            "submit_buy_order",
+            instrument_URL=instrument_URL,
+            symbol=symbol,
+            order_type=order_type,
+            time_in_force=time_in_force,
+            trigger=trigger,
+            price=price,
+            stop_price=stop_price,
+            quantity=quantity,
+            side=side,
+        )
 
-        if symbol is None:
-            raise (ValueError("Symbol not passed to submit_buy_order"))
+    def _submit_legacy_order(
+        self,
+        caller,
+        instrument_URL=None,
+        symbol=None,
+        order_type=None,
+        time_in_force=None,
+        trigger=None,
+        price=None,
+        stop_price=None,
+        quantity=None,
+        side=None,
+    ):
+        """Translate the arguments of `submit_buy_order` and `submit_sell_order`.
 
-        if side is None:
-            raise (
-                ValueError("Order is neither buy nor sell in call to submit_buy_order")
-            )
-
-        if order_type is None:
-            if price is None:
-                if stop_price is None:
-                    order_type = "market"
-                else:
-                    order_type = "limit"
-
-        symbol = str(symbol).upper()
-        order_type = str(order_type).lower()
-        time_in_force = str(time_in_force).lower()
-        trigger = str(trigger).lower()
-        side = str(side).lower()
-
-        if (order_type != "market") and (order_type != "limit"):
-            raise (ValueError("Invalid order_type in call to submit_buy_order"))
-
-        if order_type == "limit":
-            if price is None:
-                raise (
-                    ValueError("Limit order has no price in call to submit_buy_order")
-                )
-            if price <= 0:
-                raise (
-                    ValueError(
-                        "Price must be positive number in call to submit_buy_order"
-                    )
-                )
-
-        if trigger == "stop":
-            if stop_price is None:
-                raise (
-                    ValueError(
-                        "Stop order has no stop_price in call to submit_buy_order"
-                    )
-                )
-            if price <= 0:
-                raise (
-                    ValueError(
-                        "Stop_price must be positive number in call to submit_buy_order"
-                    )
-                )
-
-        if stop_price is not None:
-            if trigger != "stop":
-                raise (
-                    ValueError(
-                        "Stop price set for non-stop order in call to submit_buy_order"
-                    )
-                )
-
-        if price is None:
-            if order_type == "limit":
-                raise (
-                    ValueError("Limit order has no price in call to submit_buy_order")
-                )
-
-        if price is not None:
-            if order_type.lower() == "market":
-                raise (
-                    ValueError(
-                        "Market order has price limit in call to submit_buy_order"
-                    )
-                )
-            price = float(price)
-        else:
-            price = current_ask_price  # default to current ask price
+        Args:
+            caller (str): The name of the public method, used in error messages.
+            instrument_URL (str): the RH URL for the instrument
+            symbol (str): the ticker symbol for the instrument
+            order_type (str): 'market' or 'limit'
+            time_in_force (str): 'gfd' or 'gtc'
+            trigger (str): 'immediate' or 'stop'
+            price (float): The share price you'll accept
+            stop_price (float): The price at which the order becomes a
+                                market or limit order
+            quantity (int): The number of shares to buy/sell
+            side (str): buy or sell
+
+        Returns:
+            (:obj:`dict`): JSON dict of the order from the `orders` post
+
+        Raises:
+            ValueError: The order is invalid.
 
+        """
+        if symbol is None:
+            raise ValueError(f"Symbol not passed to {caller}")
+        if side is None:
+            raise ValueError(f"Order is neither buy nor sell in call to {caller}")
         if quantity is None:
-            raise (ValueError("No quantity specified in call to submit_buy_order"))
-
-        quantity = int(quantity)
-
-        if quantity <= 0:
-            raise (
-                ValueError(
-                    "Quantity must be positive number in call to submit_buy_order"
-                )
-            )
-
-        payload = {}
-
-        for field, value in [
-            ("account", self.get_account()["url"]),
-            ("instrument", instrument_URL),
-            ("symbol", symbol),
-            ("type", order_type),
-            ("time_in_force", time_in_force),
-            ("trigger", trigger),
-            ("price", price),
-            ("stop_price", stop_price),
-            ("quantity", quantity),
-            ("side", side),
-        ]:
-            if value is not None:
-                payload[field] = value
-
-        res = self.post(urls.build_orders(), data=payload)
-        return res
+            raise ValueError(f"No quantity specified in call to {caller}")
+        order_type = order_type or ("market" if price is None else "limit")
+        if price is not None and order_type.lower() == "market":
+            raise ValueError(f"Market order has price limit in call to {caller}")
+
+        payload = self.prepare_order(
+            symbol,
+            int(quantity),
+            side,
+            order_type=order_type,
+            trigger=trigger or "immediate",
+            time_in_force=time_in_force or "gfd",
+            price=None if price is None else float(price),
+            stop_price=None if stop_price is None else float(stop_price),
+            instrument_url=instrument_URL,
+        )
+        return self.post_order(payload)
 
     def place_order(
         self,
@@ -1328,30 +1186,24 @@ class Robinhood(InstrumentManager, SessionManager):
         if isinstance(transaction, str):
             transaction = Transaction(transaction)
 
-        if not price:
-            price = self.quote_data(instrument["symbol"])["bid_price"]
-
-            if (price == 0) or (price is None):
-                price = self.quote_data(instrument["symbol"])["last_trade_price"]
-
-        payload = {
-            "account": self.get_account()["url"],
-            "instrument": unquote(instrument["url"]),
-            "symbol": instrument["symbol"],
-            "type": order.lower(),
-            "time_in_force": time_in_force.lower(),
-            "trigger": trigger,
-            "quantity": quantity,
-            "side": transaction.name.lower(),
-        }
-
-        if order.lower() == "stop":
-            payload["stop_price"] = float(price)
-        else:
-            payload["price"] = float(price)
+        # a stop order is a market order triggered at `price`
+        stop = order.lower() == "stop"
+        if not price and order.lower() != "market":
+            # limit and stop orders default to the price of a market order
+            price = self._market_price(instrument["symbol"], transaction.value)
+        payload = self.prepare_order(
+            instrument["symbol"],
+            quantity,
+            transaction.value,
+            order_type="market" if stop else order,
+            trigger="stop" if stop else trigger,
+            time_in_force=time_in_force,
+            price=None if stop or not price else float(price),
+            stop_price=float(price) if stop and price else None,
+            instrument_url=unquote(instrument["url"]),
+        )
 
-        res = self.post(urls.build_orders(), data=payload)
-        return res
+        return self.post_order(payload)
 
     def place_buy_order(self, instrument, quantity, ask_price=0.0):
         """Wrapper for placing buy orders
@@ -1368,15 +1220,7 @@ class Robinhood(InstrumentManager, SessionManager):
 
         """
 
-        if not ask_price:
-            ask_price = self.quote_data(instrument["symbol"])["ask_price"]
-
-            if (ask_price == 0) or (ask_price is None):
-                ask_price = self.quote_data(instrument["symbol"])["last_trade_price"]
-
-        transaction = Transaction.BUY
-
-        return self.place_order(instrument, quantity, ask_price, transaction)
+        return self.place_order(instrument, quantity, ask_price, Transaction.BUY)
 
     def place_sell_order(self, instrument, quantity, bid_price=0.0):
         """Wrapper for placing sell orders
@@ -1392,15 +1236,7 @@ class Robinhood(InstrumentManager, SessionManager):
             (:obj:`requests.request`): result from `orders` put command
 
         """
-        if not bid_price:
-            bid_price = self.quote_data(instrument["symbol"])["bid_price"]
-
-            if (bid_price == 0) or (bid_price is None):
-                bid_price = self.quote_data(instrument["symbol"])["last_trade_price"]
-
-        transaction = Transaction.SELL
-
-        return self.place_order(instrument, quantity, bid_price, transaction)
+        return self.place_order(instrument, quantity, bid_price, Transaction.SELL)
 
     ##############################
     # GET OPEN ORDER(S)
@@ -1409,109 +1245,48 @@ class Robinhood(InstrumentManager, SessionManager):
     def get_open_orders(self):
         """Returns all currently open (cancellable) orders.
 
-        If not orders are currently open, `None` is returned.
+        The first call pages through the whole order history, later calls only fetch
+        the orders updated since the previous call. See `OpenOrderTracker`.
 
-        TODO: Is there a way to get these from the API endpoint without stepping through
-            order history?
-        """
+        Returns:
+            (:obj:`list`): JSON dicts of the open orders
 
-        open_orders = []
-        orders = self.order_history()
-        for order in orders["results"]:
-            if order["cancel"] is not None:
-                open_orders.append(order)
+        """
 
-        return open_orders
+        return OrderSchema(many=True).dump(self.open_orders())
 
     ##############################
     #        CANCEL ORDER        #
     ##############################
 
-    # TODO: Fix function complexity
-    def cancel_order(self, order_id):  # noqa: C901
+    def cancel_order(self, order_id):
         """Cancels specified order and returns the response.
 
         If order cannot be cancelled, `None` is returned.
         (results from `orders` command).
 
         Args:
-            order_id (str or dict): Order ID string that is to be cancelled or open
-                order dict returned from order get.
+            order_id (str, dict or Order): Order ID string that is to be cancelled or
+                open order dict returned from order get or `get_open_orders`.
 
         Returns:
             (:obj:`requests.request`): result from `orders` put command
 
+        Raises:
+            ValueError: The order could not be fetched or cancelled.
+
         """
-        if isinstance(order_id, str):
-            try:
-                order = self.get(urls.build_orders(order_id))
-            except (requests.exceptions.HTTPError) as err_msg:
-                raise ValueError(
-                    "Failed to get Order for ID: "
-                    + order_id
-                    + "\n Error message: "
-                    + repr(err_msg)
-                )
-
-            if order.get("cancel") is not None:
-                try:
-                    res = self.post(order["cancel"])
-                    return res
-                except requests.exceptions.HTTPError:
-                    try:
-                        # sometimes Robinhood asks for another log in when placing an
-                        # order
-                        res = self.post(order["cancel"])
-                        return res
-                    except (requests.exceptions.HTTPError) as err_msg:
-                        raise ValueError(
-                            "Failed to cancel order ID: "
-                            + order_id
-                            + "\n Error message: "
-                            + repr(err_msg)
-                        )
-                        return None
-
-        elif isinstance(order_id, dict):
-            order_id = order_id["id"]
-            try:
-                order = self.get(urls.build_orders(order_id))
-            except (requests.exceptions.HTTPError) as err_msg:
-                raise ValueError(
-                    "Failed to get Order for ID: "
-                    + order_id
-                    + "\n Error message: "
-                    + repr(err_msg)
-                )
-
-            if order.get("cancel") is not None:
-                try:
-                    res = self.post(order["cancel"])
-                    return res
-                except requests.exceptions.HTTPError:
-                    try:
-                        # sometimes Robinhood asks for another log in when placing an
-                        # order
-                        res = self.post(order["cancel"])
-                        return res
-                    except requests.exceptions.HTTPError as err_msg:
-                        raise ValueError(
-                            "Failed to cancel order ID: "
-                            + order_id
-                            + "\n Error message: "
-                            + repr(err_msg)
-                        )
-                        return None
-
-        elif not isinstance(order_id, str) or not isinstance(order_id, dict):
+        result = self.cancel_orders([order_id])[0]
+        if isinstance(result.error, requests.exceptions.HTTPError) and result.order_id:
+            # the cancel link may be stale or robinhood may ask for another log in,
+            # so fetch the order again and retry once
+            result = self.cancel_orders([result.order_id])[0]
+        if result.error is not None:
             raise ValueError(
-                "Cancelling orders requires a valid order_id string or open order"
-                "dictionary"
-            )
-
-        # Order type cannot be cancelled without a valid cancel link
-        else:
-            raise ValueError("Unable to cancel order ID: " + order_id)
+                f"Failed to cancel order ID: {result.order_id}\n"
+                f" Error message: {result.error!r}"
+            ) from result.error
+        return result.response
 
 
 class RobinhoodSchema(SessionManagerSchema):
@@ -1,6 +1,7 @@
 """Define Robinhood endpoints."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional
 
 from yarl import URL
 
@@ -19,7 +20,7 @@ DOCUMENT_REQUESTS = API_BASE / "upload/document_requests/"  # not implemented
 FUNDAMENTALS_BASE = API_BASE / "fundamentals/"
 INSTRUMENTS_BASE = API_BASE / "instruments/"
 MARGIN_UPGRADES = API_BASE / "margin/upgrades/"  # not implemented
-MARKETS = API_BASE / "markets/"  # not implemented
+MARKETS = API_BASE / "markets/"
 MARKET_DATA_BASE = API_BASE / "marketdata/"
 NEWS_BASE = API_BASE / "midlands/news/"
 NOTIFICATIONS = API_BASE / "notifications/"  # not implemented
@@ -33,6 +34,7 @@ WATCHLISTS = API_BASE / "watchlists/"
 OPTIONS_BASE = API_BASE / "options/"
 OPTIONS_CHAIN_BASE = OPTIONS_BASE / "chains/"
 OPTIONS_INSTRUMENTS_BASE = OPTIONS_BASE / "instruments/"
+OPTIONS_MARKET_DATA = MARKET_DATA_BASE / "options/"
 
 # User
 USER = API_BASE / "user/"
@@ -74,7 +76,10 @@ def build_ach(option: str) -> URL:
 
 
 def instruments(
-    symbol: Optional[str] = None, query: Optional[str] = None, id_: Optional[str] = None
+    symbol: Optional[str] = None,
+    query: Optional[str] = None,
+    id_: Optional[str] = None,
+    ids: Optional[Iterable[str]] = None,
 ) -> URL:
     """Construct urls that query instruments.
 
@@ -85,6 +90,7 @@ def instruments(
         symbol: A stock ticker symbol.
         query: Keyword to search for an instrument. (might be in name or ticker)
         id_: The UUID that represents the instrument.
+        ids: Several instrument UUIDs to fetch in a single request.
 
     Returns:
         A constructed URL with the embedded query parameter
@@ -100,13 +106,18 @@ def instruments(
         return INSTRUMENTS_BASE.with_query(query=query)
     elif id_ is not None:
         return INSTRUMENTS_BASE / f"{id_}/"
+    elif ids is not None:
+        return INSTRUMENTS_BASE.with_query(ids=",".join(ids))
 
 
-def build_orders(order_id: Optional[str] = None) -> URL:
+def build_orders(
+    order_id: Optional[str] = None, updated_since: Optional[datetime] = None
+) -> URL:
     """Build endpoint to place orders."
 
     Args:
         order_id: the id of the order
+        updated_since: Only list the orders updated at or after this time.
 
     Returns:
         A constructed URL for a particular order or the base URL for all orders.
@@ -114,6 +125,8 @@ def build_orders(order_id: Optional[str] = None) -> URL:
     """
     if order_id is not None:
         return ORDERS_BASE / f"{order_id}/"
+    elif updated_since is not None:
+        return ORDERS_BASE.with_query({"updated_at[gte]": updated_since.isoformat()})
     else:
         return ORDERS_BASE
 
@@ -144,6 +157,32 @@ def build_fundamentals(stock: str) -> URL:
     return FUNDAMENTALS_BASE / f"{stock}/"
 
 
+def build_fundamentals_batch(stocks: Iterable[str]) -> URL:
+    """Build fundamentals endpoint for several stocks at once
+
+    Args:
+        stocks: The stock tickers to build the URL
+
+    Returns:
+        A constructed URL of the fundamentals for all of the input stock tickers.
+
+    """
+    return FUNDAMENTALS_BASE.with_query(symbols=",".join(stocks))
+
+
+def build_quotes(stocks: Iterable[str]) -> URL:
+    """Build quotes endpoint for several stocks at once
+
+    Args:
+        stocks: The stock tickers to build the URL
+
+    Returns:
+        A constructed URL of the quotes for all of the input stock tickers.
+
+    """
+    return QUOTES.with_query(symbols=",".join(stocks))
+
+
 def build_tags(tag: str) -> URL:
     """Build endpoints for tickers with a particular tag.
 
@@ -157,6 +196,32 @@ def build_tags(tag: str) -> URL:
     return TAGS_BASE / f"{tag}/"
 
 
+def build_positions(nonzero: bool = False) -> URL:
+    """Build endpoint for the stock positions of the account.
+
+    Args:
+        nonzero: Whether to only list the positions that still hold shares.
+
+    Returns:
+        A constructed URL of the positions.
+
+    """
+    return POSITIONS.with_query(nonzero="true") if nonzero else POSITIONS
+
+
+def build_watchlist(name: str) -> URL:
+    """Build endpoint for the items of a particular watchlist.
+
+    Args:
+        name: The name of the watchlist, robinhood's own is called `Default`.
+
+    Returns:
+        A constructed URL for the watchlist.
+
+    """
+    return WATCHLISTS / f"{name}/"
+
+
 def build_chain(instrument_id: str) -> URL:
     """Build the query for a particular options chain.
 
@@ -194,6 +259,20 @@ def build_options(chain_id: str, dates: str, option_type: str) -> URL:
     )
 
 
+def build_market_hours(mic: str, date: str) -> URL:
+    """Build the trading hours endpoint of a market.
+
+    Args:
+        mic: The market identifier code of the market such as XNAS.
+        date: The day (YYYY-MM-DD) to get the hours of.
+
+    Returns:
+        A constructed URL for the hours of the market on that day.
+
+    """
+    return MARKETS / f"{mic}/hours/{date}/"
+
+
 def build_market_data(option_id: Optional[str] = None) -> URL:
     """Build market data endpoint.
 
@@ -207,3 +286,41 @@ def build_market_data(option_id: Optional[str] = None) -> URL:
         return MARKET_DATA_BASE / f"{option_id}/"
     else:
         return MARKET_DATA_BASE
+
+
+def build_option_instruments(
+    chain_id: str,
+    expiration_dates: Optional[Iterable[str]] = None,
+    option_type: Optional[str] = None,
+) -> URL:
+    """Build the query for the tradable contracts of an options chain.
+
+    Args:
+        chain_id: The id for a particular options chain.
+        expiration_dates: The expiration dates (YYYY-MM-DD) to restrict the contracts
+            to, all expiration dates are returned if omitted.
+        option_type: Either 'call' or 'put', both are returned if omitted.
+
+    Returns:
+        A constructed URL for the options instruments search.
+
+    """
+    query = {"chain_id": chain_id, "state": "active", "tradability": "tradable"}
+    if expiration_dates is not None:
+        query["expiration_dates"] = ",".join(expiration_dates)
+    if option_type is not None:
+        query["type"] = option_type
+    return OPTIONS_INSTRUMENTS_BASE.with_query(query)
+
+
+def build_option_market_data(option_ids: Iterable[str]) -> URL:
+    """Build the market data endpoint for several option contracts at once.
+
+    Args:
+        option_ids: The ids of the option contracts.
+
+    Returns:
+        A constructed URL for the market data of all of the `option_ids`.
+
+    """
+    return OPTIONS_MARKET_DATA.with_query(ids=",".join(option_ids))
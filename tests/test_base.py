@@ -34,3 +34,82 @@ def test_base_schema():
     load_bm = BaseSchema().load({"a": 10})
     assert bm == load_bm
     assert type(bm) == type(load_bm)
+
+
+def test_first_result_fields_are_loaded():
+    from datetime import datetime
+    from uuid import UUID
+
+    from pyrh.models import InstrumentSchema, PortfolioSchema
+
+    portfolio = PortfolioSchema().load(
+        {
+            "results": [
+                {
+                    "equity": "1000.5000",
+                    "market_value": "900.0000",
+                    "extended_hours_equity": None,
+                    "start_date": "2020-01-02T00:00:00",
+                }
+            ]
+        }
+    )
+    assert portfolio.equity == 1000.5 and portfolio.market_value == 900.0
+    assert portfolio.extended_hours_equity is None
+    assert portfolio.start_date == datetime(2020, 1, 2)
+
+    id_ = "450dfc6d-5510-4d40-abfb-f633b7d9be3e"
+    instrument = InstrumentSchema().load(
+        {"results": [{"id": id_, "day_trade_ratio": "0.2500", "tradeable": True}]}
+    )
+    assert instrument.id == UUID(id_) and instrument.day_trade_ratio == 0.25
+
+    assert InstrumentSchema().load({"results": []}) == InstrumentSchema().load({})
+
+
+def test_intern_fields():
+    import json
+
+    from pyrh.models.base import intern_fields
+
+    account = "https://api.robinhood.com/accounts/5PY78241/"
+    payload = json.dumps(
+        {
+            "results": [
+                {"account": account, "id": "1", "executions": [{"account": account}]},
+                {"account": account, "id": "1"},
+            ]
+        }
+    )
+
+    plain = json.loads(payload)["results"]
+    assert plain[0]["account"] is not plain[1]["account"]
+
+    data = intern_fields(json.loads(payload))["results"]
+    assert (
+        data[0]["account"] is data[1]["account"] is data[0]["executions"][0]["account"]
+    )
+
+
+def test_rate_limiter(monkeypatch):
+    from pyrh.models.base import RateLimiter
+
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("pyrh.models.base.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("pyrh.models.base.time.sleep", sleep)
+
+    limiter = RateLimiter(rate=2, burst=2)
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+    assert sleeps == [0.5, 0.5]
+
+    clock[0] += 10
+    # the bucket refills up to the burst only
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.5]
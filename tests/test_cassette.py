@@ -0,0 +1,93 @@
+"""Test recording and replaying sessions."""
+
+import pytest
+
+from pyrh.exceptions import UnrecordedRequest
+
+
+@pytest.fixture
+def server():
+    from pyrh.mock_server import MockRobinhoodServer
+
+    with MockRobinhoodServer(instruments=10, latency=0.01) as server:
+        yield server
+
+
+@pytest.fixture
+def rh(server):
+    from pyrh import Robinhood
+
+    return Robinhood(
+        username="user@example.com", password="some password", api_base=server.url
+    )
+
+
+def test_record_scrubs_credentials(tmp_path, rh):
+    from pyrh.cassette import SCRUBBED, record
+
+    path = tmp_path / "session.json.gz"
+    with record(rh, path) as cassette:
+        rh.login()
+        rh.quotes(["AAAA"])
+
+    text = path.read_bytes()
+    assert text.startswith(b"\x1f\x8b")
+    login = cassette.interactions[0]
+    # the original urls are recorded, not the rewritten ones
+    assert login["url"] == "https://api.robinhood.com/oauth2/token/"
+    assert "some+password" not in login["body"]
+    assert f"password={SCRUBBED}" in login["body"].replace("%2A", "*")
+    assert f'"access_token":"{SCRUBBED}"' in login["response"]
+    assert all("Authorization" not in str(i) for i in cassette.interactions)
+    assert all(rh.oauth.access_token not in str(i) for i in cassette.interactions)
+
+
+def test_replay(tmp_path, monkeypatch, server, rh):
+    from pyrh.cassette import Cassette, record, replay
+
+    path = tmp_path / "session.json"
+    with record(rh, path):
+        first = rh.quotes(["AAAA", "AAAB"])
+        rh.get_quote("AAAA")
+    server.stop()
+
+    cassette = Cassette.load(path)
+    assert len(cassette) == 2
+    with replay(rh, cassette):
+        assert rh.quotes(["AAAA", "AAAB"]) == first
+        assert rh.get_quote("AAAA")["symbol"] == "AAAA"
+        with pytest.raises(UnrecordedRequest):
+            rh.get_quote("AAAB")
+
+    sleeps = []
+    monkeypatch.setattr("pyrh.cassette.time.sleep", sleeps.append)
+    with replay(rh, path, realtime=True):
+        rh.get_quote("AAAA")
+    assert sleeps == [cassette.interactions[-1]["elapsed"]]
+    assert sleeps[0] >= 0.01
+
+
+def test_replay_repeats_in_order():
+    from pyrh import Robinhood
+    from pyrh.cassette import Cassette, replay
+
+    url = "https://api.robinhood.com/quotes/AAAA/"
+    cassette = Cassette(
+        [
+            {
+                "method": "GET",
+                "url": url,
+                "body": None,
+                "status": status,
+                "headers": {"Content-Type": "application/json"},
+                "response": '{"symbol": "AAAA"}',
+                "elapsed": 0.0,
+            }
+            for status in (500, 200)
+        ]
+    )
+    rh = Robinhood(username="user@example.com", password="some password")
+    with replay(rh, cassette):
+        statuses = [rh.session.get(url).status_code for _ in range(3)]
+
+    assert statuses == [500, 200, 200]
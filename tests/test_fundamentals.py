@@ -0,0 +1,104 @@
+"""Test fundamentals."""
+
+import pytest
+import requests_mock
+
+FUNDAMENTALS = "https://api.robinhood.com/fundamentals/"
+
+
+def _fundamentals(market_cap, pe_ratio, symbol="AAPL"):
+    return {
+        "market_cap": None if market_cap is None else f"{market_cap:.6f}",
+        "pe_ratio": None if pe_ratio is None else f"{pe_ratio:.6f}",
+        "sector": "Technology",
+        "symbol": symbol,
+    }
+
+
+@pytest.fixture
+def fm_adap():
+    from pyrh.models import FundamentalsManager
+
+    fm = FundamentalsManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    fm.session.mount("https://", adapter)
+
+    return fm, adapter
+
+
+def test_fundamentals_table_screen():
+    from pyrh.exceptions import PyrhValueError
+    from pyrh.models import FundamentalsSchema, FundamentalsTable
+
+    table = FundamentalsTable()
+    for symbol, market_cap, pe_ratio in [
+        ("aapl", 2e12, 30),
+        ("F", 5e10, 8),
+        ("TSLA", 6e11, None),
+        ("GME", 1e9, 12),
+    ]:
+        data = FundamentalsSchema().load(_fundamentals(market_cap, pe_ratio))
+        table.upsert(symbol, data)
+    table.upsert("XXXX", None)
+
+    assert len(table) == 5
+    assert "AAPL" in table
+    assert table.row("tsla")["pe_ratio"] is None
+    assert table.screen(("market_cap", ">", 1e10), ("pe_ratio", "<", 20)) == ["F"]
+    assert table.screen(("market_cap", ">=", 6e11)) == ["AAPL", "TSLA"]
+    assert table.screen() == ["AAPL", "F", "TSLA", "GME", "XXXX"]
+
+    with pytest.raises(PyrhValueError):
+        table.mask("nope", ">", 1)
+    with pytest.raises(PyrhValueError):
+        table.mask("pe_ratio", "~", 1)
+
+
+def test_fundamentals_batch(monkeypatch, fm_adap):
+    fm, adapter = fm_adap
+    monkeypatch.setattr("pyrh.models.fundamentals.MAX_FUNDAMENTALS_SYMBOLS", 2)
+
+    adapter.register_uri(
+        "GET",
+        f"{FUNDAMENTALS}?symbols=AAPL,F",
+        json={"results": [_fundamentals(2e12, 30, "AAPL"), None]},
+    )
+    adapter.register_uri(
+        "GET",
+        f"{FUNDAMENTALS}?symbols=TSLA",
+        json={"results": [_fundamentals(6e11, 100, "TSLA")]},
+    )
+
+    table = fm.fundamentals_batch(["AAPL", "f", "TSLA", "AAPL"])
+
+    assert adapter.call_count == 2
+    assert table.symbols == ["AAPL", "F", "TSLA"]
+    assert table.row("F")["market_cap"] is None
+    assert table.screen(("pe_ratio", ">", 50)) == ["TSLA"]
+
+    # fresh rows are not fetched again
+    fm.fundamentals_batch(["AAPL", "TSLA"])
+    assert adapter.call_count == 2
+
+    # only the stale rows are, results are matched by symbol not by position
+    adapter.register_uri(
+        "GET",
+        f"{FUNDAMENTALS}?symbols=AAPL,F",
+        json={
+            "results": [_fundamentals(5e10, 8, "F"), _fundamentals(3e12, 31, "AAPL")]
+        },
+    )
+    fm.fundamentals_batch(["AAPL", "F", "TSLA"], ttl=0)
+    assert adapter.call_count == 4
+    assert table.row("AAPL")["market_cap"] == 3e12
+    assert table.row("F")["market_cap"] == 5e10
+
+    # a result left out of the response is not attached to another symbol
+    adapter.register_uri(
+        "GET",
+        f"{FUNDAMENTALS}?symbols=AAPL,F",
+        json={"results": [_fundamentals(6e10, 9, "F")]},
+    )
+    fm.fundamentals_batch(["AAPL", "F"], ttl=0)
+    assert table.row("AAPL")["market_cap"] is None
+    assert table.row("F")["market_cap"] == 6e10
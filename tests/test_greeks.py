@@ -0,0 +1,109 @@
+"""Test the options greeks engine."""
+
+from datetime import date, datetime
+
+import pytest
+import pytz
+
+np = pytest.importorskip("numpy")
+
+NOW = datetime(2020, 1, 1, 21, tzinfo=pytz.UTC)  # 4pm in New York
+
+
+def test_greeks_reference_values():
+    from pyrh.greeks import greeks
+
+    columns = greeks(100.0, [100.0, 100.0], [1.0, 1.0], [0.2, 0.2], [True, False], 0.05)
+
+    assert columns["delta"][0] == pytest.approx(0.6368, abs=1e-4)
+    assert columns["delta"][1] == pytest.approx(0.6368 - 1, abs=1e-4)
+    assert columns["gamma"][0] == pytest.approx(0.018762, abs=1e-6)
+    assert columns["vega"][0] == pytest.approx(0.37524, abs=1e-5)
+    assert columns["theta"][0] == pytest.approx(-6.414 / 365, abs=1e-5)
+
+
+def test_implied_volatilities():
+    from pyrh.greeks import _price, implied_volatilities
+
+    strikes = [60.0, 90.0, 100.0, 110.0, 180.0, 100.0]
+    times = [0.05, 0.25, 1.0, 2.0, 0.5, None]
+    is_call = [True, False, True, False, True, True]
+    vols = [0.9, 0.35, 0.2, 0.15, 0.6, 0.2]
+    prices = [
+        _price(100.0, k, t or 1.0, v, 0.01, c)
+        for k, t, v, c in zip(strikes, times, vols, is_call)
+    ]
+    prices.append(0.0)  # below intrinsic value
+    strikes.append(50.0)
+    times.append(1.0)
+    is_call.append(True)
+
+    solved = implied_volatilities(prices, 100.0, strikes, times, is_call, 0.01)
+
+    assert solved[:5] == pytest.approx(vols[:5], abs=1e-4)
+    assert np.isnan(solved[5:]).all()
+
+
+def test_implied_volatilities_not_converging():
+    from pyrh.greeks import MAX_VOLATILITY, MIN_VOLATILITY, _price, implied_volatilities
+
+    # within the no-arbitrage bounds but outside of the volatility bracket
+    high = 0.5 * (_price(100.0, 100.0, 1.0, MAX_VOLATILITY, 0.0, True) + 100.0)
+    low = 0.5 * _price(100.0, 100.0, 1.0, MIN_VOLATILITY, 0.0, False)
+
+    solved = implied_volatilities(
+        [high, low, 8.0], 100.0, [100.0] * 3, [1.0] * 3, [True, False, True]
+    )
+
+    assert np.isnan(solved[:2]).all()
+    assert _price(100.0, 100.0, 1.0, solved[2], 0.0, True) == pytest.approx(8.0)
+
+
+def test_implied_volatilities_of_tiny_prices():
+    from pyrh.greeks import IV_TOLERANCE, _price, implied_volatilities
+
+    # far out of the money contracts worth much less than IV_TOLERANCE
+    strikes, vols = [200.0, 40.0, 160.0], [0.4, 0.3, 0.3]
+    is_call = [True, False, True]
+    prices = [
+        _price(100.0, k, 0.1, v, 0.0, c) for k, v, c in zip(strikes, vols, is_call)
+    ]
+    assert max(prices) < IV_TOLERANCE
+
+    solved = implied_volatilities(prices, 100.0, strikes, [0.1] * 3, is_call)
+
+    assert solved == pytest.approx(vols, abs=1e-5)
+
+
+def test_chain_greeks():
+    from pyrh.greeks import _price, chain_greeks
+    from pyrh.models.base import UnknownModel
+    from pyrh.models.option import OptionInstrument
+
+    def contract(option_id, type_, strike, market_data):
+        return OptionInstrument(
+            id=option_id,
+            type=type_,
+            strike_price=strike,
+            expiration_date=date(2020, 2, 12),  # 42 days
+            market_data=market_data,
+        )
+
+    mark = _price(100.0, 105.0, 42 / 365, 0.3, 0.0, True)
+    contracts = [
+        contract("a", "call", 105.0, UnknownModel(mark_price=mark)),
+        contract("b", "put", 95.0, UnknownModel(bid_price=1.0, ask_price=1.2)),
+        contract("c", "put", 90.0, None),
+    ]
+
+    table = chain_greeks(contracts, {"last_trade_price": "100.00"}, now=NOW)
+
+    assert len(table) == 3
+    assert table["a"].implied_volatility == pytest.approx(0.3, abs=1e-5)
+    assert 0 < table["a"].delta < 0.5
+    assert -0.5 < table["b"].delta < 0
+    assert table["b"].theta < 0
+    assert table["c"] == (None, None, None, None, None)
+    assert np.isnan(table.delta[2])
+    with pytest.raises(AttributeError):
+        table.rho
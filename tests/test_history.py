@@ -0,0 +1,160 @@
+"""Test the order history store."""
+
+import re
+from datetime import datetime
+
+import pytest
+import pytz
+import requests_mock
+
+ORDERS = "https://api.robinhood.com/orders/"
+UPDATED_SINCE = re.compile(r"https://api\.robinhood\.com/orders/\?updated_at%5Bgte%5D=")
+INSTRUMENTS = "https://api.robinhood.com/instruments/"
+AAPL = "450dfc6d-5510-4d40-abfb-f633b7d9be3e"
+TSLA = "e39ed23a-7bd1-4587-b060-71988d9ef483"
+IDS = [
+    "ebab2398-028d-4939-9f1d-13bf38f81c50",
+    "a4ecd608-e7b4-4ff3-afa5-f77ae7632dfb",
+    "0e5a4d7c-3f87-4d7c-a5f6-2e0c2bd1e21b",
+]
+
+
+def _order(id_, instrument, state, day, updated=None):
+    return {
+        "id": id_,
+        "url": f"{ORDERS}{id_}/",
+        "instrument": f"{INSTRUMENTS}{instrument}/",
+        "side": "buy",
+        "state": state,
+        "quantity": 1,
+        "cumulative_quantity": 1 if state == "filled" else 0,
+        "average_price": None,
+        "last_transaction_at": None,
+        "created_at": f"2020-01-0{day}T00:00:00+00:00",
+        "updated_at": f"2020-01-0{updated or day}T00:00:00+00:00",
+    }
+
+
+@pytest.fixture
+def rh_adap():
+    from pyrh.models import InstrumentManager
+
+    im = InstrumentManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    im.session.mount("https://", adapter)
+    adapter.register_uri(
+        "GET",
+        re.compile(r"https://api\.robinhood\.com/instruments/\?ids="),
+        json={
+            "results": [
+                {"id": AAPL, "symbol": "AAPL", "url": f"{INSTRUMENTS}{AAPL}/"},
+                {"id": TSLA, "symbol": "TSLA", "url": f"{INSTRUMENTS}{TSLA}/"},
+            ]
+        },
+    )
+
+    return im, adapter
+
+
+def test_history_sync_and_export(rh_adap, tmp_path):
+    from pyrh.models import OrderHistoryStore
+
+    im, adapter = rh_adap
+    full = adapter.register_uri(
+        "GET",
+        ORDERS,
+        json={
+            "results": [
+                _order(IDS[0], AAPL, "filled", 1),
+                _order(IDS[1], TSLA, "confirmed", 2),
+            ],
+            "next": None,
+        },
+    )
+    store = OrderHistoryStore()
+
+    report = store.sync(im)
+
+    assert sorted(report.added) == sorted(IDS[:2])
+    assert [store.symbol(order) for order in store.export()] == ["AAPL", "TSLA"]
+
+    path = tmp_path / "orders.json"
+    store.save(path)
+    store = OrderHistoryStore.load(path)
+    delta = adapter.register_uri(
+        "GET",
+        UPDATED_SINCE,
+        json={
+            "results": [
+                _order(IDS[1], TSLA, "filled", 2, updated=3),
+                _order(IDS[2], AAPL, "cancelled", 3),
+            ],
+            "next": None,
+        },
+    )
+
+    report = store.sync(im)
+
+    assert full.call_count == 1 and delta.call_count == 1
+    assert report.added == [IDS[2]] and report.changed == [IDS[1]]
+    assert store.updated_at == datetime(2020, 1, 3, tzinfo=pytz.UTC)
+
+    def ids(**kwargs):
+        return [str(order.id) for order in store.export(**kwargs)]
+
+    assert ids() == IDS
+    assert ids(symbol="aapl") == [IDS[0], IDS[2]]
+    assert ids(state="filled") == IDS[:2]
+    assert ids(
+        start=datetime(2020, 1, 2, tzinfo=pytz.UTC),
+        end=datetime(2020, 1, 3, tzinfo=pytz.UTC),
+    ) == [IDS[1]]
+
+
+def test_history_sync_retries_unknown_symbols(rh_adap):
+    from pyrh.models import OrderHistoryStore
+
+    im, adapter = rh_adap
+    adapter.register_uri(
+        "GET",
+        re.compile(r"https://api\.robinhood\.com/instruments/\?ids="),
+        json={
+            "results": [{"id": AAPL, "symbol": "AAPL", "url": f"{INSTRUMENTS}{AAPL}/"}]
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        ORDERS,
+        json={
+            "results": [
+                _order(IDS[0], AAPL, "filled", 1),
+                _order(IDS[1], TSLA, "filled", 2),
+            ],
+            "next": None,
+        },
+    )
+    store = OrderHistoryStore()
+    store.sync(im)
+
+    assert [store.symbol(order) for order in store.export()] == ["AAPL", None]
+
+    lookup = adapter.register_uri(
+        "GET",
+        re.compile(r"https://api\.robinhood\.com/instruments/\?ids="),
+        json={
+            "results": [{"id": TSLA, "symbol": "TSLA", "url": f"{INSTRUMENTS}{TSLA}/"}]
+        },
+    )
+    adapter.register_uri("GET", UPDATED_SINCE, json={"results": [], "next": None})
+
+    report = store.sync(im)
+
+    assert report.added == [] and report.changed == []
+    assert TSLA in lookup.last_request.url
+    assert [store.symbol(order) for order in store.export()] == ["AAPL", "TSLA"]
+
+
+def test_history_load_missing_file(tmp_path):
+    from pyrh.models import OrderHistoryStore
+
+    assert len(OrderHistoryStore.load(tmp_path / "missing.json")) == 0
@@ -0,0 +1,320 @@
+"""Test instruments."""
+
+import re
+
+import pytest
+import requests_mock
+
+INSTRUMENT_IDS = [
+    "450dfc6d-5510-4d40-abfb-f633b7d9be3e",
+    "e39ed23a-7bd1-4587-b060-71988d9ef483",
+    "ebab2398-028d-4939-9f1d-13bf38f81c50",
+]
+
+
+def _instrument(id_, symbol):
+    return {
+        "id": id_,
+        "symbol": symbol,
+        "url": f"https://api.robinhood.com/instruments/{id_}/",
+    }
+
+
+def _url(id_):
+    return f"https://api.robinhood.com/instruments/{id_}/"
+
+
+@pytest.fixture
+def im_adap():
+    from pyrh.models import InstrumentManager
+
+    im = InstrumentManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    im.session.mount("https://", adapter)
+
+    return im, adapter
+
+
+def test_paginator_schema_nested_instruments():
+    from pyrh.models import InstrumentPaginatorSchema
+
+    paginator = InstrumentPaginatorSchema().load(
+        {
+            "next": None,
+            "previous": None,
+            "results": [_instrument(INSTRUMENT_IDS[0], "AAPL"), None],
+        }
+    )
+
+    assert paginator[0].symbol == "AAPL"
+    assert paginator[1] is None
+
+
+def test_instruments_skips_null_results(im_adap):
+    im, adapter = im_adap
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?query=AAPL",
+        json={
+            "next": None,
+            "previous": None,
+            "results": [None, _instrument(INSTRUMENT_IDS[0], "AAPL")],
+        },
+    )
+
+    assert [i.symbol for i in im.instruments("AAPL")] == ["AAPL"]
+
+
+def test_ttl_cache(monkeypatch):
+    from pyrh.models.base import TTLCache
+
+    now = [100.0]
+    monkeypatch.setattr("pyrh.models.base.time.monotonic", lambda: now[0])
+
+    cache = TTLCache(10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+    assert "a" in cache and cache.get("b") == 2
+    assert len(cache) == 2
+
+    now[0] = 115.0
+    assert "a" not in cache
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 1
+    assert cache.pop("b") == 2
+    assert cache.pop("b") is None
+
+
+def test_instruments_by_url(monkeypatch, im_adap):
+    im, adapter = im_adap
+    monkeypatch.setattr("pyrh.models.instrument.MAX_INSTRUMENT_IDS", 2)
+
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/instruments/?ids={INSTRUMENT_IDS[0]},"
+        f"{INSTRUMENT_IDS[1]}",
+        json={
+            "next": None,
+            "previous": None,
+            "results": [_instrument(INSTRUMENT_IDS[0], "AAPL"), None],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/instruments/?ids={INSTRUMENT_IDS[2]}",
+        json={
+            "next": None,
+            "previous": None,
+            "results": [_instrument(INSTRUMENT_IDS[2], "MSFT")],
+        },
+    )
+
+    urls = [_url(id_) for id_ in INSTRUMENT_IDS]
+    instruments = im.instruments_by_url(urls + urls[:1])
+
+    assert [getattr(i, "symbol", None) for i in instruments] == [
+        "AAPL",
+        None,
+        "MSFT",
+        "AAPL",
+    ]
+    assert adapter.call_count == 2
+
+    # cached instruments are not fetched again
+    assert im.instruments_by_url([urls[2], urls[0]])[0].symbol == "MSFT"
+    assert adapter.call_count == 2
+
+
+def test_instruments_by_tag(im_adap):
+    im, adapter = im_adap
+
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/midlands/tags/tag/100-most-popular/",
+        json={"instruments": [_url(INSTRUMENT_IDS[1]), _url(INSTRUMENT_IDS[0])]},
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/",
+        json={
+            "next": None,
+            "previous": None,
+            "results": [
+                _instrument(INSTRUMENT_IDS[0], "AAPL"),
+                _instrument(INSTRUMENT_IDS[1], "TSLA"),
+            ],
+        },
+    )
+
+    symbols = [i.symbol for i in im.instruments_by_tag("100-most-popular")]
+    assert symbols == ["TSLA", "AAPL"]
+    assert adapter.call_count == 2
+
+    im.instruments_by_tag("100-most-popular")
+    assert adapter.call_count == 2
+
+
+def _linked_instrument(id_, symbol):
+    return {
+        **_instrument(id_, symbol),
+        "fundamentals": f"https://api.robinhood.com/fundamentals/{symbol}/",
+        "market": "https://api.robinhood.com/markets/XNAS/",
+        "quote": f"https://api.robinhood.com/quotes/{symbol}/",
+        "splits": f"{_url(id_)}splits/",
+    }
+
+
+def test_instrument_linked_resources(im_adap):
+    from pyrh.exceptions import PyrhValueError
+    from pyrh.models import Instrument, InstrumentSchema
+
+    im, adapter = im_adap
+    adapter.register_uri(
+        "GET",
+        re.compile(r"https://api\.robinhood\.com/markets/XNAS/hours/.*"),
+        json={
+            "is_open": True,
+            "opens_at": "2000-01-01T00:00:00Z",
+            "closes_at": "2100-01-01T00:00:00Z",
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=AAPL",
+        json={"results": [_linked_instrument(INSTRUMENT_IDS[0], "AAPL")]},
+    )
+    quotes = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/quotes/?symbols=AAPL",
+        json={"results": [{"symbol": "AAPL", "last_trade_price": "150.0100"}]},
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/markets/XNAS/",
+        json={"acronym": "NASDAQ", "mic": "XNAS"},
+    )
+    adapter.register_uri(
+        "GET",
+        f"{_url(INSTRUMENT_IDS[0])}splits/",
+        json={
+            "next": f"{_url(INSTRUMENT_IDS[0])}splits/?cursor=1",
+            "previous": None,
+            "results": [{"execution_date": "2020-08-31", "multiplier": "4.0"}],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        f"{_url(INSTRUMENT_IDS[0])}splits/?cursor=1",
+        json={
+            "next": None,
+            "previous": None,
+            "results": [{"execution_date": "2014-06-09", "multiplier": "7.0"}],
+        },
+    )
+
+    instrument = im.instrument(symbol="AAPL")
+    assert instrument.get_quote().last_trade_price == 150.01
+    assert instrument.get_quote().last_trade_price == 150.01
+    assert quotes.call_count == 1
+    instrument.get_quote(refresh=True)
+    assert quotes.call_count == 2
+
+    assert instrument.get_market().mic == "XNAS"
+    assert [s.multiplier for s in instrument.get_splits()] == [4.0, 7.0]
+
+    # the binding and memoized values are not part of the model itself
+    loaded = InstrumentSchema().load(
+        {"results": [_linked_instrument(INSTRUMENT_IDS[0], "AAPL")]}
+    )
+    assert loaded == instrument
+    assert "_session" not in repr(instrument)
+
+    with pytest.raises(PyrhValueError):
+        Instrument(symbol="AAPL").get_quote()
+
+
+def test_hydrate_instruments(monkeypatch, im_adap):
+    from pyrh.exceptions import PyrhValueError
+    from pyrh.models import InstrumentSchema
+
+    monkeypatch.setattr("pyrh.models.instrument.MAX_FUNDAMENTALS_SYMBOLS", 2)
+    im, adapter = im_adap
+    symbols = ["AAPL", "TSLA", "GME"]
+    instruments = [
+        InstrumentSchema().load(_linked_instrument(id_, symbol)).bind(im)
+        for id_, symbol in zip(INSTRUMENT_IDS, symbols)
+    ]
+    first = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/fundamentals/?symbols=AAPL,TSLA",
+        # out of order, results are matched by their symbol
+        json={"results": [None, {"symbol": "AAPL", "pe_ratio": "30.1"}]},
+    )
+    second = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/fundamentals/?symbols=GME",
+        json={"results": [{"symbol": "GME", "pe_ratio": None}]},
+    )
+    markets = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/markets/XNAS/",
+        json={"mic": "XNAS"},
+    )
+
+    fundamentals = im.hydrate_instruments(instruments + instruments[:1], "fundamentals")
+
+    assert [f and f.symbol for f in fundamentals] == ["AAPL", None, "GME", "AAPL"]
+    assert first.call_count == second.call_count == 1
+    assert instruments[1].get_fundamentals() is None
+    assert instruments[2].get_fundamentals().pe_ratio is None
+    assert first.call_count == second.call_count == 1
+
+    assert [m.mic for m in im.hydrate_instruments(instruments, "market")] == [
+        "XNAS"
+    ] * 3
+    assert markets.call_count == 1
+
+    with pytest.raises(PyrhValueError):
+        im.hydrate_instruments(instruments, "news")
+
+
+def test_identity_map():
+    import gc
+
+    from pyrh.models import Instrument
+    from pyrh.models.base import IdentityMap
+
+    identity_map = IdentityMap()
+    first = identity_map.merge("a", Instrument(symbol="FB"))
+    second = identity_map.merge("a", Instrument(symbol="META"))
+
+    assert second is first and first.symbol == "META"
+    assert len(identity_map) == 1
+
+    del first, second
+    gc.collect()
+    assert identity_map.get("a") is None
+
+
+def test_instruments_share_identity(im_adap):
+    im, adapter = im_adap
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=AAPL",
+        json={"results": [{**_instrument(INSTRUMENT_IDS[0], "AAPL"), "name": "a"}]},
+    )
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/instruments/?ids={INSTRUMENT_IDS[0]}",
+        json={
+            "next": None,
+            "previous": None,
+            "results": [{**_instrument(INSTRUMENT_IDS[0], "AAPL"), "name": "b"}],
+        },
+    )
+
+    instrument = im.instrument(symbol="AAPL")
+    (same,) = im.instruments_by_url([_url(INSTRUMENT_IDS[0])])
+
+    assert same is instrument
+    assert instrument.name == "b"
@@ -0,0 +1,56 @@
+"""Test the order latency recorder."""
+
+import pytest
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("pyrh.models.latency.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_histogram():
+    from pyrh.models import LatencyHistogram
+
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    for duration in (0.05, 0.05, 0.5, 3.0):
+        histogram.add(duration)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.mean == pytest.approx(0.9)
+    assert histogram.percentile(50) == 0.1
+    assert histogram.percentile(75) == 1.0
+    assert histogram.percentile(100) == 3.0
+    assert LatencyHistogram().percentile(50) == 0.0
+
+
+def test_recorder(clock):
+    from pyrh.models import LatencyRecorder
+
+    samples = []
+    recorder = LatencyRecorder(callback=samples.append, max_timings=2)
+
+    recorder.mark(["a", "b"], "started")
+    clock[0] += 0.5
+    recorder.mark(["a"], "submitted")
+    clock[0] += 0.25
+    recorder.mark(["a"], "acknowledged")
+    recorder.mark(["a"], "acknowledged")
+    clock[0] += 2
+    recorder.mark(["a", "unknown"], "filled", tracked_only=True)
+
+    assert [(s.key, s.stage, s.duration) for s in samples] == [
+        ("a", "started", 0.0),
+        ("b", "started", 0.0),
+        ("a", "submitted", 0.5),
+        ("a", "acknowledged", 0.25),
+        ("a", "filled", 2.0),
+    ]
+    assert recorder.timings["a"].between("submitted", "filled") == 2.25
+    assert recorder.timings["a"].between("submitted", "confirmed") is None
+    assert recorder.histograms["time_to_fill"].total == 2.25
+    assert "unknown" not in recorder.timings
+
+    recorder.mark(["c"], "started")
+    assert list(recorder.timings) == ["b", "c"]
@@ -0,0 +1,180 @@
+"""Test markets, their hours and market aware quotes."""
+
+import re
+from datetime import datetime
+
+import pytest
+import pytz
+import requests_mock
+
+HOURS = "https://api.robinhood.com/markets/XNAS/hours/"
+
+
+def _hours(date, next_date, is_open=True):
+    hours = {
+        "date": date,
+        "is_open": is_open,
+        "opens_at": None,
+        "closes_at": None,
+        "extended_opens_at": None,
+        "extended_closes_at": None,
+        "next_open_hours": f"{HOURS}{next_date}/",
+        "previous_open_hours": f"{HOURS}2020-01-01/",
+    }
+    if is_open:
+        hours.update(
+            {
+                "opens_at": f"{date}T14:30:00Z",
+                "closes_at": f"{date}T21:00:00Z",
+                "extended_opens_at": f"{date}T13:00:00Z",
+                "extended_closes_at": f"{date}T23:00:00Z",
+            }
+        )
+    return hours
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=pytz.UTC)
+
+
+@pytest.fixture
+def qm_adap():
+    from pyrh.models import QuoteManager
+
+    qm = QuoteManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    qm.session.mount("https://", adapter)
+    # Friday 2020-01-10, then a weekend
+    hours = {
+        "2020-01-10": adapter.register_uri(
+            "GET", f"{HOURS}2020-01-10/", json=_hours("2020-01-10", "2020-01-13")
+        ),
+        "2020-01-11": adapter.register_uri(
+            "GET",
+            f"{HOURS}2020-01-11/",
+            json=_hours("2020-01-11", "2020-01-13", is_open=False),
+        ),
+        "2020-01-13": adapter.register_uri(
+            "GET", f"{HOURS}2020-01-13/", json=_hours("2020-01-13", "2020-01-14")
+        ),
+    }
+
+    return qm, adapter, hours
+
+
+def test_is_market_open(qm_adap):
+    qm, _, hours = qm_adap
+
+    assert qm.is_market_open(now=_utc(2020, 1, 10, 15))
+    assert not qm.is_market_open(now=_utc(2020, 1, 10, 14))
+    assert qm.is_market_open(extended=True, now=_utc(2020, 1, 10, 14))
+    assert not qm.is_market_open(now=_utc(2020, 1, 11, 15))
+    assert hours["2020-01-10"].call_count == 1
+
+
+def test_next_open(qm_adap):
+    qm, _, hours = qm_adap
+
+    friday = _utc(2020, 1, 10, 15)
+    assert qm.next_open(now=friday) == friday
+    assert qm.next_open(now=_utc(2020, 1, 10, 12)) == _utc(2020, 1, 10, 14, 30)
+    assert qm.next_open(now=_utc(2020, 1, 11, 12)) == _utc(2020, 1, 13, 14, 30)
+    assert qm.next_open(now=_utc(2020, 1, 10, 22)) == _utc(2020, 1, 13, 14, 30)
+    assert hours["2020-01-13"].call_count == 1
+
+
+def test_market_ttl(qm_adap):
+    qm, _, _ = qm_adap
+
+    assert qm.market_ttl(15, now=_utc(2020, 1, 10, 15)) == 15
+    assert qm.market_ttl(15, now=_utc(2020, 1, 13, 12, 59, 55)) == 15
+    assert qm.market_ttl(15, now=_utc(2020, 1, 13, 12)) == 3600
+
+
+def test_market_ttl_reuses_the_next_session(qm_adap):
+    qm, adapter, hours = qm_adap
+
+    assert qm.market_ttl(15, now=_utc(2020, 1, 11, 12)) == 49 * 3600
+    qm._hours_cache.clear()
+    # until monday's session closes no hours are needed
+    assert qm.market_ttl(15, now=_utc(2020, 1, 12, 12)) == 25 * 3600
+    assert qm.market_ttl(15, now=_utc(2020, 1, 13, 15)) == 15
+    assert hours["2020-01-11"].call_count == hours["2020-01-13"].call_count == 1
+
+
+def test_market_ttl_without_hours(qm_adap):
+    qm, adapter, _ = qm_adap
+    adapter.register_uri("GET", f"{HOURS}2020-01-10/", status_code=503)
+
+    assert qm.market_ttl(15, now=_utc(2020, 1, 10, 12)) == 15
+
+
+def test_quotes_cached_while_closed(monkeypatch, qm_adap):
+    qm, adapter, _ = qm_adap
+    clock = [100.0]
+    monkeypatch.setattr("pyrh.models.base.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("pyrh.models.market._now", lambda: _utc(2020, 1, 13, 12))
+
+    def results(request, context):
+        symbols = request.qs["symbols"][0].upper().split(",")
+        # out of order, results are matched by their symbol
+        return {
+            "results": [None] * ("TSLA" in symbols)
+            + [{"symbol": "AAPL", "last_trade_price": "1.5"}] * ("AAPL" in symbols)
+        }
+
+    quotes = adapter.register_uri(
+        "GET", re.compile(r"https://api\.robinhood\.com/quotes/\?"), json=results
+    )
+
+    # quotes only use market hours that are already cached
+    qm.quotes(["AAPL"])
+    assert not [r for r in adapter.request_history if "/markets/" in r.url]
+    clock[0] += 15
+    qm.next_open(extended=True)
+
+    assert [q and q.symbol for q in qm.quotes(["aapl", "TSLA"])] == ["AAPL", None]
+    assert quotes.call_count == 2
+    # the unknown symbol is looked up again once QUOTE_TTL is over
+    clock[0] += 15
+    qm.quotes(["TSLA"])
+    assert quotes.call_count == 3
+    # the market opens for the extended hours an hour later
+    clock[0] += 3584
+    qm.quotes(["AAPL"])
+    assert quotes.call_count == 3
+    clock[0] += 1
+    qm.quotes(["AAPL"])
+    assert quotes.call_count == 4
+    assert qm.quotes(["AAPL", "TSLA"], refresh=True)[0].last_trade_price == 1.5
+    assert quotes.call_count == 5
+
+
+def test_poll_quotes_sleeps_while_closed(monkeypatch, qm_adap):
+    qm, adapter, _ = qm_adap
+    now = [_utc(2020, 1, 11, 12)]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] = datetime.fromtimestamp(now[0].timestamp() + seconds, tz=pytz.UTC)
+
+    monkeypatch.setattr("pyrh.models.market._now", lambda: now[0])
+    monkeypatch.setattr("pyrh.models.quote._now", lambda: now[0])
+    monkeypatch.setattr("pyrh.models.quote.time.sleep", sleep)
+    quotes = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/quotes/?symbols=AAPL",
+        json={"results": [{"symbol": "AAPL", "last_trade_price": "1.5"}]},
+    )
+
+    poll = qm.poll_quotes(["AAPL"], interval=5)
+    assert next(poll)[0].symbol == "AAPL"
+    assert now[0] == _utc(2020, 1, 13, 13)
+    next(poll)
+
+    assert sleeps == [
+        (_utc(2020, 1, 13, 13) - _utc(2020, 1, 11, 12)).total_seconds(),
+        5,
+    ]
+    assert quotes.call_count == 2
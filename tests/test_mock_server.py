@@ -0,0 +1,71 @@
+"""Test the mock Robinhood API server."""
+
+import pytest
+import requests
+
+
+@pytest.fixture
+def server():
+    from pyrh.mock_server import MockRobinhoodServer
+
+    with MockRobinhoodServer(instruments=250, page_size=100) as server:
+        yield server
+
+
+@pytest.fixture
+def rh(server):
+    from pyrh import Robinhood
+
+    return Robinhood(
+        username="user@example.com", password="some password", api_base=server.url
+    )
+
+
+def test_session_points_at_mock(server, rh):
+    rh.login()
+
+    assert rh.authenticated
+    assert len(list(rh.instruments())) == 250
+    quote = rh.quotes(["AAAA", "AAAB"])[0]
+    assert quote.symbol == "AAAA" and quote.instrument.startswith(server.url)
+    assert len(rh.get_historical_quotes("AAAA", "day", "year")["results"]) == 1
+
+
+def test_orders_round_trip(server, rh):
+    order = rh.order("AAAB", 2, "buy", order_type="limit", price=10.0)
+
+    assert order.state == "filled"
+    assert rh.order_by_ref_id(order.ref_id).id == order.id
+    assert rh.cancel_orders([order])[0].outcome == "not_cancellable"
+    assert rh.open_orders() == []
+    # submitting the same payload again is idempotent
+    assert len(server.orders) == 1
+
+
+def test_auto_login_on_private_endpoints(rh):
+    assert rh.positions()["results"]
+    assert rh.portfolio().equity > 0
+
+
+def test_errors_and_rate_limit(server):
+    server.error_rate = 1.0
+    assert requests.get(f"{server.url}quotes/AAAA/").status_code == 500
+
+    from pyrh.models import RateLimiter
+
+    server.error_rate = 0.0
+    server.rate_limiter = RateLimiter(rate=1, burst=1)
+    statuses = [requests.get(f"{server.url}quotes/AAAA/").status_code for _ in "ab"]
+    assert statuses == [200, 429]
+
+
+def test_instrument_links_are_served(rh):
+    instruments = rh.instruments_by_symbol(["AAAA", "AAAB"])
+
+    market = rh.hydrate_instruments(instruments, "market")[0]
+    fundamentals = rh.hydrate_instruments(instruments, "fundamentals")
+
+    assert market.mic == "XNAS"
+    assert [f.symbol for f in fundamentals] == ["AAAA", "AAAB"]
+    assert fundamentals[0].market_cap > 0
+    assert rh.hydrate_instruments(instruments, "splits") == [[], []]
@@ -0,0 +1,209 @@
+"""Test options chains."""
+
+from datetime import date
+
+import pytest
+import requests_mock
+
+CHAIN_ID = "cee01a93-626e-4ee6-9b04-60e2fd1392d1"
+INSTRUMENT = {
+    "id": "e39ed23a-7bd1-4587-b060-71988d9ef483",
+    "symbol": "TSLA",
+    "tradable_chain_id": CHAIN_ID,
+    "url": "https://api.robinhood.com/instruments/e39ed23a-7bd1-4587-b060-71988d9ef483/",
+}
+OPTION_IDS = [
+    "f2be2d47-f3a1-4fde-9f1c-2b4f5d3e0c01",
+    "f2be2d47-f3a1-4fde-9f1c-2b4f5d3e0c02",
+    "f2be2d47-f3a1-4fde-9f1c-2b4f5d3e0c03",
+]
+
+
+def _contract(option_id, expiry, type_, strike):
+    return {
+        "chain_id": CHAIN_ID,
+        "chain_symbol": "TSLA",
+        "expiration_date": expiry,
+        "id": option_id,
+        "state": "active",
+        "strike_price": f"{strike:.4f}",
+        "tradability": "tradable",
+        "type": type_,
+        "url": f"https://api.robinhood.com/options/instruments/{option_id}/",
+    }
+
+
+def _market_data(option_id, bid, ask):
+    return {
+        "ask_price": f"{ask:.6f}",
+        "ask_size": 10,
+        "bid_price": f"{bid:.6f}",
+        "bid_size": 5,
+        "instrument": f"https://api.robinhood.com/options/instruments/{option_id}/",
+        "implied_volatility": None,
+        "open_interest": 12,
+    }
+
+
+@pytest.fixture
+def om_adap():
+    from pyrh.models import OptionManager
+
+    om = OptionManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    om.session.mount("https://", adapter)
+
+    return om, adapter
+
+
+def test_option_chain_id(om_adap):
+    from pyrh.exceptions import PyrhValueError
+
+    om, adapter = om_adap
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=TSLA",
+        json={"next": None, "previous": None, "results": [INSTRUMENT]},
+    )
+    assert om.option_chain_id("TSLA") == CHAIN_ID
+
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=BRK.A",
+        json={"next": None, "previous": None, "results": [{"symbol": "BRK.A"}]},
+    )
+    with pytest.raises(PyrhValueError):
+        om.option_chain_id("BRK.A")
+
+
+def test_option_market_data_chunks(monkeypatch, om_adap):
+    om, adapter = om_adap
+    monkeypatch.setattr("pyrh.models.option.MAX_OPTION_IDS", 2)
+
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/marketdata/options/?ids={OPTION_IDS[0]},"
+        f"{OPTION_IDS[1]}",
+        json={"results": [_market_data(OPTION_IDS[0], 1, 1.1), None]},
+    )
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/marketdata/options/?ids={OPTION_IDS[2]}",
+        json={"results": [_market_data(OPTION_IDS[2], 2, 2.2)]},
+    )
+
+    data = om.option_market_data(OPTION_IDS + OPTION_IDS[:1])
+
+    assert adapter.call_count == 2
+    assert set(data) == {OPTION_IDS[0], OPTION_IDS[2]}
+    assert data[OPTION_IDS[2]].bid_price == 2.0
+
+
+def test_load_option_chain(om_adap):
+    om, adapter = om_adap
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=TSLA",
+        json={"next": None, "previous": None, "results": [INSTRUMENT]},
+    )
+    next_page = (
+        f"https://api.robinhood.com/options/instruments/?chain_id={CHAIN_ID}&cursor=2"
+    )
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/options/instruments/?chain_id={CHAIN_ID}"
+        "&expiration_dates=2020-06-19,2020-06-26",
+        json={
+            "next": next_page,
+            "previous": None,
+            "results": [
+                _contract(OPTION_IDS[0], "2020-06-26", "call", 800),
+                _contract(OPTION_IDS[1], "2020-06-19", "put", 750),
+            ],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        next_page,
+        json={
+            "next": None,
+            "previous": None,
+            "results": [_contract(OPTION_IDS[2], "2020-06-19", "call", 750)],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/marketdata/options/",
+        json={
+            "results": [
+                _market_data(OPTION_IDS[0], 1, 1.1),
+                _market_data(OPTION_IDS[1], 2, 2.2),
+            ]
+        },
+    )
+
+    chain = om.load_option_chain("TSLA", ["2020-06-19", "2020-06-26"])
+
+    assert list(chain) == [date(2020, 6, 19), date(2020, 6, 26)]
+    early = chain[date(2020, 6, 19)]
+    assert [(c.type, c.strike_price) for c in early] == [("call", 750), ("put", 750)]
+    assert early[0].market_data is None
+    assert early[1].market_data.ask_price == 2.2
+    assert chain[date(2020, 6, 26)][0].market_data.bid_size == 5
+
+
+def test_option_chain_lookups():
+    from uuid import uuid4
+
+    from pyrh.models import OptionChain, OptionInstrumentSchema
+
+    schema = OptionInstrumentSchema()
+    contracts = [
+        schema.load(_contract(str(uuid4()), "2020-06-19", type_, strike))
+        for strike in [700, 710, 720, 730]
+        for type_ in ["call", "put"]
+    ]
+    contracts.append(schema.load(_contract(str(uuid4()), "2020-06-26", "call", 800)))
+    chain = OptionChain("TSLA", CHAIN_ID, reversed(contracts))
+
+    assert len(chain) == 9
+    assert chain.expirations == [date(2020, 6, 19), date(2020, 6, 26)]
+    assert chain.get("2020-06-19", "call", 710).strike_price == 710
+    assert chain.get("2020-06-19", "call", 711) is None
+    assert chain.get("2020-06-20", "call", 710) is None
+    assert chain.nearest("2020-06-19", "put", 714).strike_price == 710
+    assert chain.nearest("2020-06-19", "put", 715).strike_price == 710
+    assert chain.nearest("2020-06-19", "put", 716).strike_price == 720
+    assert chain.nearest("2020-06-19", "put", 0).strike_price == 700
+    assert chain.nearest(date(2020, 6, 19), "put", 1e6).strike_price == 730
+    assert [
+        c.strike_price for c in chain.strike_range("2020-06-19", "call", 705, 720)
+    ] == [710, 720]
+    assert chain.strike_range("2020-06-26", "put", 0, 1e6) == []
+    assert chain.by_expiry()[date(2020, 6, 26)][0].strike_price == 800
+
+
+def test_option_chain_refresh(om_adap):
+    from pyrh.exceptions import PyrhValueError
+    from pyrh.models import OptionChain, OptionInstrumentSchema
+
+    om, adapter = om_adap
+    contracts = [
+        OptionInstrumentSchema().load(_contract(option_id, "2020-06-19", "call", i))
+        for i, option_id in enumerate(OPTION_IDS)
+    ]
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/marketdata/options/?ids={OPTION_IDS[1]}",
+        json={"results": [_market_data(OPTION_IDS[1], 3, 3.3)]},
+    )
+
+    with pytest.raises(PyrhValueError):
+        OptionChain("TSLA", CHAIN_ID, contracts).refresh()
+
+    chain = OptionChain("TSLA", CHAIN_ID, contracts, session_manager=om)
+    chain.refresh([chain.get("2020-06-19", "call", 1)])
+
+    assert adapter.call_count == 1
+    assert chain.get("2020-06-19", "call", 0).market_data is None
+    assert chain.get("2020-06-19", "call", 1).market_data.ask_price == 3.3
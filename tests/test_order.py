@@ -0,0 +1,603 @@
+"""Test the order path."""
+
+import re
+from datetime import datetime, timezone
+from urllib.parse import parse_qs
+
+import pytest
+import requests_mock
+
+ACCOUNT = "https://api.robinhood.com/accounts/5PY78241/"
+INSTRUMENT_ID = "450dfc6d-5510-4d40-abfb-f633b7d9be3e"
+INSTRUMENT = f"https://api.robinhood.com/instruments/{INSTRUMENT_ID}/"
+ORDER_ID = "e39ed23a-7bd1-4587-b060-71988d9ef483"
+UPDATED_SINCE = re.compile(r"https://api\.robinhood\.com/orders/\?updated_at%5Bgte%5D=")
+
+
+def _order(**kwargs):
+    return {
+        "id": ORDER_ID,
+        "url": f"https://api.robinhood.com/orders/{ORDER_ID}/",
+        "state": "unconfirmed",
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def om_adap():
+    from pyrh.models import OrderManager
+
+    om = OrderManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    om.session.mount("https://", adapter)
+
+    account = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/accounts/",
+        json={"results": [{"url": ACCOUNT}]},
+    )
+    instrument = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=AAPL",
+        json={"results": [{"id": INSTRUMENT_ID, "symbol": "AAPL", "url": INSTRUMENT}]},
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=NOPE",
+        json={"results": []},
+    )
+    orders = adapter.register_uri(
+        "POST",
+        "https://api.robinhood.com/orders/",
+        json=_order(side="buy", type="limit"),
+    )
+
+    return om, adapter, {"account": account, "instrument": instrument, "post": orders}
+
+
+def test_prepare_order_is_cached(om_adap):
+    om, _, calls = om_adap
+
+    payload = om.prepare_order("aapl", 2, "BUY", order_type="limit", price=100.0)
+    other = om.prepare_order("AAPL", 1, "sell", order_type="limit", price=110.0)
+
+    assert payload.pop("ref_id") != other["ref_id"]
+    assert payload == {
+        "account": ACCOUNT,
+        "instrument": INSTRUMENT,
+        "symbol": "AAPL",
+        "type": "limit",
+        "time_in_force": "gfd",
+        "trigger": "immediate",
+        "price": 100.0,
+        "quantity": 2,
+        "side": "buy",
+    }
+    assert calls["account"].call_count == calls["instrument"].call_count == 1
+
+
+def test_prewarmed_order_is_a_single_post(om_adap):
+    om, adapter, calls = om_adap
+
+    om.prewarm_orders(["AAPL"])
+    requests_before = len(adapter.request_history)
+    order = om.order("AAPL", 1, "buy", order_type="limit", price=100.0)
+
+    assert len(adapter.request_history) == requests_before + 1
+    assert str(order.id) == ORDER_ID
+    assert parse_qs(calls["post"].last_request.text)["price"] == ["100.0"]
+
+
+def test_prepare_order_prices_from_quote(om_adap):
+    om, adapter, _ = om_adap
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/quotes/?symbols=AAPL",
+        json={
+            "results": [
+                {
+                    "symbol": "AAPL",
+                    "ask_price": "101.5",
+                    "bid_price": None,
+                    "last_trade_price": "101.0",
+                }
+            ]
+        },
+    )
+    assert om.prepare_order("AAPL", 1, "buy")["price"] == 101.5
+    assert om.prepare_order("AAPL", 1, "sell")["price"] == 101.0
+    # pricing an order does not cost a market hours request
+    assert not [r for r in adapter.request_history if "/markets/" in r.url]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"side": "hold"},
+        {"quantity": 0},
+        {"order_type": "limit"},
+        {"order_type": "limit", "price": -1},
+        {"trigger": "stop", "price": 1},
+        {"stop_price": 1, "price": 1},
+        {"time_in_force": "forever", "price": 1},
+    ],
+)
+def test_prepare_order_validation(om_adap, kwargs):
+    from pyrh.exceptions import PyrhValueError
+
+    om, adapter, _ = om_adap
+    kwargs = {"symbol": "AAPL", "quantity": 1, "side": "buy", **kwargs}
+
+    with pytest.raises(PyrhValueError):
+        om.prepare_order(**kwargs)
+    assert adapter.request_history == []
+
+
+def test_prepare_order_unknown_symbol(om_adap):
+    from pyrh.exceptions import PyrhValueError
+
+    om, _, _ = om_adap
+
+    with pytest.raises(PyrhValueError):
+        om.prepare_order("NOPE", 1, "buy", price=1.0)
+
+
+def test_legacy_place_buy_order():
+    from pyrh import Robinhood
+
+    rh = Robinhood(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    rh.session.mount("https://", adapter)
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/accounts/",
+        json={"results": [{"url": ACCOUNT}]},
+    )
+    post = adapter.register_uri(
+        "POST", "https://api.robinhood.com/orders/", json=_order()
+    )
+
+    rh.place_buy_order({"symbol": "AAPL", "url": INSTRUMENT}, 1, ask_price=10.0)
+    rh.place_buy_order({"symbol": "AAPL", "url": INSTRUMENT}, 1, ask_price=10.0)
+
+    # no quote lookups and a single account lookup
+    assert [r.method for r in adapter.request_history] == ["GET", "POST", "POST"]
+    assert parse_qs(post.last_request.text)["side"] == ["buy"]
+
+
+def test_legacy_submit_market_order_with_price():
+    from pyrh import Robinhood
+
+    rh = Robinhood(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    rh.session.mount("https://", adapter)
+
+    with pytest.raises(ValueError, match="Market order has price limit"):
+        rh.submit_buy_order(
+            instrument_URL=INSTRUMENT,
+            symbol="AAPL",
+            order_type="market",
+            price=10.0,
+            quantity=1,
+            side="buy",
+        )
+    assert adapter.request_history == []
+
+
+def test_legacy_place_limit_order_prices_from_quote():
+    from pyrh import Robinhood
+
+    rh = Robinhood(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    rh.session.mount("https://", adapter)
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/accounts/",
+        json={"results": [{"url": ACCOUNT}]},
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/quotes/?symbols=AAPL",
+        json={
+            "results": [
+                {
+                    "symbol": "AAPL",
+                    "bid_price": "0",
+                    "ask_price": None,
+                    "last_trade_price": "99.5",
+                }
+            ]
+        },
+    )
+    post = adapter.register_uri(
+        "POST", "https://api.robinhood.com/orders/", json=_order()
+    )
+
+    rh.place_order(
+        {"symbol": "AAPL", "url": INSTRUMENT}, 1, transaction="sell", order="limit"
+    )
+
+    sent = parse_qs(post.last_request.text)
+    assert sent["type"] == ["limit"]
+    assert sent["price"] == ["99.5"]
+
+
+def test_submit_orders(om_adap):
+    from pyrh.models import RateLimiter
+
+    om, adapter, calls = om_adap
+    om.rate_limiter = RateLimiter(rate=1000)
+    tsla = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?symbol=TSLA",
+        json={"results": [{"id": ORDER_ID, "symbol": "TSLA", "url": ACCOUNT}]},
+    )
+    quotes = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/quotes/?symbols=AAPL,TSLA",
+        json={
+            "results": [
+                {"symbol": "AAPL", "ask_price": "101.5", "bid_price": "101.0"},
+                {"symbol": "TSLA", "ask_price": "901.5", "bid_price": "900.0"},
+            ]
+        },
+    )
+
+    def post(request, context):
+        if parse_qs(request.text)["symbol"] == ["TSLA"]:
+            context.status_code = 400
+            return {"detail": "Not enough shares to sell."}
+        return _order(side="buy")
+
+    adapter.register_uri("POST", "https://api.robinhood.com/orders/", json=post)
+
+    basket = om.submit_orders(
+        [
+            {"symbol": "AAPL", "quantity": 1, "side": "buy"},
+            {"symbol": "TSLA", "quantity": 1, "side": "sell"},
+            {"symbol": "aapl", "quantity": 2, "side": "buy", "price": 100.0},
+        ]
+    )
+
+    assert [result.position for result in basket.succeeded] == [0, 2]
+    assert [result.payload["price"] for result in basket.succeeded] == [101.5, 100.0]
+    assert str(basket.succeeded[0].order.id) == ORDER_ID
+    assert [result.position for result in basket.failed] == [1]
+    assert basket.failed[0].order is None
+    assert basket.failed[0].error.response.status_code == 400
+    assert [result.position for result in basket.results] == [0, 1, 2]
+    # the shared lookups are made once for the whole basket
+    assert calls["account"].call_count == calls["instrument"].call_count == 1
+    assert tsla.call_count == quotes.call_count == 1
+
+
+def test_submit_orders_validates_first(om_adap):
+    from pyrh.exceptions import PyrhValueError
+
+    om, adapter, _ = om_adap
+
+    with pytest.raises(PyrhValueError, match="Order 1"):
+        om.submit_orders(
+            [
+                {"symbol": "AAPL", "quantity": 1, "side": "buy", "price": 1.0},
+                {"symbol": "AAPL", "quantity": 1, "side": "hold", "price": 1.0},
+            ]
+        )
+    assert adapter.request_history == []
+
+
+def test_submit_order_retries_after_timeout(om_adap, monkeypatch):
+    from requests.exceptions import ConnectTimeout
+
+    om, adapter, _ = om_adap
+    monkeypatch.setattr("pyrh.models.order.time.sleep", lambda seconds: None)
+    post = adapter.register_uri(
+        "POST",
+        "https://api.robinhood.com/orders/",
+        [{"exc": ConnectTimeout}, {"json": _order(side="buy")}],
+    )
+    lookup = adapter.register_uri("GET", UPDATED_SINCE, json={"results": []})
+
+    payload = om.prepare_order("AAPL", 1, "buy", price=1.0)
+    order = om.submit_order(payload)
+
+    assert str(order.id) == ORDER_ID
+    assert post.call_count == 2
+    assert lookup.call_count == 1
+    # the retry is the very same order
+    assert parse_qs(post.request_history[1].text)["ref_id"] == [payload["ref_id"]]
+
+
+def test_submit_order_finds_placed_order(om_adap):
+    om, adapter, _ = om_adap
+    payload = om.prepare_order("AAPL", 1, "buy", price=1.0)
+    post = adapter.register_uri(
+        "POST", "https://api.robinhood.com/orders/", status_code=504, json={}
+    )
+    adapter.register_uri(
+        "GET",
+        UPDATED_SINCE,
+        json={
+            "results": [_order(ref_id="other")],
+            "next": "https://api.robinhood.com/orders/?cursor=2",
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/orders/?cursor=2",
+        json={"results": [_order(ref_id=payload["ref_id"])], "next": None},
+    )
+
+    order = om.submit_order(payload)
+
+    assert order.ref_id == payload["ref_id"]
+    assert post.call_count == 1
+
+
+def test_submit_order_does_not_retry_rejections(om_adap):
+    from requests.exceptions import HTTPError
+
+    om, adapter, _ = om_adap
+    post = adapter.register_uri(
+        "POST", "https://api.robinhood.com/orders/", status_code=400, json={}
+    )
+
+    with pytest.raises(HTTPError):
+        om.submit_order(om.prepare_order("AAPL", 1, "buy", price=1.0))
+    assert post.call_count == 1
+
+
+def test_open_order_tracker(om_adap):
+    om, adapter, _ = om_adap
+
+    def order(id_, state, filled, created, updated):
+        return _order(
+            id=id_,
+            state=state,
+            cumulative_quantity=filled,
+            quantity=2,
+            created_at=f"2020-01-0{created}T00:00:00+00:00",
+            updated_at=f"2020-01-0{updated}T00:00:00+00:00",
+        )
+
+    old, live, new = ORDER_ID, INSTRUMENT_ID, "0e5a4d7c-3f87-4d7c-a5f6-2e0c2bd1e21b"
+    seed = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/orders/",
+        json={
+            "results": [
+                order(live, "confirmed", 0, 2, 2),
+                order(old, "filled", 2, 1, 1),
+            ],
+            "next": None,
+        },
+    )
+
+    events = om.order_tracker.poll()
+
+    assert [(e.kind, str(e.order.id)) for e in events] == [("new", live)]
+    assert [str(o.id) for o in om.open_orders(refresh=False)] == [live]
+
+    delta = adapter.register_uri(
+        "GET",
+        UPDATED_SINCE,
+        json={
+            "results": [
+                order(live, "partially_filled", 1, 2, 3),
+                order(new, "filled", 2, 3, 3),
+            ],
+            "next": None,
+        },
+    )
+    events = om.order_tracker.poll()
+
+    assert seed.call_count == 1
+    assert "2020-01-02T00:00:00" in delta.last_request.url.replace("%3A", ":")
+    assert [(e.kind, str(e.order.id), e.filled) for e in events] == [
+        ("fill", live, 1),
+        ("state", live, 1),
+        ("new", new, 2),
+        ("fill", new, 2),
+    ]
+    assert events[1].previous.state == "confirmed"
+    assert [str(o.id) for o in om.open_orders(refresh=False)] == [live]
+
+    adapter.register_uri(
+        "GET",
+        UPDATED_SINCE,
+        json={"results": [order(live, "cancelled", 1, 2, 4)], "next": None},
+    )
+
+    assert [e.kind for e in om.order_tracker.poll()] == ["state"]
+    assert om.open_orders(refresh=False) == []
+
+
+def test_open_order_tracker_closed_order_at_updated_at(om_adap):
+    om, adapter, _ = om_adap
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/orders/",
+        json={"results": [], "next": None},
+    )
+    om.order_tracker.poll()
+    adapter.register_uri(
+        "GET",
+        UPDATED_SINCE,
+        json={
+            "results": [
+                _order(
+                    state="filled",
+                    cumulative_quantity=1,
+                    created_at="2020-01-03T00:00:00+00:00",
+                    updated_at="2020-01-03T00:00:00+00:00",
+                )
+            ],
+            "next": None,
+        },
+    )
+    om.order_tracker.updated_at = datetime(2020, 1, 2, tzinfo=timezone.utc)
+
+    assert [e.kind for e in om.order_tracker.poll()] == ["new", "fill"]
+    # the next polls fetch the order again from its own update time
+    assert om.order_tracker.poll() == []
+    assert om.order_tracker.poll() == []
+
+
+def test_legacy_get_open_orders_pages_through_history():
+    from pyrh import Robinhood
+
+    rh = Robinhood(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    rh.session.mount("https://", adapter)
+    cancel = f"https://api.robinhood.com/orders/{ORDER_ID}/cancel/"
+    second = "https://api.robinhood.com/orders/?cursor=2"
+    times = {
+        "created_at": "2020-01-01T00:00:00+00:00",
+        "updated_at": "2020-01-01T00:00:00+00:00",
+    }
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/orders/",
+        json={
+            "results": [_order(id=INSTRUMENT_ID, state="filled", cancel=None, **times)],
+            "next": second,
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        second,
+        json={
+            "results": [_order(state="confirmed", cancel=cancel, **times)],
+            "next": None,
+        },
+    )
+
+    (order,) = rh.get_open_orders()
+
+    assert order["id"] == ORDER_ID and order["cancel"] == cancel
+    assert order["state"] == "confirmed"
+
+
+def test_cancel_orders(om_adap):
+    from pyrh.models import OrderSchema
+
+    om, adapter, _ = om_adap
+    ids = [ORDER_ID, INSTRUMENT_ID, "0e5a4d7c-3f87-4d7c-a5f6-2e0c2bd1e21b"]
+    cancels = [f"https://api.robinhood.com/orders/{id_}/cancel/" for id_ in ids]
+    fetch = adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/orders/{ids[2]}/",
+        json=_order(id=ids[2], cancel=cancels[2]),
+    )
+    posts = [adapter.register_uri("POST", url, json={}) for url in cancels[::2]]
+    adapter.register_uri("POST", cancels[1], status_code=400, json={})
+
+    results = om.cancel_orders(
+        [
+            OrderSchema().load(_order(cancel=cancels[0])),
+            {"id": ids[1], "cancel": cancels[1]},
+            ids[2],
+            {"id": ids[0], "cancel": None},
+        ]
+    )
+
+    assert [(r.order_id, r.outcome) for r in results] == [
+        (ids[0], "cancelled"),
+        (ids[1], "failed"),
+        (ids[2], "cancelled"),
+        (ids[0], "not_cancellable"),
+    ]
+    assert results[1].error.response.status_code == 400
+    # only the bare id is fetched
+    assert fetch.call_count == 1
+    assert [post.call_count for post in posts] == [1, 1]
+
+
+def test_legacy_cancel_order():
+    from pyrh import Robinhood
+
+    rh = Robinhood(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    rh.session.mount("https://", adapter)
+    cancel = f"https://api.robinhood.com/orders/{ORDER_ID}/cancel/"
+    adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/orders/{ORDER_ID}/",
+        json=_order(cancel=cancel),
+    )
+    adapter.register_uri("POST", cancel, [{"json": {}}, {"status_code": 400}])
+
+    assert rh.cancel_order(ORDER_ID) == {}
+    assert rh.cancel_order({"id": ORDER_ID, "cancel": None}) is None
+    with pytest.raises(ValueError, match=ORDER_ID):
+        rh.cancel_order(ORDER_ID)
+    with pytest.raises(ValueError):
+        rh.cancel_order(42)
+
+
+def test_legacy_cancel_order_stale_link():
+    from pyrh import Robinhood
+
+    rh = Robinhood(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    rh.session.mount("https://", adapter)
+    stale = f"https://api.robinhood.com/orders/{ORDER_ID}/cancel/"
+    fresh = f"https://api.robinhood.com/orders/{ORDER_ID}/cancel/?retry=1"
+    adapter.register_uri("POST", stale, status_code=404, json={})
+    fetch = adapter.register_uri(
+        "GET",
+        f"https://api.robinhood.com/orders/{ORDER_ID}/",
+        json=_order(cancel=fresh),
+    )
+    post = adapter.register_uri("POST", fresh, json={"state": "cancelled"})
+
+    assert rh.cancel_order({"id": ORDER_ID, "cancel": stale}) == {"state": "cancelled"}
+    assert fetch.call_count == post.call_count == 1
+
+
+def test_order_latency(om_adap):
+    from pyrh.models import LatencyRecorder
+
+    om, adapter, _ = om_adap
+    samples = []
+    om.latency_recorder = LatencyRecorder(callback=samples.append)
+    adapter.register_uri(
+        "GET", "https://api.robinhood.com/orders/", json={"results": [], "next": None}
+    )
+    om.order_tracker.poll()
+    payload = om.prepare_order("AAPL", 1, "buy", price=1.0)
+    adapter.register_uri(
+        "POST",
+        "https://api.robinhood.com/orders/",
+        json=_order(side="buy", ref_id=payload["ref_id"], state="unconfirmed"),
+    )
+    om.submit_order(payload)
+
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/orders/",
+        json={
+            "results": [
+                _order(
+                    ref_id=payload["ref_id"],
+                    state="filled",
+                    cumulative_quantity=1,
+                    created_at="2020-01-01T00:00:00+00:00",
+                    updated_at="2020-01-01T00:00:01+00:00",
+                )
+            ],
+            "next": None,
+        },
+    )
+    om.order_tracker.poll()
+
+    assert [s.stage for s in samples] == [
+        "started",
+        "account",
+        "instrument",
+        "submitted",
+        "acknowledged",
+        "filled",
+    ]
+    assert {s.key for s in samples} == {payload["ref_id"]}
+    assert om.latency_recorder.histograms["time_to_fill"].count == 1
@@ -0,0 +1,127 @@
+"""Test positions and their value."""
+
+import pytest
+import requests_mock
+
+INSTRUMENT_IDS = [
+    "450dfc6d-5510-4d40-abfb-f633b7d9be3e",
+    "e39ed23a-7bd1-4587-b060-71988d9ef483",
+    "ebab2398-028d-4939-9f1d-13bf38f81c50",
+]
+SYMBOLS = ["AAPL", "TSLA", "MSFT"]
+POSITIONS = "https://api.robinhood.com/positions/?nonzero=true"
+
+
+def _url(id_):
+    return f"https://api.robinhood.com/instruments/{id_}/"
+
+
+def _position(id_, quantity, average_buy_price):
+    return {
+        "account": "https://api.robinhood.com/accounts/5PY78241/",
+        "average_buy_price": average_buy_price,
+        "created_at": "2020-01-01T00:00:00.000000Z",
+        "instrument": _url(id_),
+        "quantity": quantity,
+        "shares_held_for_sells": "0.0000",
+        "updated_at": "2020-01-02T00:00:00.000000Z",
+        "url": f"https://api.robinhood.com/positions/5PY78241/{id_}/",
+    }
+
+
+def _quote(symbol, price, extended=None):
+    return {
+        "last_extended_hours_trade_price": extended,
+        "last_trade_price": price,
+        "symbol": symbol,
+    }
+
+
+@pytest.fixture
+def pm_adap():
+    from pyrh.models import PositionManager
+
+    pm = PositionManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    pm.session.mount("https://", adapter)
+
+    adapter.register_uri(
+        "GET",
+        POSITIONS,
+        json={
+            "next": f"{POSITIONS}&cursor=2",
+            "results": [
+                _position(INSTRUMENT_IDS[0], "10.0000", "100.0000"),
+                _position(INSTRUMENT_IDS[1], "2.0000", "300.0000"),
+            ],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        f"{POSITIONS}&cursor=2",
+        json={
+            "next": None,
+            "results": [_position(INSTRUMENT_IDS[2], "5.0000", "200.0000")],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/",
+        json={
+            "next": None,
+            "results": [
+                {"id": id_, "symbol": symbol, "url": _url(id_)}
+                for id_, symbol in zip(INSTRUMENT_IDS, SYMBOLS)
+            ],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/quotes/",
+        json={
+            "results": [
+                _quote("AAPL", "110.0000"),
+                _quote("TSLA", "250.0000", extended="260.0000"),
+                None,
+            ]
+        },
+    )
+
+    return pm, adapter
+
+
+def test_stock_positions(pm_adap):
+    pm, adapter = pm_adap
+
+    positions = pm.stock_positions()
+
+    assert [p.instrument_data.symbol for p in positions] == SYMBOLS
+    assert positions[0].quantity == 10.0
+    # two pages of positions and one instrument request
+    assert adapter.call_count == 3
+    assert not hasattr(pm.stock_positions(hydrate=False)[0], "instrument_data")
+
+
+def test_position_values(pm_adap):
+    pm, adapter = pm_adap
+
+    values = pm.position_values()
+
+    aapl, tsla, msft = values.positions
+    assert aapl.symbol == "AAPL" and aapl.price == 110.0
+    assert aapl.market_value == 1100.0 and aapl.unrealized_pl == 100.0
+    # the extended hours price wins
+    assert tsla.price == 260.0 and tsla.unrealized_pl == -80.0
+    # unknown quotes are left out of the totals
+    assert msft.price is None and msft.market_value is None
+    assert msft.cost_basis == 1000.0
+
+    assert values.market_value == 1620.0
+    assert values.cost_basis == 1600.0
+    assert values.unrealized_pl == 20.0
+    assert values.unrealized_pl_percent == pytest.approx(1.25)
+
+    calls = adapter.call_count
+    pm.position_values()
+    # positions and quotes again, the instruments are cached
+    assert adapter.call_count - calls == 3
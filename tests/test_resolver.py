@@ -0,0 +1,62 @@
+"""Test the batch reference resolver."""
+
+import pytest
+import requests_mock
+
+INSTRUMENT_IDS = [
+    "450dfc6d-5510-4d40-abfb-f633b7d9be3e",
+    "e39ed23a-7bd1-4587-b060-71988d9ef483",
+]
+ACCOUNT = "https://api.robinhood.com/accounts/5PY78241/"
+
+
+def _url(id_):
+    return f"https://api.robinhood.com/instruments/{id_}/"
+
+
+@pytest.fixture
+def rm_adap():
+    from pyrh.models import ResolverManager
+
+    rm = ResolverManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    rm.session.mount("https://", adapter)
+
+    return rm, adapter
+
+
+def test_resolve_references(rm_adap):
+    from pyrh.models.base import UnknownModel
+
+    rm, adapter = rm_adap
+    instruments = adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/?ids=" + ",".join(INSTRUMENT_IDS),
+        json={
+            "next": None,
+            "previous": None,
+            "results": [
+                {"id": id_, "symbol": symbol, "url": _url(id_)}
+                for id_, symbol in zip(INSTRUMENT_IDS, ["AAPL", "TSLA"])
+            ],
+        },
+    )
+    accounts = adapter.register_uri("GET", ACCOUNT, json={"account_number": "5PY78241"})
+    orders = [
+        {"instrument": _url(INSTRUMENT_IDS[0]), "account": ACCOUNT},
+        {"instrument": _url(INSTRUMENT_IDS[1]), "account": ACCOUNT},
+        {"instrument": _url(INSTRUMENT_IDS[0]), "account": None},
+    ]
+    position = UnknownModel(instrument=_url(INSTRUMENT_IDS[1]), account=ACCOUNT)
+
+    resolved = rm.resolve_references(orders + [position])
+
+    assert [o["instrument_data"].symbol for o in orders] == ["AAPL", "TSLA", "AAPL"]
+    assert orders[0]["account_data"].account_number == "5PY78241"
+    assert "account_data" not in orders[2]
+    assert resolved[-1].instrument_data.symbol == "TSLA"
+    assert resolved[-1].account_data is orders[0]["account_data"]
+    assert instruments.call_count == accounts.call_count == 1
+
+    rm.resolve_references(orders, fields=["account"])
+    assert accounts.call_count == 1
@@ -0,0 +1,47 @@
+"""Test the offline instrument search index."""
+
+import pytest
+
+from pyrh.models import Instrument, InstrumentIndex
+
+
+@pytest.fixture
+def index():
+    return InstrumentIndex(
+        [
+            Instrument(
+                symbol="AAPL", name="Apple Inc. Common Stock", simple_name="Apple"
+            ),
+            Instrument(symbol="AA", name="Alcoa Corporation", simple_name="Alcoa"),
+            Instrument(symbol="AAL", name="American Airlines Group", simple_name=None),
+            Instrument(symbol="APLE", name="Apple Hospitality REIT", simple_name=None),
+            Instrument(symbol="MSFT", name="Microsoft Corporation", simple_name=None),
+        ]
+    )
+
+
+def test_symbol(index):
+    assert index.symbol("aapl").name == "Apple Inc. Common Stock"
+    assert index.symbol("NOPE") is None
+    assert "msft" in index
+    assert len(index) == 5
+
+
+def test_prefix(index):
+    assert [i.symbol for i in index.prefix("aa")] == ["AA", "AAL", "AAPL"]
+    assert [i.symbol for i in index.prefix("AA", limit=2)] == ["AA", "AAL"]
+    assert index.prefix("Z") == []
+
+
+def test_name(index):
+    assert [i.symbol for i in index.name("apple")] == ["AAPL", "APLE"]
+    assert [i.symbol for i in index.name("apple hosp")] == ["APLE"]
+    assert [i.symbol for i in index.name("corp")] == ["AA", "MSFT"]
+    assert index.name("  ") == []
+
+
+def test_search(index):
+    assert [i.symbol for i in index.search("AA")] == ["AA", "AAL", "AAPL"]
+    assert [i.symbol for i in index.search("apple")] == ["AAPL", "APLE"]
+    assert [i.symbol for i in index.search("aple")] == ["APLE"]
+    assert [i.symbol for i in index.search("a", limit=1)] == ["AA"]
@@ -458,6 +458,24 @@ def test_get(mock_login, sm):
     assert "404 Client Error" in str(e.value)
 
 
+@mock.patch("pyrh.models.SessionManager.login")
+def test_get_intern_strings(mock_login, sm):
+    adapter = requests_mock.Adapter()
+    sm.session.mount("mock", adapter)
+    mock_url = "mock://test.com"
+    account = "https://api.robinhood.com/accounts/5PY78241/"
+    adapter.register_uri(
+        "GET", mock_url, json={"results": [{"account": account}, {"account": account}]}
+    )
+
+    data = sm.get(mock_url)["results"]
+    assert data[0]["account"] is not data[1]["account"]
+
+    sm.intern_strings = True
+    data = sm.get(mock_url)["results"]
+    assert data[0]["account"] is data[1]["account"]
+
+
 @mock.patch("pyrh.models.SessionManager.login")
 def test_post(mock_login, sm):
     import json
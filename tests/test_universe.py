@@ -0,0 +1,102 @@
+"""Test the instrument universe store."""
+
+import pytest
+import requests_mock
+
+INSTRUMENTS = "https://api.robinhood.com/instruments/"
+IDS = [
+    "450dfc6d-5510-4d40-abfb-f633b7d9be3e",
+    "e39ed23a-7bd1-4587-b060-71988d9ef483",
+    "ebab2398-028d-4939-9f1d-13bf38f81c50",
+    "a4ecd608-e7b4-4ff3-afa5-f77ae7632dfb",
+]
+
+
+def _instrument(id_, symbol, state="active", name=None):
+    return {
+        "id": id_,
+        "symbol": symbol,
+        "name": name or symbol,
+        "state": state,
+        "list_date": "2010-06-29",
+        "url": f"{INSTRUMENTS}{id_}/",
+    }
+
+
+def _register(adapter, *pages):
+    for i, results in enumerate(pages):
+        url = INSTRUMENTS if i == 0 else f"{INSTRUMENTS}?cursor={i}"
+        next_ = f"{INSTRUMENTS}?cursor={i + 1}" if i + 1 < len(pages) else None
+        adapter.register_uri(
+            "GET", url, json={"next": next_, "previous": None, "results": results}
+        )
+
+
+@pytest.fixture
+def im_adap():
+    from pyrh.models import InstrumentManager
+
+    im = InstrumentManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    im.session.mount("https://", adapter)
+
+    return im, adapter
+
+
+def test_instruments_without_query(im_adap):
+    im, adapter = im_adap
+    _register(adapter, [_instrument(IDS[0], "AAPL")], [_instrument(IDS[1], "TSLA")])
+
+    assert [i.symbol for i in im.instruments()] == ["AAPL", "TSLA"]
+    assert adapter.request_history[0].url == INSTRUMENTS
+
+
+def test_store_sync(im_adap, tmp_path):
+    from pyrh.models import InstrumentStore
+
+    im, adapter = im_adap
+    _register(
+        adapter,
+        [_instrument(IDS[0], "AAPL"), _instrument(IDS[1], "TSLA")],
+        [_instrument(IDS[2], "GME")],
+    )
+
+    progress = []
+    store = InstrumentStore()
+    report = store.sync(im, progress=progress.append)
+
+    assert report.added == IDS[:3]
+    assert report.changed == report.delisted == []
+    assert [(p.pages, p.instruments) for p in progress] == [(1, 2), (2, 3)]
+    assert report.progress.instruments == 3
+    assert report.per_second >= 0
+    assert len(store) == 3
+
+    path = tmp_path / "instruments.json"
+    store.save(path)
+    store = InstrumentStore.load(path)
+    assert store.get(IDS[1]).symbol == "TSLA"
+    assert store.synced_at is not None
+
+    _register(
+        adapter,
+        [
+            _instrument(IDS[0], "AAPL", name="Apple Inc."),
+            _instrument(IDS[1], "TSLA", state="inactive"),
+        ],
+        [_instrument(IDS[3], "AMC")],
+    )
+    report = store.sync(im)
+
+    assert report.added == [IDS[3]]
+    assert report.changed == [IDS[0]]
+    assert sorted(report.delisted) == sorted([IDS[1], IDS[2]])
+    assert store.get(IDS[0]).name == "Apple Inc."
+    assert store.get(IDS[2]) is None
+    assert len(store) == 3
+
+
+def test_store_load_missing(tmp_path):
+    from pyrh.models import InstrumentStore
+
+    assert len(InstrumentStore.load(tmp_path / "missing.json")) == 0
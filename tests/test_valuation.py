@@ -0,0 +1,124 @@
+"""Test the incremental portfolio valuation."""
+
+import pytest
+import requests_mock
+
+from .test_position import INSTRUMENT_IDS, SYMBOLS, _position, _quote, _url
+
+PORTFOLIOS = "https://api.robinhood.com/portfolios/"
+
+
+def _quotes(*quotes):
+    from pyrh.models import QuoteSchema
+
+    return QuoteSchema(many=True).load([_quote(*quote) for quote in quotes])
+
+
+@pytest.fixture
+def valuation():
+    from pyrh.models import PortfolioValuation, PositionManager
+
+    pm = PositionManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    pm.session.mount("https://", adapter)
+
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/positions/?nonzero=true",
+        json={
+            "next": None,
+            "results": [
+                _position(INSTRUMENT_IDS[0], "10.0000", "100.0000"),
+                _position(INSTRUMENT_IDS[1], "2.0000", "300.0000"),
+                _position(INSTRUMENT_IDS[2], "5.0000", "200.0000"),
+            ],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/",
+        json={
+            "next": None,
+            "results": [
+                {"id": id_, "symbol": symbol, "url": _url(id_)}
+                for id_, symbol in zip(INSTRUMENT_IDS, SYMBOLS)
+            ],
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/quotes/",
+        json={
+            "results": [
+                _quote("AAPL", "110.0000"),
+                _quote("TSLA", "250.0000"),
+                None,
+            ]
+        },
+    )
+    adapter.register_uri(
+        "GET",
+        PORTFOLIOS,
+        json={
+            "next": None,
+            "results": [
+                {
+                    "equity": "2600.0000",
+                    "extended_hours_equity": None,
+                    "market_value": "1600.0000",
+                }
+            ],
+        },
+    )
+
+    valuation = PortfolioValuation.seed(pm)
+    assert adapter.call_count == 4
+    return valuation
+
+
+def test_seed(valuation):
+    assert valuation.portfolio.equity == 2600.0
+    assert valuation.symbols == SYMBOLS
+    assert valuation.equity == 2600.0
+    assert valuation.market_value == 1600.0
+    assert valuation.unrealized_pl == 0.0
+
+
+def test_apply_quotes(valuation):
+    changed = valuation.apply_quotes(
+        _quotes(("AAPL", "110.0000"), ("TSLA", "260.0000"), ("NFLX", "500.0000"))
+        + [None]
+    )
+
+    # AAPL did not move and NFLX is not held
+    assert [value.symbol for value in changed] == ["TSLA"]
+    assert valuation.market_value == 1620.0
+    assert valuation.unrealized_pl == 20.0
+    assert valuation.equity == 2620.0
+
+    # MSFT gets its first price
+    valuation.apply_quotes(_quotes(("MSFT", "190.0000")))
+    assert valuation.market_value == 2570.0
+    assert valuation.cost_basis == 2600.0
+    assert valuation.unrealized_pl == -30.0
+    assert valuation.equity == 3570.0
+
+    snapshot = valuation.snapshot()
+    assert [value.price for value in snapshot.positions] == [110.0, 260.0, 190.0]
+    assert snapshot.market_value == sum(v.market_value for v in snapshot.positions)
+
+
+def test_set_portfolio(valuation):
+    from pyrh.models import PortfolioSchema
+
+    valuation.apply_quotes(_quotes(("AAPL", "120.0000")))
+    assert valuation.equity == 2700.0
+
+    portfolio = PortfolioSchema().load(
+        {"results": [{"equity": "2690.0000", "extended_hours_equity": "2695.0000"}]}
+    )
+    valuation.set_portfolio(portfolio)
+    assert valuation.equity == 2695.0
+
+    valuation.apply_quotes(_quotes(("AAPL", "119.0000")))
+    assert valuation.equity == 2685.0
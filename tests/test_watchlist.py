@@ -0,0 +1,110 @@
+"""Test watchlists."""
+
+import pytest
+import requests_mock
+
+INSTRUMENT_IDS = [
+    "450dfc6d-5510-4d40-abfb-f633b7d9be3e",
+    "e39ed23a-7bd1-4587-b060-71988d9ef483",
+    "ebab2398-028d-4939-9f1d-13bf38f81c50",
+]
+WATCHLISTS = "https://api.robinhood.com/watchlists/"
+
+
+def _url(id_):
+    return f"https://api.robinhood.com/instruments/{id_}/"
+
+
+def _item(name, id_):
+    return {
+        "created_at": "2020-01-01T00:00:00.000000Z",
+        "instrument": _url(id_),
+        "url": f"{WATCHLISTS}{name}/{id_}/",
+        "watchlist": f"{WATCHLISTS}{name}/",
+    }
+
+
+def _page(results, next_=None):
+    return {"next": next_, "previous": None, "results": results}
+
+
+@pytest.fixture
+def wm_adap():
+    from pyrh.models import WatchlistManager
+
+    wm = WatchlistManager(username="user@example.com", password="some password")
+    adapter = requests_mock.Adapter()
+    wm.session.mount("https://", adapter)
+
+    adapter.register_uri(
+        "GET",
+        WATCHLISTS,
+        json=_page(
+            [
+                {"name": "Default", "url": f"{WATCHLISTS}Default/"},
+                {"name": "Tech", "url": f"{WATCHLISTS}Tech/"},
+            ]
+        ),
+    )
+    adapter.register_uri(
+        "GET",
+        f"{WATCHLISTS}Default/",
+        json=_page(
+            [_item("Default", INSTRUMENT_IDS[0])],
+            next_=f"{WATCHLISTS}Default/?cursor=2",
+        ),
+    )
+    adapter.register_uri(
+        "GET",
+        f"{WATCHLISTS}Default/?cursor=2",
+        json=_page([_item("Default", INSTRUMENT_IDS[1])]),
+    )
+    adapter.register_uri(
+        "GET",
+        f"{WATCHLISTS}Tech/",
+        json=_page(
+            [_item("Tech", INSTRUMENT_IDS[1]), _item("Tech", INSTRUMENT_IDS[2])]
+        ),
+    )
+    adapter.register_uri(
+        "GET",
+        "https://api.robinhood.com/instruments/",
+        json=_page(
+            [
+                {"id": id_, "symbol": symbol, "url": _url(id_)}
+                for id_, symbol in zip(INSTRUMENT_IDS, ["AAPL", "TSLA", "MSFT"])
+            ]
+        ),
+    )
+
+    return wm, adapter
+
+
+def test_watchlists(wm_adap):
+    wm, _ = wm_adap
+
+    assert [w.name for w in wm.watchlists()] == ["Default", "Tech"]
+
+
+def test_watchlist_items(wm_adap):
+    wm, adapter = wm_adap
+
+    items = wm.watchlist_items("Default")
+    assert [i.instrument_data.symbol for i in items] == ["AAPL", "TSLA"]
+
+    unhydrated = wm.watchlist_items("Tech", hydrate=False)
+    assert len(unhydrated) == 2
+    assert not hasattr(unhydrated[0], "instrument_data")
+
+
+def test_all_watchlist_items(wm_adap):
+    wm, adapter = wm_adap
+
+    items = wm.all_watchlist_items()
+
+    assert {
+        name: [i.instrument_data.symbol for i in group] for name, group in items.items()
+    } == {"Default": ["AAPL", "TSLA"], "Tech": ["TSLA", "MSFT"]}
+    # watchlists, two first pages, one second page and one instrument request
+    assert adapter.call_count == 5
+    assert items["Default"][1].instrument_data is items["Tech"][0].instrument_data